@@ -1764,13 +1764,27 @@ class Ecli:
                 self._exit_in_progress = False  # Reset the flag.
                 return
 
-        # 4. Signal Main Loop to Terminate
+        # 4. Wait for File Browser Copy/Delete
+        # Exiting mid-operation would leave a half-copied or half-deleted tree,
+        # so the user chooses between waiting for it and not exiting yet.
+        pending = FileBrowserPanel.pending_fs_operation()
+        if pending is not None:
+            ans = self.prompt(f"{pending} still running. Wait and exit? (y/n): ")
+            if not (ans and ans.lower().startswith("y")):
+                self._set_status_message("Exit cancelled: file operation running.")
+                logging.info("User cancelled exit during a file operation.")
+                self._exit_in_progress = False  # Reset the flag.
+                return
+            logging.info("Waiting for the file operation before exiting.")
+            FileBrowserPanel.wait_for_fs_operation()
+
+        # 5. Signal Main Loop to Terminate
         # This is the correct way to exit the application. The `run` loop will see
         # this flag and break, allowing `curses.wrapper` to clean up.
         self.running = False
         logging.info("Main loop stop signaled. The application will exit cleanly.")
 
-        # 5. Shut Down Background Services
+        # 6. Shut Down Background Services
         # Stop any running threads before the program fully exits.
         logging.info("Shutting down background services...")
         if hasattr(self, "_auto_save_stop_event"):
@@ -8924,7 +8938,8 @@ class Ecli:
         1.  It begins by polling all asynchronous queues (`_process_all_queues`)
             for results from background tasks like Git operations, shell commands,
             or AI requests.
-        2.  Next, it reads a key press from the terminal using the KeyBinder.
+        2.  Next, it reads a key press from the terminal using the KeyBinder,
+            together with any keys already queued behind it.
         3.  Crucially, it provides special handling for the `curses.KEY_RESIZE`
             event. This event is intercepted and handled globally by calling
             `self.handle_resize()` directly, ensuring that both the main editor
@@ -8944,45 +8959,52 @@ class Ecli:
         if self._process_all_queues():
             redraw_needed = True
 
-        # Then, attempt to read a key press from the user.
-        key_input = self.keybinder.get_key_input()
+        # Then, read a key press from the user, plus any keys already queued
+        # behind it (autorepeat, type-ahead) so they share one redraw.
+        key_batch = self.keybinder.get_key_batch()
 
-        # A worker can publish results while get_key_input() is waiting for the
+        # A worker can publish results while get_key_batch() is waiting for the
         # next key. Drain once more before dispatch so the key acts on current
         # UI-side state, e.g. Enter on a diagnostics result that just arrived.
         if self._process_all_queues():
             redraw_needed = True
 
-        # Proceed only if a valid key was received (not an error or timeout).
-        if key_input != curses.ERR and key_input != -1:
-            # Bracketed paste: insert the whole payload as one transaction and
-            # redraw once, instead of replaying it as individual keystrokes.
-            if key_input == KeyBinder.PASTE_EVENT:
-                if self._handle_paste_event(self.keybinder.last_paste):
-                    redraw_needed = True
-                return redraw_needed
-
-            # Mouse: unified dispatch path (only active when mouse is enabled).
-            if key_input == curses.KEY_MOUSE:
-                if self._handle_mouse_event():
-                    redraw_needed = True
-                return redraw_needed
-
-            # Intercept the RESIZE key at the highest level, BEFORE dispatching it
-            # to the focused component. This is a global event that affects the
-            # entire UI.
-            if key_input == curses.KEY_RESIZE:
-                # Directly call the main resize handler. It is responsible for
-                # resizing both the editor and the currently active panel.
-                if self.handle_resize():
-                    redraw_needed = True
-            elif self._handle_input_dispatch(key_input):
-                # For all other keys, use the standard dispatching logic, which respects
-                # the current focus (either the editor or a panel).
+        for index, key_input in enumerate(key_batch):
+            # Keys queued behind a quit are dropped with the editor.
+            if index and not self.running:
+                break
+            if self._process_key_input(key_input):
                 redraw_needed = True
 
         return redraw_needed
 
+    def _process_key_input(self, key_input: int | str) -> bool:
+        """Route one key from the input batch; True if a redraw is needed."""
+        # Proceed only if a valid key was received (not an error or timeout).
+        if key_input == curses.ERR or key_input == -1:
+            return False
+
+        # Bracketed paste: insert the whole payload as one transaction and
+        # redraw once, instead of replaying it as individual keystrokes.
+        if key_input == KeyBinder.PASTE_EVENT:
+            return bool(self._handle_paste_event(self.keybinder.last_paste))
+
+        # Mouse: unified dispatch path (only active when mouse is enabled).
+        if key_input == curses.KEY_MOUSE:
+            return bool(self._handle_mouse_event())
+
+        # Intercept the RESIZE key at the highest level, BEFORE dispatching it
+        # to the focused component. This is a global event that affects the
+        # entire UI.
+        if key_input == curses.KEY_RESIZE:
+            # Directly call the main resize handler. It is responsible for
+            # resizing both the editor and the currently active panel.
+            return bool(self.handle_resize())
+
+        # For all other keys, use the standard dispatching logic, which respects
+        # the current focus (either the editor or a panel).
+        return bool(self._handle_input_dispatch(key_input))
+
     def _handle_input_dispatch(self, key_input: Any) -> bool:
         """Dispatches a key press to the correct handler (panel or editor).
 
@@ -44,9 +44,13 @@ default and user-defined keybindings.
 """
 
 import curses
+import functools
 import logging
 import re
-from typing import TYPE_CHECKING, Any, Callable, Optional
+import sys
+from bisect import bisect_left
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional
 
 from wcwidth import wcswidth
 
@@ -58,6 +62,327 @@ if TYPE_CHECKING:
     from ecli.core.Ecli import Ecli
 
 
+# curses constants and helpers used on every keypress, bound once at import so
+# the input loop does not pay a module attribute lookup per read.
+_KEY_ERR = curses.ERR
+_KEY_UP = curses.KEY_UP
+_KEY_DOWN = curses.KEY_DOWN
+_KEY_LEFT = curses.KEY_LEFT
+_KEY_RIGHT = curses.KEY_RIGHT
+_KEY_RESIZE = curses.KEY_RESIZE
+_KEY_ENTER = curses.KEY_ENTER
+_ungetch = curses.ungetch
+
+# Bytes that cannot belong to a CSI/SS3 sequence; deleted with bytes.translate
+# by the tolerant fallback in get_key_input before a second lookup.
+_ESC_SEQUENCE_BYTES = frozenset(
+    b"[O0123456789;~ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+)
+_ESC_NOISE_BYTES = bytes(b for b in range(256) if b not in _ESC_SEQUENCE_BYTES)
+
+# Display width of single characters typed outside printable ASCII; wcswidth
+# walks Unicode range tables, and typed text repeats the same few characters.
+_wcswidth_cached = functools.lru_cache(maxsize=4096)(wcswidth)
+
+# Bound check used to skip building debug-only log arguments (e.g. type names).
+_log_debug_enabled = functools.partial(
+    logging.getLogger().isEnabledFor, logging.DEBUG
+)
+
+# getch() timeout of the main loop (ms); mirrors Ecli.run's stdscr.timeout().
+_INPUT_POLL_MS = 35
+
+# Key codes below this bound (ASCII plus the curses KEY_* range) dispatch
+# through a flat list indexed by the code; anything else falls back to a dict.
+_INT_TABLE_LIMIT = 4096
+
+# Distinct unknown escape sequences remembered for log de-duplication; the
+# set is cleared when full so terminal probe floods cannot grow it unbounded.
+_UNKNOWN_ESC_LOG_LIMIT = 64
+
+# Alt/Meta chord names for ESC + one byte, indexed by byte value (bytes read
+# after ESC are 0..255, so every Alt chord is a single table load).
+# Non-printable slots are None so the caller falls through to the slow path.
+_ALT_KEY_TABLE: tuple[Optional[str], ...] = tuple(
+    sys.intern(f"alt-{chr(c).lower()}") if chr(c).isprintable() else None
+    for c in range(256)
+)
+
+
+def _binding_sort_key(key: int | str) -> tuple[bool, int | str]:
+    """Total order over mixed int/str bindings: codes first, then key names."""
+    return (type(key) is str, key)
+
+
+def _sorted_bindings(keys: list[int | str]) -> tuple[tuple[bool, int | str], ...]:
+    """Return the (validated) bindings of one action as a sorted probe tuple."""
+    return tuple(sorted({_binding_sort_key(k) for k in keys}))
+
+
+def _bindings_contain(
+    sorted_keys: tuple[tuple[bool, int | str], ...], key: int | str
+) -> bool:
+    """Binary-search ``key`` in a tuple built by ``_sorted_bindings``."""
+    key_type = type(key)
+    if key_type is not int and key_type is not str:
+        return False
+    probe = (key_type is str, key)
+    index = bisect_left(sorted_keys, probe)
+    return index < len(sorted_keys) and sorted_keys[index] == probe
+
+
+# Modifier vocabulary for key specs such as "ctrl+alt+shift+s". A spec (with
+# spaces already removed) is tokenized in one regex pass into a modifier
+# bitmask and the base key name.
+_MOD_CTRL = 1
+_MOD_ALT = 2
+_MOD_SHIFT = 4
+_KEYSPEC_RE = re.compile(r"((?:(?:ctrl|alt|shift)\+)*)(.+)")
+
+# Ctrl + punctuation → control code (Ctrl+# is reported as 51 by terminals).
+_CTRL_PUNCT: Mapping[str, int] = MappingProxyType(
+    {"#": 51, "/": 31, "\\": 28, "[": 27, "]": 29}
+)
+
+
+def _tokenize_keyspec(spec: str) -> tuple[int, str]:
+    """Split a lower-cased key spec into ``(modifier_mask, base_key)``.
+
+    Unknown prefixes are not treated as modifiers; they stay part of the base
+    key so the caller reports them as an unknown key.
+    """
+    match = _KEYSPEC_RE.fullmatch(spec)
+    if match is None:
+        return 0, spec
+    modifiers, base = match.groups()
+    mask = 0
+    if modifiers:
+        if "ctrl" in modifiers:
+            mask |= _MOD_CTRL
+        if "alt" in modifiers:
+            mask |= _MOD_ALT
+        if "shift" in modifiers:
+            mask |= _MOD_SHIFT
+    return mask, base
+
+
+def _normalize_specs(spec: object) -> tuple[Any, ...]:
+    """Normalize one configured keybinding value into a tuple of key specs.
+
+    Accepts a list of specs, a ``"a|b"`` alternatives string, or a single
+    int/str spec.
+    """
+    if type(spec) is list:
+        return tuple(spec)
+    if type(spec) is str and "|" in spec:
+        return tuple(part.strip() for part in spec.split("|"))
+    return (spec,)
+
+
+def _build_escape_dfa(
+    sequences: Mapping[bytes, int | str],
+) -> tuple[tuple[dict[int, int], Optional[int | str]], ...]:
+    """Compile escape sequences (without the leading ESC) into a byte DFA.
+
+    State ``i`` is ``(transitions, terminal)``: ``transitions`` maps the next
+    byte value to the next state id and ``terminal`` is the decoded key when
+    the bytes read so far form a known sequence. State 0 is the start state.
+    """
+    transitions: list[dict[int, int]] = [{}]
+    terminals: list[Optional[int | str]] = [None]
+    for sequence, key_code in sequences.items():
+        state = 0
+        for byte in sequence:
+            next_state = transitions[state].get(byte)
+            if next_state is None:
+                next_state = len(transitions)
+                transitions[state][byte] = next_state
+                transitions.append({})
+                terminals.append(None)
+            state = next_state
+        terminals[state] = key_code
+    return tuple(zip(transitions, terminals))
+
+
+# Named keys for terminal environments, resolved from curses once at import.
+_NAMED_KEYS: Mapping[str, int] = MappingProxyType({
+    "f1": curses.KEY_F1,
+    "f2": curses.KEY_F2,
+    "f3": curses.KEY_F3,
+    "f4": curses.KEY_F4,
+    "f5": curses.KEY_F5,
+    "f6": curses.KEY_F6,
+    "f7": curses.KEY_F7,
+    "f8": curses.KEY_F8,
+    "f9": curses.KEY_F9,
+    "f10": curses.KEY_F10,
+    "f11": curses.KEY_F11,
+    "f12": curses.KEY_F12,
+    "left": curses.KEY_LEFT,
+    "right": curses.KEY_RIGHT,
+    "up": curses.KEY_UP,
+    "down": curses.KEY_DOWN,
+    "home": curses.KEY_HOME,
+    "end": getattr(curses, "KEY_END", curses.KEY_LL),
+    "pageup": curses.KEY_PPAGE,
+    "pgup": curses.KEY_PPAGE,
+    "pagedown": curses.KEY_NPAGE,
+    "pgdn": curses.KEY_NPAGE,
+    "delete": curses.KEY_DC,
+    "del": curses.KEY_DC,
+    "backspace": curses.KEY_BACKSPACE,
+    "insert": curses.KEY_IC,
+    "tab": 9,
+    "enter": curses.KEY_ENTER,
+    "return": curses.KEY_ENTER,
+    "space": ord(" "),
+    "esc": 27,
+    "escape": 27,
+    "shift+left": curses.KEY_SLEFT,
+    "sleft": curses.KEY_SLEFT,
+    "shift+right": curses.KEY_SRIGHT,
+    "sright": curses.KEY_SRIGHT,
+    "shift+up": getattr(
+        curses, "KEY_SR", getattr(curses, "KEY_SPREVIOUS", 337)
+    ),
+    "sup": getattr(curses, "KEY_SR", getattr(curses, "KEY_SPREVIOUS", 337)),
+    "shift+down": getattr(curses, "KEY_SF", getattr(curses, "KEY_SNEXT", 336)),
+    "sdown": getattr(curses, "KEY_SF", getattr(curses, "KEY_SNEXT", 336)),
+    "shift+home": curses.KEY_SHOME,
+    "shift+end": curses.KEY_SEND,
+    "shift+pageup": getattr(
+        curses, "KEY_SPPAGE", getattr(curses, "KEY_SPREVIOUS", 337)
+    ),
+    "shift+pagedown": getattr(
+        curses, "KEY_SNPAGE", getattr(curses, "KEY_SNEXT", 336)
+    ),
+    "shift+tab": getattr(curses, "KEY_BTAB", 353),
+    "/": ord("/"),
+    "?": ord("?"),
+    "\\": ord("\\"),
+})
+
+
+def _decode_keystring(key_input: str | int) -> int | str:
+    """Decodes a key specification string or integer into a key code or logical key identifier.
+
+    This function supports terminal-specific key codes, named keys, and modifier combinations
+    (Ctrl, Alt, Shift). It normalizes and parses key strings, returning either an integer
+    key code or a logical string for Alt-based bindings.
+
+    Args:
+        key_input (Union[str, int]): The key specification as a string (e.g., "ctrl+z", "alt-x")
+            or an integer key code.
+
+    Returns:
+        Union[int, str]: The resolved key code (int) or logical key identifier (str).
+
+    Raises:
+        ValueError: If the key string is invalid or contains unknown modifiers.
+    """
+    if isinstance(key_input, int):
+        return key_input
+
+    if not isinstance(key_input, str):
+        raise ValueError(
+            f"Invalid key_input type: {type(key_input)}. Expected str or int."
+        )
+
+    return _parse_key_string(key_input)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_key_string(key_input: str) -> int | str:
+    """Parse a key specification string; memoized because it is pure.
+
+    Named-key codes are fixed ``curses`` constants and the result depends only
+    on ``key_input``, so repeated specs ("alt-x", "ctrl+s") resolve with one
+    cache hit. Invalid specs raise ``ValueError`` and are not cached.
+    """
+    original_key_string = key_input
+    s = key_input.strip()
+    if not s.islower():  # specs are usually written lower-case already
+        s = s.lower()
+    if " " in s:  # "ctrl + z" → "ctrl+z", so tokenizing needs no whitespace handling
+        s = s.replace(" ", "")
+
+    if not s:
+        raise ValueError("Key string cannot be empty.")
+
+    logging.debug(
+        "_decode_keystring: Parsing key_input: %r (initial s: %r)",
+        original_key_string,
+        s,
+    )
+
+    # Already-normalized Alt chords return as-is, and specs without "+"
+    # carry no modifiers, so only real combos pay for tokenizing.
+    if s.startswith("alt-"):
+        logging.debug("_decode_keystring: Interpreted as logical Alt-binding: %r", s)
+        return sys.intern(s)
+
+    if "+" in s:
+        modifier_mask, base_key_str = _tokenize_keyspec(s)
+    else:
+        modifier_mask, base_key_str = 0, s
+
+    # Normalize alt+key to alt-key (other modifiers sorted after "alt-").
+    if modifier_mask & _MOD_ALT:
+        other_mods = "".join(
+            name
+            for bit, name in ((_MOD_CTRL, "ctrl+"), (_MOD_SHIFT, "shift+"))
+            if modifier_mask & bit
+        )
+        s = f"alt-{other_mods}{base_key_str}"
+        logging.debug(
+            "_decode_keystring: Normalized '%s' to '%s' for Alt processing.",
+            original_key_string,
+            s,
+        )
+        return sys.intern(s)
+
+    # Named-key codes are never None, so one .get() replaces "in" + index.
+    code = _NAMED_KEYS.get(s)
+    if code is not None:
+        logging.debug("_decode_keystring: Named key %r resolved to code %s", s, code)
+        return code
+
+    # Determine base key code
+    base_code: int
+    named_code = _NAMED_KEYS.get(base_key_str)
+    if named_code is not None:
+        base_code = named_code
+    elif len(base_key_str) == 1:
+        base_code = ord(base_key_str)
+    else:
+        raise ValueError(
+            f"Unknown base key '{base_key_str}' in '{original_key_string}'"
+        )
+
+    # Handle Ctrl modifier
+    if modifier_mask & _MOD_CTRL:
+        if "a" <= base_key_str <= "z" and len(base_key_str) == 1:
+            base_code = ord(base_key_str) - 0x60
+        else:
+            base_code = _CTRL_PUNCT.get(base_key_str, base_code)
+
+    # Handle Shift modifier
+    if modifier_mask & _MOD_SHIFT:
+        if (
+            "a" <= base_key_str <= "z"
+            and len(base_key_str) == 1
+            and base_code == ord(base_key_str)
+        ):
+            base_code = ord(base_key_str.upper())
+
+    logging.debug(
+        "_decode_keystring: Final resolved integer key code for '%s': %s",
+        original_key_string,
+        base_code,
+    )
+    return base_code
+
+
 # ==================== KeyBinder Class ====================
 class KeyBinder:
     """Class KeyBinder
@@ -84,49 +409,171 @@ class KeyBinder:
         _setup_action_map(): Constructs the mapping from key codes or strings to editor action methods.
         get_key_input(window): Reads a key or key sequence from the terminal, handling ESC/Alt combinations robustly.
     """
-    # Normalized escape sequences map. Keys do NOT include the leading ESC (0x1B),
-    # because get_key_input() already strips/reads after ESC.
-    ESCAPE_SEQUENCE_MAP: dict[str, str] = {
+
+    # Per-instance state is fixed; slots keep attribute loads on the keypress
+    # path specialized and drop the instance __dict__.
+    __slots__ = (
+        "editor",
+        "history",
+        "config",
+        "stdscr",
+        "_keybindings",
+        "_sorted_keys",
+        "_reverse_map",
+        "_kb_keys",
+        "_kb_slots",
+        "_kb_bounds",
+        "_kb_unknown_actions",
+        "_action_map",
+        "_action_methods_cache",
+        "_int_table",
+        "_int_dispatch",
+        "_str_dispatch",
+        "last_paste",
+        "_logged_unknown_escapes",
+        "_startup_guard_active",
+    )
+
+    # Normalized escape sequences map. Keys are the raw bytes after the leading
+    # ESC (0x1B), which get_key_input() has already consumed.
+    ESCAPE_SEQUENCE_MAP: Mapping[bytes, str] = {
         # Arrows (CSI and SS3)
-        "[A": "up", "[B": "down", "[C": "right", "[D": "left",
-        "OA": "up", "OB": "down", "OC": "right", "OD": "left",
+        b"[A": "up", b"[B": "down", b"[C": "right", b"[D": "left",
+        b"OA": "up", b"OB": "down", b"OC": "right", b"OD": "left",
 
         # xterm modifiers for arrows: ;2=Shift, ;3=Alt, ;4=Shift+Alt, ;5=Ctrl,
         # ;6=Shift+Ctrl, ;7=Alt+Ctrl, ;8=Shift+Alt+Ctrl
-        "[1;2A": "shift+up",    "[1;2B": "shift+down",
-        "[1;2C": "shift+right", "[1;2D": "shift+left",
+        b"[1;2A": "shift+up",    b"[1;2B": "shift+down",
+        b"[1;2C": "shift+right", b"[1;2D": "shift+left",
 
-        "[1;3A": "alt+up",      "[1;3B": "alt+down",
-        "[1;3C": "alt+right",   "[1;3D": "alt+left",
+        b"[1;3A": "alt+up",      b"[1;3B": "alt+down",
+        b"[1;3C": "alt+right",   b"[1;3D": "alt+left",
 
-        "[1;4A": "shift+alt+up",    "[1;4B": "shift+alt+down",
-        "[1;4C": "shift+alt+right", "[1;4D": "shift+alt+left",
+        b"[1;4A": "shift+alt+up",    b"[1;4B": "shift+alt+down",
+        b"[1;4C": "shift+alt+right", b"[1;4D": "shift+alt+left",
 
-        "[1;5A": "ctrl+up",     "[1;5B": "ctrl+down",
-        "[1;5C": "ctrl+right",  "[1;5D": "ctrl+left",
+        b"[1;5A": "ctrl+up",     b"[1;5B": "ctrl+down",
+        b"[1;5C": "ctrl+right",  b"[1;5D": "ctrl+left",
 
-        "[1;6A": "shift+ctrl+up",    "[1;6B": "shift+ctrl+down",
-        "[1;6C": "shift+ctrl+right", "[1;6D": "shift+ctrl+left",
+        b"[1;6A": "shift+ctrl+up",    b"[1;6B": "shift+ctrl+down",
+        b"[1;6C": "shift+ctrl+right", b"[1;6D": "shift+ctrl+left",
 
-        "[1;7A": "alt+ctrl+up",    "[1;7B": "alt+ctrl+down",
-        "[1;7C": "alt+ctrl+right", "[1;7D": "alt+ctrl+left",
+        b"[1;7A": "alt+ctrl+up",    b"[1;7B": "alt+ctrl+down",
+        b"[1;7C": "alt+ctrl+right", b"[1;7D": "alt+ctrl+left",
 
-        "[1;8A": "shift+alt+ctrl+up",    "[1;8B": "shift+alt+ctrl+down",
-        "[1;8C": "shift+alt+ctrl+right", "[1;8D": "shift+alt+ctrl+left",
+        b"[1;8A": "shift+alt+ctrl+up",    b"[1;8B": "shift+alt+ctrl+down",
+        b"[1;8C": "shift+alt+ctrl+right", b"[1;8D": "shift+alt+ctrl+left",
 
         # Home/End (CSI/SS3 and tilde variants)
-        "[H": "home", "[F": "end", "OH": "home", "OF": "end",
-        "[1~": "home", "[4~": "end",
+        b"[H": "home", b"[F": "end", b"OH": "home", b"OF": "end",
+        b"[1~": "home", b"[4~": "end",
 
         # Insert/Delete/PageUp/PageDown (~ style)
-        "[2~": "insert", "[3~": "delete", "[5~": "pageup", "[6~": "pagedown",
+        b"[2~": "insert", b"[3~": "delete", b"[5~": "pageup", b"[6~": "pagedown",
 
         # Function keys (SS3 and tilde variants)
-        "OP": "f1", "OQ": "f2", "OR": "f3", "OS": "f4",
-        "[11~": "f1", "[12~": "f2", "[13~": "f3", "[14~": "f4",
-        "[15~": "f5", "[17~": "f6", "[18~": "f7", "[19~": "f8",
-        "[20~": "f9", "[21~": "f10", "[23~": "f11", "[24~": "f12",
+        b"OP": "f1", b"OQ": "f2", b"OR": "f3", b"OS": "f4",
+        b"[11~": "f1", b"[12~": "f2", b"[13~": "f3", b"[14~": "f4",
+        b"[15~": "f5", b"[17~": "f6", b"[18~": "f7", b"[19~": "f8",
+        b"[20~": "f9", b"[21~": "f10", b"[23~": "f11", b"[24~": "f12",
     }
+    # Read-only, with interned key names so they match the decoder's cache and
+    # other interned key strings by identity.
+    ESCAPE_SEQUENCE_MAP = MappingProxyType(
+        {seq: sys.intern(name) for seq, name in ESCAPE_SEQUENCE_MAP.items()}
+    )
+    # Escape sequences resolved to key codes once, at class creation, so the
+    # input path never parses a key name.
+    _ESC_KEY_CODES: Mapping[bytes, int | str] = MappingProxyType(
+        {seq: _decode_keystring(name) for seq, name in ESCAPE_SEQUENCE_MAP.items()}
+    )
+    # _ESC_KEY_CODES as a byte DFA, stepped by get_key_input one getch() at a
+    # time so a known sequence resolves as soon as its last byte arrives.
+    _ESC_DFA: tuple[tuple[dict[int, int], Optional[int | str]], ...] = (
+        _build_escape_dfa(_ESC_KEY_CODES)
+    )
+
+    # Every action name _setup_action_map can resolve. Names are replaced by
+    # their slot here when keybindings are loaded, so the action-map build
+    # indexes a handler list instead of hashing strings.
+    _ACTION_NAMES: tuple[str, ...] = (
+        "open_file", "save_file", "save_as", "new_file", "copy", "cut",
+        "paste", "undo", "redo", "select_all", "delete", "quit",
+        "handle_home", "handle_end", "handle_page_up", "handle_page_down",
+        "extend_selection_up", "extend_selection_down",
+        "extend_selection_left", "extend_selection_right",
+        "select_to_home", "select_to_end", "find", "find_next",
+        "search_and_replace", "goto_line", "tab", "shift_tab",
+        "toggle_comment_block", "toggle_insert_mode",
+        "handle_up", "handle_down", "handle_left", "handle_right",
+        "handle_backspace", "handle_enter", "help", "cancel_operation",
+        "toggle_file_browser", "toggle_terminal_panel", "toggle_focus",
+        "toggle_system_doctor_panel", "git_menu", "request_ai_explanation",
+        "debug_show_lexer", "lint", "show_lint_panel", "toggle_widget_panel",
+    )  # fmt: skip
+    _ACTION_INDEX: Mapping[str, int] = MappingProxyType(
+        {name: slot for slot, name in enumerate(_ACTION_NAMES)}
+    )
+
+    # Action name → Ecli method name for the actions that are always
+    # available; _action_methods binds them once per editor mode.
+    _EDITOR_ACTION_METHODS: Mapping[str, str] = MappingProxyType({
+        # --- File and Edit Actions ---
+        "open_file": "open_file",
+        "save_file": "save_file",
+        "save_as": "save_file_as",
+        "new_file": "new_file",
+        "copy": "copy",
+        "cut": "cut",
+        "paste": "paste",
+        "select_all": "select_all",
+        "delete": "handle_delete",
+        "quit": "exit_editor",
+        # --- Navigation and Text Manipulation ---
+        "handle_home": "handle_home",
+        "handle_end": "handle_end",
+        "handle_page_up": "handle_page_up",
+        "handle_page_down": "handle_page_down",
+        "extend_selection_up": "extend_selection_up",
+        "extend_selection_down": "extend_selection_down",
+        "extend_selection_left": "extend_selection_left",
+        "extend_selection_right": "extend_selection_right",
+        "select_to_home": "select_to_home",
+        "select_to_end": "select_to_end",
+        "find": "find_prompt",
+        "find_next": "find_next",
+        "search_and_replace": "search_and_replace",
+        "goto_line": "goto_line",
+        "tab": "handle_smart_tab",
+        "shift_tab": "handle_smart_unindent",
+        "toggle_comment_block": "toggle_comment_block",
+        "toggle_insert_mode": "toggle_insert_mode",
+        # --- Core Handlers ---
+        "handle_up": "handle_up",
+        "handle_down": "handle_down",
+        "handle_left": "handle_left",
+        "handle_right": "handle_right",
+        "handle_backspace": "handle_backspace",
+        "handle_enter": "handle_enter",
+        "help": "show_help",
+        "cancel_operation": "handle_escape",
+        "toggle_file_browser": "toggle_file_browser",
+        "toggle_terminal_panel": "toggle_terminal_panel",
+        "toggle_focus": "toggle_focus",
+        "toggle_system_doctor_panel": "toggle_system_doctor_panel",
+        # --- Git ---
+        "git_menu": "show_git_panel",
+        # --- AI ---
+        "request_ai_explanation": "toggle_widget_panel",
+    })
+    # Actions that exist only when a linter bridge is configured.
+    _LINT_ACTION_METHODS: Mapping[str, str] = MappingProxyType({
+        "lint": "toggle_diagnostics_panel",
+        "show_lint_panel": "show_lint_panel",
+    })
+
+    # Parsed keybindings per user "keybindings" section (see _load_keybindings).
+    _parsed_cache: dict[frozenset, dict[str, tuple[int | str, ...]]] = {}
 
     def __init__(self, editor: "Ecli"):
         """Initializes the KeyBinder instance.
@@ -140,7 +587,7 @@ class KeyBinder:
             config: The editor's configuration object.
             stdscr: The editor's standard screen object.
             keybindings (dict): Dictionary of loaded keybindings.
-            action_map (dict): Mapping of actions to their corresponding methods.
+            action_map (Mapping): Read-only mapping of keys to their action methods.
         """
         logging.debug("KeyBinder initialized with editor: %s", editor)
         self.editor = editor
@@ -149,21 +596,128 @@ class KeyBinder:
         self.stdscr = editor.stdscr
 
         # State that now belongs to KeyBinder
+        self._action_methods_cache: dict[tuple[bool, bool, bool], dict[str, Callable]] = {}
         self.keybindings = self._load_keybindings()
         self.action_map = self._setup_action_map()
 
         # Bracketed-paste payload captured by get_key_input (read by the editor).
         self.last_paste: str = ""
+        # Unknown escape sequences already logged (see _read_key).
+        self._logged_unknown_escapes: set[bytes] = set()
 
         # Startup guard: the first call to get_key_input flushes any bytes that
         # were already buffered in the terminal before ECLI opened (shell output,
         # type-ahead, or residual control sequences) so they are never inserted.
         self._startup_guard_active: bool = True
 
+    @property
+    def keybindings(self) -> Mapping[str, list[int | str]]:
+        """Read-only action name → bound keys, as validated by the setter."""
+        return self._keybindings
+
+    @keybindings.setter
+    def keybindings(self, bindings: dict[str, list[int | str]]) -> None:
+        # Validate once: entries that are not int codes or key names are
+        # dropped and logged here; action names and string keys are interned
+        # so dict probes with literals and get_key_input chords hit by
+        # identity. Everything derived
+        # below iterates the validated lists without further type checks.
+        validated: dict[str, list[int | str]] = {}
+        for action_name, key_code_list in bindings.items():
+            keys: list[int | str] = []
+            for key_code in key_code_list:
+                # Bindings are primitives parsed from config, so an exact type
+                # test is enough and skips isinstance's tuple/MRO dispatch.
+                key_type = type(key_code)
+                if key_type is str:
+                    keys.append(sys.intern(key_code))
+                elif key_type is int:
+                    keys.append(key_code)
+                else:
+                    logging.error(
+                        "Invalid key code '%s' for action '%s'. Skipped.",
+                        key_code,
+                        action_name,
+                    )
+            validated[sys.intern(action_name)] = keys
+        # Read-only view: rebinding goes through this setter, so the derived
+        # dispatch tables below never drift from what callers see.
+        self._keybindings = MappingProxyType(validated)
+
+        # Keep a sorted tuple per action so membership checks bisect instead
+        # of scanning the binding list on every keypress.
+        self._sorted_keys = {
+            action: _sorted_bindings(keys) for action, keys in validated.items()
+        }
+        # Key → action for lookup(); the first action binding a key wins, as
+        # it did when lookup() scanned the actions in order.
+        reverse_map: dict[int | str, str] = {}
+        for action, keys in validated.items():
+            for key in keys:
+                reverse_map.setdefault(key, action)
+        self._reverse_map = reverse_map
+        # Flat arrays: every key in one list, plus one action slot and one
+        # start offset per action run (CSR layout), so the action-map build is
+        # a linear scan of contiguous slices. Actions outside _ACTION_NAMES
+        # can never resolve to a method and are only remembered for the
+        # build warning.
+        kb_keys: list[int | str] = []
+        kb_slots: list[int] = []
+        kb_bounds: list[int] = [0]
+        unknown_actions: list[str] = []
+        action_index = self._ACTION_INDEX
+        for action_name, keys in validated.items():
+            slot = action_index.get(action_name)
+            if slot is None:
+                unknown_actions.append(action_name)
+                continue
+            kb_keys.extend(keys)
+            kb_slots.append(slot)
+            kb_bounds.append(len(kb_keys))
+        self._kb_keys = kb_keys
+        self._kb_slots = kb_slots
+        self._kb_bounds = kb_bounds
+        self._kb_unknown_actions = unknown_actions
+
+    @property
+    def action_map(self) -> Mapping[int | str, Callable[..., Any]]:
+        """Read-only key → action mapping used by ``handle_input``."""
+        return self._action_map
+
+    @action_map.setter
+    def action_map(self, mapping: Mapping[int | str, Callable[..., Any]]) -> None:
+        # Freeze the map and hoist bound ``get`` methods so each keypress
+        # resolves its handler with a single call. Int key codes and string
+        # chords live in separate dicts so each probe hashes one key type;
+        # int codes in [0, _INT_TABLE_LIMIT) are also laid out in a list so
+        # the common keypress is a plain index.
+        if not isinstance(mapping, MappingProxyType):
+            mapping = MappingProxyType(dict(mapping))
+        self._action_map = mapping
+        int_actions: dict[int, Callable[..., Any]] = {}
+        str_actions: dict[Any, Callable[..., Any]] = {}
+        for key, action in mapping.items():
+            if type(key) is int:
+                int_actions[key] = action
+            elif type(key) is str:
+                str_actions[sys.intern(key)] = action
+            else:
+                str_actions[key] = action
+        table_size = 1 + max(
+            (key for key in int_actions if 0 <= key < _INT_TABLE_LIMIT), default=-1
+        )
+        int_table: list[Optional[Callable[..., Any]]] = [None] * table_size
+        for key, action in int_actions.items():
+            if 0 <= key < table_size:
+                int_table[key] = action
+        self._int_table = int_table
+        self._int_dispatch = int_actions.get
+        self._str_dispatch = str_actions.get
+
     # Sentinel returned by get_key_input when a bracketed paste was captured.
     PASTE_EVENT = "\x00ecli-bracketed-paste\x00"
     # Bracketed-paste markers (xterm): ESC [ 200 ~  ...  ESC [ 201 ~
-    _PASTE_START = "[200~"
+    _PASTE_START = b"[200~"
     _PASTE_END = b"\x1b[201~"
 
     def _flush_startup_input_buffer(self, target: Any) -> None:
@@ -173,39 +727,43 @@ class KeyBinder:
         residual shell output, type-ahead, or control sequences present in the
         terminal input queue at startup are never replayed as user text.
         """
-        target.nodelay(True)
+        target.timeout(0)
         drained = 0
         try:
             while True:
                 ch = target.getch()
-                if ch == curses.ERR:
+                if ch == _KEY_ERR:
                     break
                 drained += 1
         finally:
-            target.nodelay(False)
+            target.timeout(_INPUT_POLL_MS)
         if drained:
             logging.debug(
                 "startup guard: discarded %d pre-existing buffered terminal byte(s)",
                 drained,
             )
 
-    def _read_bracketed_paste(self, target: Any, initial: str) -> str:
+    def _read_bracketed_paste(self, target: Any, initial: bytes) -> str:
         """Read a full bracketed-paste payload as one UTF-8 decoded string.
 
-        ``initial`` holds the bytes already read after the ``[200~`` marker
-        (each char is a raw byte in 0..255). Continues reading until the
+        ``initial`` holds the raw bytes already read after the ``[200~``
+        marker. Continues reading until the
         ``ESC [ 201 ~`` end marker, then strips it. Bytes are accumulated and
         decoded once so multi-byte UTF-8 paste content is preserved.
         """
-        data = bytearray(initial.encode("latin-1", "ignore"))
+        data = bytearray(initial)
         max_bytes = 8 * 1024 * 1024  # hard cap to avoid runaway reads
+        paste_end = self._PASTE_END
+        # Search the buffer once; after that only the tail can complete the
+        # end marker, so a large paste is not rescanned on every byte.
+        ended = paste_end in data
         try:
             target.nodelay(False)
             target.timeout(40)
             idle = 0
-            while self._PASTE_END not in data and len(data) < max_bytes:
+            while not ended and len(data) < max_bytes:
                 ch = target.getch()
-                if ch == curses.ERR:
+                if ch == _KEY_ERR:
                     idle += 1
                     if idle > 6:  # ~240ms with no data: assume the burst ended
                         break
@@ -213,13 +771,14 @@ class KeyBinder:
                 idle = 0
                 if 0 <= ch <= 255:
                     data.append(ch)
+                    ended = ch == 0x7E and data.endswith(paste_end)
                 # Wide/function-key codes inside a paste are ignored.
         finally:
             # Restore the main-loop input cadence.
             target.nodelay(True)
-            target.timeout(35)
+            target.timeout(_INPUT_POLL_MS)
 
-        payload = bytes(data).split(self._PASTE_END, 1)[0]
+        payload = data.split(paste_end, 1)[0]
         return payload.decode("utf-8", "replace")
 
     def _drain_text_burst(self, target: Any, first_byte: int) -> str | int | None:
@@ -237,11 +796,14 @@ class KeyBinder:
         """
         data = bytearray([first_byte])
         pushed_back: int | None = None
-        target.nodelay(True)
+        # Zero timeout: only bytes already queued belong to the burst. The
+        # main-loop cadence is restored afterwards rather than nodelay(False),
+        # which would leave the next getch() blocking with no deadline.
+        target.timeout(0)
         try:
             while True:
                 nx = target.getch()
-                if nx == curses.ERR:
+                if nx == _KEY_ERR:
                     break
                 if 0 <= nx <= 255 and (nx >= 0x20 or nx in (0x09, 0x0A, 0x0D)):
                     data.append(nx)
@@ -249,11 +811,11 @@ class KeyBinder:
                     pushed_back = nx
                     break
         finally:
-            target.nodelay(False)
+            target.timeout(_INPUT_POLL_MS)
 
         if pushed_back is not None:
             try:
-                curses.ungetch(pushed_back)
+                _ungetch(pushed_back)
             except (curses.error, OverflowError):
                 pass
 
@@ -266,7 +828,7 @@ class KeyBinder:
         if len(data) == 1 and data[0] < 0x80:
             return None  # plain ASCII keystroke: keep exact fast-path behaviour
 
-        payload = bytes(data).decode("utf-8", "replace")
+        payload = data.decode("utf-8", "replace")
         if len(payload) >= 2 or "\n" in payload or "\r" in payload:
             self.last_paste = payload
             logging.debug("get_key_input: coalesced %d-char paste burst", len(payload))
@@ -281,7 +843,7 @@ class KeyBinder:
         Unicode code point instead of a run of Latin-1 bytes. Stops early on a
         non-continuation byte (pushed back) or when no byte arrives.
         """
-        needed = utf8_continuation_needed(bytes(data))
+        needed = utf8_continuation_needed(data)
         if not needed:
             return
         target.nodelay(False)
@@ -289,45 +851,49 @@ class KeyBinder:
         try:
             for _ in range(needed):
                 nx = target.getch()
-                if nx == curses.ERR:
+                if nx == _KEY_ERR:
                     break
                 if 0x80 <= nx <= 0xBF:
                     data.append(nx)
                     continue
                 # Not a continuation byte: it belongs to the next key — push back.
                 try:
-                    curses.ungetch(nx)
+                    _ungetch(nx)
                 except (curses.error, OverflowError):
                     pass
                 break
         finally:
             target.nodelay(True)
-            target.timeout(35)
+            target.timeout(_INPUT_POLL_MS)
 
     def _handle_printable_character(self, key: str | int) -> bool:
         """Handles insertion of a printable character into the buffer."""
         char_to_insert = ""
         if isinstance(key, str) and len(key) == 1:
             # Check that this isn't a control character that should have been processed earlier.
-            # wcswidth > 0 is a good indicator that this is a visible character.
-            if wcswidth(key) > 0:
+            # wcswidth > 0 is a good indicator that this is a visible character;
+            # printable ASCII always qualifies and skips the width lookup.
+            if " " <= key <= "~" or _wcswidth_cached(key) > 0:
                 char_to_insert = key
+        elif isinstance(key, int) and 32 <= key < 0x7F:
+            char_to_insert = chr(key)  # printable ASCII, the common typing case
         elif isinstance(key, int) and 32 <= key < 1114112:
             try:
                 # Convert numeric code to character
                 char_to_insert = chr(key)
-                if wcswidth(char_to_insert) <= 0:
+                if _wcswidth_cached(char_to_insert) <= 0:
                     char_to_insert = ""  # Ignore invisible characters
             except ValueError:
-                logging.warning(f"Invalid ordinal for chr(): {key}. Cannot convert.")
+                logging.warning("Invalid ordinal for chr(): %s. Cannot convert.", key)
                 self.editor._set_status_message(f"Invalid key code: {key}")
                 return True
 
         if char_to_insert:
-            logging.debug(
-                f"handle_input: Treating '{repr(char_to_insert)}' \
-                as printable character for insertion."
-            )
+            if _log_debug_enabled():
+                logging.debug(
+                    "handle_input: Treating %r as printable character for insertion.",
+                    char_to_insert,
+                )
             return self.editor.insert_text(char_to_insert)
 
         return False
@@ -351,63 +917,79 @@ class KeyBinder:
             Exception: Any exception raised during input handling is caught, logged, and a status
                 message is set. The exception is not propagated.
         """
-        logging.debug(
-            "handle_input: Received logical key event → %r (type: %s)",
-            key,
-            type(key).__name__,
-        )
+        if _log_debug_enabled():
+            logging.debug(
+                "handle_input: Received logical key event → %r (type: %s)",
+                key,
+                type(key).__name__,
+            )
 
         original_status = self.editor.status_message
         action_caused_visual_change = False
 
-        with self.editor._state_lock:
-            try:
-                # 1 Direct key lookup (numbers or 'alt-...')
-                if key in self.action_map:
-                    action = self.action_map[key]
+        # Only action handlers run under the editor state lock; printable
+        # input goes through insert_text, which takes the lock itself.
+        try:
+            # 1 Direct key lookup (numbers or 'alt-...')
+            if type(key) is int:
+                int_table = self._int_table
+                action = (
+                    int_table[key]
+                    if 0 <= key < len(int_table)
+                    else self._int_dispatch(key)
+                )
+            else:
+                action = self._str_dispatch(key)
+            if action is not None:
+                if _log_debug_enabled():
                     logging.debug(
-                        f"handle_input: Key '{key}' found in action_map. Calling: {action.__name__}"
+                        "handle_input: Key %r found in action_map. Calling: %s",
+                        key,
+                        action.__name__,
                     )
+                with self.editor._state_lock:
                     if action():
                         action_caused_visual_change = True
 
-                # 2 Handle printable characters
-                # This branch will trigger if the key is, for example, 104 (ord('h')) or the string 'h'
-                elif self._handle_printable_character(key):
-                    action_caused_visual_change = True
+            # 2 Handle printable characters
+            # This branch will trigger if the key is, for example, 104 (ord('h')) or the string 'h'
+            elif self._handle_printable_character(key):
+                action_caused_visual_change = True
 
-                # 3 Unhandled input
-                # This branch is for unassigned control characters or non-printable codes.
-                else:
+            # 3 Unhandled input
+            # This branch is for unassigned control characters or non-printable codes.
+            else:
+                if _log_debug_enabled():
                     logging.debug(
                         "Unhandled input by primary logic: %r (type: %s)",
                         key,
                         type(key).__name__,
                     )
-                    self.editor._set_status_message(
-                        f"Ignored unhandled input: {repr(key)}"
-                    )
+                unhandled_message = f"Ignored unhandled input: {key!r}"
+                if self.editor.status_message != unhandled_message:
+                    self.editor._set_status_message(unhandled_message)
 
-                # Final check for status change
-                if self.editor.status_message != original_status:
-                    action_caused_visual_change = True
+            # Final check for status change
+            if self.editor.status_message != original_status:
+                action_caused_visual_change = True
 
-                return action_caused_visual_change
+            return action_caused_visual_change
 
-            except Exception as e_handler:
-                log_exception_to_file_handlers(
-                    "Input handler critical error. This should be investigated.",
-                    e_handler,
-                    logger_name="ecli.input",
-                )
-                self.editor._set_status_message("Input handler error. See logs.")
-                if hasattr(self.editor, "_force_full_redraw"):
-                    self.editor._force_full_redraw = True
-                return True
+        except Exception as e_handler:
+            log_exception_to_file_handlers(
+                "Input handler critical error. This should be investigated.",
+                e_handler,
+                logger_name="ecli.input",
+            )
+            self.editor._set_status_message("Input handler error. See logs.")
+            if hasattr(self.editor, "_force_full_redraw"):
+                self.editor._force_full_redraw = True
+            return True
 
     def is_key_for_action(self, key: str | int, action_name: str) -> bool:
         """Return True if key is bound to the named editor action."""
-        return key in self.keybindings.get(action_name, [])
+        sorted_keys = self._sorted_keys.get(action_name)
+        return sorted_keys is not None and _bindings_contain(sorted_keys, key)
 
     def _load_keybindings(self) -> dict[str, list[int | str]]:
         """Loads and returns the keybindings configuration for the editor.
@@ -420,7 +1002,16 @@ class KeyBinder:
             dict[str, list[int | str]]: A dictionary where each key is an action name
             (e.g., "delete", "undo"), and the value is a list of key codes or key strings
             that trigger that action.
+
+        Results are cached per process by the user ``keybindings`` section, so
+        further KeyBinder instances with the same config skip re-parsing.
         """
+        user_keybindings_config: dict[str, object] = self.config.get("keybindings", {})
+        cache_key = self._keybindings_cache_key(user_keybindings_config)
+        cached = self._parsed_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            logging.debug("Reusing parsed keybindings for unchanged configuration.")
+            return {action: list(codes) for action, codes in cached.items()}
 
         # Getting the correct key codes for TTY
         def get_backspace_code() -> list[int]:
@@ -507,7 +1098,6 @@ class KeyBinder:
             ],
         }
 
-        user_keybindings_config: dict[str, object] = self.config.get("keybindings", {})
         parsed_keybindings: dict[str, list[int | str]] = {}
 
         for action, default_value_spec in default_keybindings.items():
@@ -520,21 +1110,14 @@ class KeyBinder:
                 continue
 
             key_codes_for_action: list[int | str] = []
-            specs_to_process: list[int | str]
+            seen_codes: set[int | str] = set()  # order kept by the list
 
-            if isinstance(key_value_spec_from_config, list):
-                specs_to_process = key_value_spec_from_config  # type: ignore[assignment]
-            elif isinstance(key_value_spec_from_config, str) and "|" in key_value_spec_from_config:
-                specs_to_process = [s.strip() for s in key_value_spec_from_config.split("|")]
-            else:
-                # single item (int or str)
-                specs_to_process = [key_value_spec_from_config]  # type: ignore[list-item]
-
-            for key_spec_item in specs_to_process:
+            for key_spec_item in _normalize_specs(key_value_spec_from_config):
                 if key_spec_item == 0 or key_spec_item:  # allow 0, skip only falsy except 0
                     try:
                         key_code: int | str = self._decode_keystring(key_spec_item)  # type: ignore[arg-type]
-                        if key_code not in key_codes_for_action:
+                        if key_code not in seen_codes:
+                            seen_codes.add(key_code)
                             key_codes_for_action.append(key_code)
                     except ValueError as e:
                         logging.error(
@@ -555,7 +1138,8 @@ class KeyBinder:
                     # type: ignore[attr-defined]
                     extra_codes.append(curses.KEY_SUSPEND)  # pyright: ignore[reportAttributeAccessIssue]
                 for code in extra_codes:
-                    if code not in key_codes_for_action:
+                    if code not in seen_codes:
+                        seen_codes.add(code)
                         key_codes_for_action.append(code)
 
             if key_codes_for_action:
@@ -570,8 +1154,34 @@ class KeyBinder:
             "Loaded and parsed keybindings (action -> list of key_codes): %s",
             parsed_keybindings,
         )
+        if cache_key is not None:
+            self._parsed_cache[cache_key] = {
+                action: tuple(codes) for action, codes in parsed_keybindings.items()
+            }
         return parsed_keybindings
 
+    @staticmethod
+    def _keybindings_cache_key(user_keybindings: object) -> Optional[frozenset]:
+        """Return a hashable key for a user ``keybindings`` section, or None.
+
+        None means the section cannot be keyed (not a mapping, or it holds
+        unhashable values) and must be parsed without the cache.
+        """
+        if not isinstance(user_keybindings, dict):
+            return None
+        try:
+            return frozenset(
+                (action, tuple(spec) if isinstance(spec, list) else spec)
+                for action, spec in user_keybindings.items()
+            )
+        except TypeError:
+            return None
+
+    @classmethod
+    def clear_keybinding_cache(cls) -> None:
+        """Drop cached keybinding parses, e.g. after the configuration is reloaded."""
+        cls._parsed_cache.clear()
+
     # Additional method for TTY diagnostics
     def debug_tty_input(self, window: Optional[curses.window] = None) -> None:
         """Diagnostic method for debugging keyboard input in TTY mode.
@@ -605,219 +1215,82 @@ class KeyBinder:
                     break
 
                 # Show detailed information about the key
-                key_info = f"Key: {key!r} (type: {type(key).__name__})"
+                info_parts = [f"Key: {key!r} (type: {type(key).__name__})"]
                 if isinstance(key, int):
-                    key_info += f" decimal: {key}"
+                    info_parts.append(f"decimal: {key}")
                     if 32 <= key <= 126:
-                        key_info += f" char: '{chr(key)}'"
+                        info_parts.append(f"char: '{chr(key)}'")
                 elif isinstance(key, str):
-                    key_info += f" ord: {ord(key) if len(key) == 1 else 'N/A'}"
+                    info_parts.append(f"ord: {ord(key) if len(key) == 1 else 'N/A'}")
 
-                self.editor._set_status_message(key_info)
-                self.editor.update_screen()
+                # Key repeat yields the same report: skip the status/redraw.
+                key_info = " ".join(info_parts)
+                if self.editor.status_message != key_info:
+                    self.editor._set_status_message(key_info)
+                    self.editor.update_screen()
 
             except curses.error:
                 continue
             except Exception as e:
-                self.editor._set_status_message(f"Debug error: {e}")
+                # Cap the detail: some exception strings are very long and the
+                # status bar is a single line anyway.
+                error_detail = str(e)
+                if len(error_detail) > 50:
+                    error_detail = error_detail[:50]
+                self.editor._set_status_message("Debug error: " + error_detail)
                 break
 
         self.editor._set_status_message("TTY Debug Mode ended")
 
-    def _decode_keystring(self, key_input: str | int) -> int | str:
-        """Decodes a key specification string or integer into a key code or logical key identifier.
-
-        This method supports terminal-specific key codes, named keys, and modifier combinations
-        (Ctrl, Alt, Shift). It normalizes and parses key strings, returning either an integer
-        key code or a logical string for Alt-based bindings.
-
-        Args:
-            key_input (Union[str, int]): The key specification as a string (e.g., "ctrl+z", "alt-x")
-                or an integer key code.
+    # Pure and memoized; see the module-level _decode_keystring.
+    _decode_keystring = staticmethod(_decode_keystring)
 
-        Returns:
-            Union[int, str]: The resolved key code (int) or logical key identifier (str).
+    def _action_methods(self) -> dict[str, Callable]:
+        """Return action name → bound handler for the editor's current mode.
 
-        Raises:
-            ValueError: If the key string is invalid or contains unknown modifiers.
+        Bound methods are resolved once per combination of lightweight mode,
+        linter bridge and async engine, and reused by later rebuilds.
         """
-        if isinstance(key_input, int):
-            return key_input
-
-        if not isinstance(key_input, str):
-            raise ValueError(
-                f"Invalid key_input type: {type(key_input)}. Expected str or int."
-            )
-
-        original_key_string = key_input
-        s = key_input.strip().lower()
-
-        if not s:
-            raise ValueError("Key string cannot be empty.")
-
-        logging.debug(f"_decode_keystring: Parsing key_input: {original_key_string!r} (initial s: {s!r})")
-
-        # Normalize alt+key to alt-key
-        if "alt" in s.split("+"):
-            parts = s.split("+")
-            if "alt" in parts:
-                base_key_for_alt = parts[-1]
-                other_mods = [m for m in parts[:-1] if m != "alt"]
-                other_mods.sort()
+        editor = self.editor
+        lightweight = bool(editor.is_lightweight)
+        mode = (
+            lightweight,
+            not lightweight and bool(editor.linter_bridge),
+            not lightweight and bool(editor.async_engine),
+        )
+        cached = self._action_methods_cache.get(mode)
+        if cached is not None:
+            return cached
 
-                normalized_s_parts = ["alt-"]
-                if other_mods:
-                    normalized_s_parts.append("+".join(other_mods))
-                    normalized_s_parts.append("+")
-                normalized_s_parts.append(base_key_for_alt)
+        # One bound method per Ecli method name, so actions sharing a method
+        # share the callable and collisions can be checked by identity.
+        bound: dict[str, Callable] = {}
 
-                s = "".join(normalized_s_parts)
-                logging.debug(
-                    f"_decode_keystring: Normalized '{original_key_string}' to '{s}' for Alt processing."
-                )
+        def bind(method_name: str) -> Callable:
+            method = bound.get(method_name)
+            if method is None:
+                method = bound[method_name] = getattr(editor, method_name)
+            return method
 
-        if s.startswith("alt-"):
-            logging.debug(
-                f"_decode_keystring: Interpreted as logical Alt-binding: {s!r}"
-            )
-            return s
-
-        # Named keys map for terminal environments
-        named_keys_map: dict[str, int] = {
-            "f1": curses.KEY_F1,
-            "f2": curses.KEY_F2,
-            "f3": curses.KEY_F3,
-            "f4": curses.KEY_F4,
-            "f5": curses.KEY_F5,
-            "f6": curses.KEY_F6,
-            "f7": curses.KEY_F7,
-            "f8": curses.KEY_F8,
-            "f9": curses.KEY_F9,
-            "f10": curses.KEY_F10,
-            "f11": curses.KEY_F11,
-            "f12": curses.KEY_F12,
-            "left": curses.KEY_LEFT,
-            "right": curses.KEY_RIGHT,
-            "up": curses.KEY_UP,
-            "down": curses.KEY_DOWN,
-            "home": curses.KEY_HOME,
-            "end": getattr(curses, "KEY_END", curses.KEY_LL),
-            "pageup": curses.KEY_PPAGE,
-            "pgup": curses.KEY_PPAGE,
-            "pagedown": curses.KEY_NPAGE,
-            "pgdn": curses.KEY_NPAGE,
-            "delete": curses.KEY_DC,
-            "del": curses.KEY_DC,
-            "backspace": curses.KEY_BACKSPACE,
-            "insert": curses.KEY_IC,
-            "tab": 9,
-            "enter": curses.KEY_ENTER,
-            "return": curses.KEY_ENTER,
-            "space": ord(" "),
-            "esc": 27,
-            "escape": 27,
-            "shift+left": curses.KEY_SLEFT,
-            "sleft": curses.KEY_SLEFT,
-            "shift+right": curses.KEY_SRIGHT,
-            "sright": curses.KEY_SRIGHT,
-            "shift+up": getattr(
-                curses, "KEY_SR", getattr(curses, "KEY_SPREVIOUS", 337)
-            ),
-            "sup": getattr(curses, "KEY_SR", getattr(curses, "KEY_SPREVIOUS", 337)),
-            "shift+down": getattr(curses, "KEY_SF", getattr(curses, "KEY_SNEXT", 336)),
-            "sdown": getattr(curses, "KEY_SF", getattr(curses, "KEY_SNEXT", 336)),
-            "shift+home": curses.KEY_SHOME,
-            "shift+end": curses.KEY_SEND,
-            "shift+pageup": getattr(
-                curses, "KEY_SPPAGE", getattr(curses, "KEY_SPREVIOUS", 337)
-            ),
-            "shift+pagedown": getattr(
-                curses, "KEY_SNPAGE", getattr(curses, "KEY_SNEXT", 336)
-            ),
-            "shift+tab": getattr(curses, "KEY_BTAB", 353),
-            "/": ord("/"),
-            "?": ord("?"),
-            "\\": ord("\\"),
+        action_to_method_map: dict[str, Callable] = {
+            action: bind(method_name)
+            for action, method_name in self._EDITOR_ACTION_METHODS.items()
         }
-
-        # Add function keys F1-F12
-        named_keys_map.update(
-            {f"f{i}": getattr(curses, f"KEY_F{i}", 256 + i) for i in range(1, 13)}
+        action_to_method_map["undo"] = self.history.undo
+        action_to_method_map["redo"] = self.history.redo
+        action_to_method_map["debug_show_lexer"] = lambda: editor._set_status_message(
+            f"Current Lexer: {editor._lexer.name if editor._lexer else 'None'}"
         )
+        if mode[1]:
+            for action, method_name in self._LINT_ACTION_METHODS.items():
+                action_to_method_map[action] = bind(method_name)
+        if mode[2]:
+            action_to_method_map["toggle_widget_panel"] = bind("toggle_widget_panel")
 
-        if s in named_keys_map:
-            code = named_keys_map[s]
-            logging.debug(f"_decode_keystring: Named key {s!r} resolved to code {code}")
-            return code
-
-        # Parse modifiers
-        parts = s.split("+")
-        base_key_str = parts[-1].strip()
-        modifiers = set(p.strip() for p in parts[:-1])
-
-        if "alt" in modifiers:
-            logging.error(
-                f"_decode_keystring: 'alt' unexpectedly found in modifiers for '{s}' at a late stage."
-            )
-            modifiers.remove("alt")
-            remaining_modifiers_part = ""
-            if modifiers:
-                sorted_remaining_modifiers = sorted(list(modifiers))
-                remaining_modifiers_part = "+".join(sorted_remaining_modifiers) + "+"
-            return f"alt-{remaining_modifiers_part}{base_key_str}"
-
-        # Determine base key code
-        base_code: int
-        if base_key_str in named_keys_map:
-            base_code = named_keys_map[base_key_str]
-        elif len(base_key_str) == 1:
-            base_code = ord(base_key_str)
-        else:
-            raise ValueError(
-                f"Unknown base key '{base_key_str}' in '{original_key_string}'"
-            )
+        self._action_methods_cache[mode] = action_to_method_map
+        return action_to_method_map
 
-        # Handle Ctrl modifier
-        if "ctrl" in modifiers:
-            modifiers.remove("ctrl")
-            if "a" <= base_key_str <= "z" and len(base_key_str) == 1:
-                base_code = ord(base_key_str) - ord("a") + 1
-            elif base_key_str == "#":
-                base_code = 51  # Ctrl+#
-                logging.debug("_decode_keystring: Ctrl+# mapped to code 51")
-            elif base_key_str == "/":
-                base_code = 31  # Ctrl+/ = ASCII 31
-                logging.debug("_decode_keystring: Ctrl+/ mapped to code 31")
-            elif base_key_str == "\\":
-                base_code = 28  # Ctrl+\\ = ASCII 28
-            elif base_key_str == "[":
-                base_code = 27  # Ctrl+[ = ESC
-            elif base_key_str == "]":
-                base_code = 29  # Ctrl+]
-            elif base_key_str == "z":
-                base_code = 26  # Ctrl+Z
-
-        # Handle Shift modifier
-        if "shift" in modifiers:
-            modifiers.remove("shift")
-            if (
-                "a" <= base_key_str <= "z"
-                and len(base_key_str) == 1
-                and base_code == ord(base_key_str)
-            ):
-                base_code = ord(base_key_str.upper())
-
-        if modifiers:
-            raise ValueError(
-                f"Unknown or unhandled modifiers {list(modifiers)} in '{original_key_string}'"
-            )
-
-        logging.debug(
-            f"_decode_keystring: Final resolved integer key code for '{original_key_string}': {base_code}"
-        )
-        return base_code
-
-    def _setup_action_map(self) -> dict[int | str, Callable[..., Any]]:
+    def _setup_action_map(self) -> Mapping[int | str, Callable[..., Any]]:
         """Constructs and returns a mapping from key codes (integers or strings) to their corresponding
         editor action methods.
         This method builds a dictionary that associates key codes (used for keyboard shortcuts)
@@ -831,88 +1304,22 @@ class KeyBinder:
         missing or conflicting bindings, and returns the final mapping for use in key event handling.
 
         Returns:
-            Dict[Union[int, str], Callable[..., Any]]: A dictionary mapping key codes to their
-            corresponding editor action methods.
+            Mapping[Union[int, str], Callable[..., Any]]: A read-only mapping (MappingProxyType)
+            of key codes to their corresponding editor action methods.
         """
         logging.debug("Setting up action map for KeyBinder.")
-        # This dictionary maps action names (from config) to the actual methods
-        # on the Ecli instance.
-        action_to_method_map: dict[str, Callable] = {
-            # --- File and Edit Actions (Always available) ---
-            "open_file": self.editor.open_file,
-            "save_file": self.editor.save_file,
-            "save_as": self.editor.save_file_as,
-            "new_file": self.editor.new_file,
-            "copy": self.editor.copy,
-            "cut": self.editor.cut,
-            "paste": self.editor.paste,
-            "undo": self.history.undo,
-            "redo": self.history.redo,
-            "select_all": self.editor.select_all,
-            "delete": self.editor.handle_delete,
-            "quit": self.editor.exit_editor,
-            # --- Navigation and Text Manipulation (Always available) ---
-            "handle_home": self.editor.handle_home,
-            "handle_end": self.editor.handle_end,
-            "handle_page_up": self.editor.handle_page_up,
-            "handle_page_down": self.editor.handle_page_down,
-            "extend_selection_up": self.editor.extend_selection_up,
-            "extend_selection_down": self.editor.extend_selection_down,
-            "extend_selection_left": self.editor.extend_selection_left,
-            "extend_selection_right": self.editor.extend_selection_right,
-            "select_to_home": self.editor.select_to_home,
-            "select_to_end": self.editor.select_to_end,
-            "find": self.editor.find_prompt,
-            "find_next": self.editor.find_next,
-            "search_and_replace": self.editor.search_and_replace,
-            "goto_line": self.editor.goto_line,
-            "tab": self.editor.handle_smart_tab,
-            "shift_tab": self.editor.handle_smart_unindent,
-            "toggle_comment_block": self.editor.toggle_comment_block,
-            "toggle_insert_mode": self.editor.toggle_insert_mode,
-            # --- Core Handlers (Always available) ---
-            "handle_up": self.editor.handle_up,
-            "handle_down": self.editor.handle_down,
-            "handle_left": self.editor.handle_left,
-            "handle_right": self.editor.handle_right,
-            "handle_backspace": self.editor.handle_backspace,
-            "handle_enter": self.editor.handle_enter,
-            "help": self.editor.show_help,
-            "cancel_operation": self.editor.handle_escape,
-            "toggle_file_browser": self.editor.toggle_file_browser,
-            "toggle_terminal_panel": self.editor.toggle_terminal_panel,
-            "toggle_focus": self.editor.toggle_focus,
-            "toggle_system_doctor_panel": self.editor.toggle_system_doctor_panel,
-            # --- Git ---
-            "git_menu": self.editor.show_git_panel,
-            # --- AI ---
-            "request_ai_explanation": self.editor.toggle_widget_panel,
-            # --- Debugging (Always available) ---
-            "debug_show_lexer": lambda: self.editor._set_status_message(
-                f"Current Lexer: {self.editor._lexer.name if self.editor._lexer else 'None'}"
-            ),
-        }
-
-        if not self.editor.is_lightweight:
-            if self.editor.linter_bridge:
-                action_to_method_map["lint"] = self.editor.toggle_diagnostics_panel
-                action_to_method_map["show_lint_panel"] = self.editor.show_lint_panel
-
-            if self.editor.async_engine:
-                action_to_method_map["toggle_widget_panel"] = (
-                    self.editor.toggle_widget_panel
-                )
+        action_to_method_map = self._action_methods()
 
         final_key_action_map: dict[int | str, Callable] = {}
 
         # --- Built-in key handlers for TTY/curses compatibility ---
         builtin_curses_key_handlers: dict[int, Callable] = {
-            curses.KEY_UP: action_to_method_map["handle_up"],
-            curses.KEY_DOWN: action_to_method_map["handle_down"],
-            curses.KEY_LEFT: action_to_method_map["handle_left"],
-            curses.KEY_RIGHT: action_to_method_map["handle_right"],
-            curses.KEY_RESIZE: self.editor.handle_resize,
-            curses.KEY_ENTER: action_to_method_map["handle_enter"],
+            _KEY_UP: action_to_method_map["handle_up"],
+            _KEY_DOWN: action_to_method_map["handle_down"],
+            _KEY_LEFT: action_to_method_map["handle_left"],
+            _KEY_RIGHT: action_to_method_map["handle_right"],
+            _KEY_RESIZE: self.editor.handle_resize,
+            _KEY_ENTER: action_to_method_map["handle_enter"],
             10: action_to_method_map["handle_enter"],  # LF
             13: action_to_method_map["handle_enter"],  # CR
         }
@@ -921,39 +1328,51 @@ class KeyBinder:
             final_key_action_map[key_code] = method_callable
 
         # --- Map keybindings from config and defaults ---
-        for action_name, key_code_list in self.keybindings.items():
-            method_callable = action_to_method_map.get(action_name)
+        # It's normal for some actions to be unavailable in lightweight mode,
+        # so we only log a warning if in full-featured mode.
+        warn_missing = not self.editor.is_lightweight
+        if warn_missing:
+            for action_name in self._kb_unknown_actions:
+                logging.warning(
+                    "Action '%s' in keybindings but no corresponding method. Ignored.",
+                    action_name,
+                )
+
+        # Handlers indexed by action slot. Each action's keys are one slice:
+        # collisions are found with a single set intersection and the common
+        # case is a bulk update rather than one store per key.
+        handlers = [action_to_method_map.get(name) for name in self._ACTION_NAMES]
+        kb_keys = self._kb_keys
+        kb_bounds = self._kb_bounds
+        for slot, start, end in zip(self._kb_slots, kb_bounds, kb_bounds[1:]):
+            method_callable = handlers[slot]
             if not method_callable:
-                # It's normal for some actions to be unavailable in lightweight mode,
-                # so we only log a warning if in full-featured mode.
-                if not self.editor.is_lightweight:
+                if warn_missing:
                     logging.warning(
-                        f"Action '{action_name}' in keybindings but no corresponding method. Ignored."
+                        "Action '%s' in keybindings but no corresponding method. Ignored.",
+                        self._ACTION_NAMES[slot],
                     )
                 continue
 
-            for key_code in key_code_list:
-                if not isinstance(key_code, (int, str)):
-                    logging.error(
-                        f"Invalid key code '{key_code}' for action '{action_name}'. Skipped."
-                    )
-                    continue
-
-                if (
-                    key_code in final_key_action_map
-                    and final_key_action_map[key_code].__name__
-                    != method_callable.__name__
-                ):
+            run = kb_keys[start:end]
+            for key_code in final_key_action_map.keys() & run:
+                if final_key_action_map[key_code] is not method_callable:
                     logging.warning(
-                        f"Keybinding for action '{action_name}' (key: {key_code}) is overwriting "
-                        f"an existing mapping for method '{final_key_action_map[key_code].__name__}'."
+                        "Keybinding for action '%s' (key: %s) is overwriting "
+                        "an existing mapping for method '%s'.",
+                        self._ACTION_NAMES[slot],
+                        key_code,
+                        final_key_action_map[key_code].__name__,
                     )
-                final_key_action_map[key_code] = method_callable
+            final_key_action_map.update(dict.fromkeys(run, method_callable))
 
         # Log the final map for debugging.
-        final_map_log_str = {k: v.__name__ for k, v in final_key_action_map.items()}
-        logging.debug(f"Final constructed action map: {final_map_log_str}")
-        return final_key_action_map
+        if _log_debug_enabled():
+            final_map_log_str = {
+                k: v.__name__ for k, v in final_key_action_map.items()
+            }
+            logging.debug("Final constructed action map: %s", final_map_log_str)
+        return MappingProxyType(final_key_action_map)
 
     def get_key_input(self, window: Optional[curses.window] = None) -> int | str:
         """Read a single key or key sequence from the terminal with robust ESC parsing:
@@ -969,7 +1388,6 @@ class KeyBinder:
             - curses.ERR for curses-related errors,
             - -1 for unexpected exceptions.
         """
-        logging.debug("get_key_input: waiting for terminal input")
         target = window or self.stdscr
 
         try:
@@ -979,88 +1397,170 @@ class KeyBinder:
             if self._startup_guard_active:
                 self._startup_guard_active = False
                 self._flush_startup_input_buffer(target)
-                return curses.ERR
-
-            ch = target.getch()
-            if ch != 27:
-                # Fast path. If this is a text byte and more text is already
-                # buffered, it is almost certainly a paste burst (works even when
-                # the terminal does not support bracketed paste): drain it and
-                # route the whole run through the single paste transaction.
-                if 0x20 <= ch <= 0xFF or ch in (0x09, 0x0A, 0x0D):
-                    drained = self._drain_text_burst(target, ch)
-                    if drained is not None:
-                        return drained
-                return ch  # single keystroke
-
-            # ESC received: lone ESC, Alt chord, or an escape sequence
-            seq = ""
-            target.nodelay(True)
-            try:
-                while True:
-                    nx = target.getch()
-                    if nx == curses.ERR:
-                        break
-                    if 0 <= nx <= 255:
-                        seq += chr(nx)
-                    else:
-                        # Rare extended code; keep as a marker – will be stripped by regex below.
-                        seq += f"<{nx}>"
-            finally:
-                target.nodelay(False)
-
-            # Lone ESC
-            if not seq:
-                logging.debug("get_key_input: standalone ESC")
-                return 27
-
-            # Bracketed paste: ESC [ 200 ~ <payload> ESC [ 201 ~. Capture the whole
-            # payload here so it is inserted as one transaction instead of being
-            # replayed as individual keystrokes (which is slow and auto-indents).
-            if seq.startswith(self._PASTE_START):
-                self.last_paste = self._read_bracketed_paste(
-                    target, seq[len(self._PASTE_START) :]
-                )
-                logging.debug(
-                    "get_key_input: captured bracketed paste (%d chars)",
-                    len(self.last_paste),
-                )
-                return self.PASTE_EVENT
+                return _KEY_ERR
 
-            # Some terminals deliver ESC-prefixed sequences: strip any leading ESC.
-            if seq and seq[0] == "\x1b":
-                seq = seq[1:]
+            return self._read_key(target, target.getch())
 
-            # Alt chord: ESC + single printable -> "alt-<char>"
-            if len(seq) == 1 and seq.isprintable():
-                alt_key = f"alt-{seq.lower()}"
-                logging.debug("get_key_input: Alt chord -> %r", alt_key)
-                return alt_key
+        except curses.error:
+            return _KEY_ERR
+        except Exception:
+            logging.exception("get_key_input: unexpected error")
+            return -1
 
-            # Direct lookup (CSI/SS3, xterm modifiers)
-            mapped = self.ESCAPE_SEQUENCE_MAP.get(seq)
+    def get_key_batch(
+        self, window: Optional[curses.window] = None, max_batch: int = 32
+    ) -> list[int | str]:
+        """Read one key, then every further key already queued, up to ``max_batch``.
 
-            if not mapped:
-                # Tolerant cleanup: keep only tokens relevant to term sequences.
-                cleaned = "".join(re.findall(r"[\[O0-9;~A-Za-z]", seq))
-                mapped = self.ESCAPE_SEQUENCE_MAP.get(cleaned)
-                if mapped:
-                    logging.debug("get_key_input: cleaned %r -> %r -> %r", seq, cleaned, mapped)
-                    seq = cleaned
+        The first key is read by ``get_key_input`` (waiting up to the main-loop
+        timeout); later keys are taken only if their first byte is already
+        buffered, so autorepeat or type-ahead can be handled before a single
+        redraw. The batch ends after a bracketed paste, because
+        ``last_paste`` holds one payload.
 
-            if mapped:
-                code = self._decode_keystring(mapped)
-                logging.debug("get_key_input: ESC %r -> %r -> code %r", seq, mapped, code)
-                return code
+        Returns:
+            list[int | str]: At least one element; a lone ``curses.ERR`` or -1
+            means no key was read, as for ``get_key_input``.
+        """
+        target = window or self.stdscr
+        key = self.get_key_input(target)
+        keys = [key]
+        if key == _KEY_ERR or key == -1 or key == self.PASTE_EVENT:
+            return keys
+
+        # Zero timeout for the whole drain; the main-loop cadence is restored
+        # once on the way out. ESC and text decoding restore it themselves,
+        # so it is re-armed only after a byte-level key.
+        target.timeout(0)
+        try:
+            while len(keys) < max_batch:
+                ch = target.getch()
+                if ch == _KEY_ERR:
+                    break
+                key = self._read_key(target, ch)
+                keys.append(key)
+                if key == self.PASTE_EVENT:
+                    break
+                if ch <= 0xFF:
+                    target.timeout(0)
+        except curses.error:
+            pass
+        except Exception:
+            logging.exception("get_key_batch: unexpected error")
+        finally:
+            target.timeout(_INPUT_POLL_MS)
+        return keys
+
+    def _read_key(self, target: Any, ch: int) -> int | str:
+        """Decode the key that starts with byte/key code ``ch`` (see get_key_input)."""
+        if ch != 27:
+            # Fast path. If this is a text byte and more text is already
+            # buffered, it is almost certainly a paste burst (works even when
+            # the terminal does not support bracketed paste): drain it and
+            # route the whole run through the single paste transaction.
+            if 0x20 <= ch <= 0xFF or ch in (0x09, 0x0A, 0x0D):
+                drained = self._drain_text_burst(target, ch)
+                if drained is not None:
+                    return drained
+            return ch  # single keystroke
+
+        # ESC received: lone ESC, Alt chord, or an escape sequence
+        # ESC-vs-Alt timing is left to ncurses (set_escdelay at startup);
+        # here the rest of the sequence is already buffered, so read it
+        # with a zero timeout and restore the main-loop cadence after.
+        # Known sequences are matched by stepping _ESC_DFA: reading stops
+        # in an accepting state with no way out, so bytes of the next key
+        # are left in the queue.
+        esc_dfa = self._ESC_DFA
+        transitions, terminal = esc_dfa[0]
+        walked = bytearray()
+        target.timeout(0)
+        try:
+            nx = target.getch()
+            while nx != _KEY_ERR:
+                next_state = transitions.get(nx)
+                if next_state is None:
+                    break
+                walked.append(nx)
+                transitions, terminal = esc_dfa[next_state]
+                if not transitions:
+                    nx = _KEY_ERR
+                    break
+                nx = target.getch()
+            if nx == _KEY_ERR:
+                if terminal is not None:
+                    if _log_debug_enabled():
+                        logging.debug(
+                            "get_key_input: ESC %r -> code %r", walked, terminal
+                        )
+                    return terminal
+            else:
+                # Not a known sequence: collect the rest for the tolerant
+                # paths below (Alt chords, bracketed paste, cleanup).
+                # Extended key codes (> 0xFF) cannot be part of a terminal
+                # sequence and are dropped.
+                while nx != _KEY_ERR:
+                    if 0 <= nx <= 255:
+                        walked.append(nx)
+                    nx = target.getch()
+        finally:
+            target.timeout(_INPUT_POLL_MS)
+        seq = bytes(walked)
 
-            logging.warning("get_key_input: unknown escape sequence: ESC + %r", seq)
+        # Lone ESC
+        if not seq:
+            logging.debug("get_key_input: standalone ESC")
             return 27
 
-        except curses.error:
-            return curses.ERR
-        except Exception:
-            logging.exception("get_key_input: unexpected error")
-            return -1
+        # Bracketed paste: ESC [ 200 ~ <payload> ESC [ 201 ~. Capture the whole
+        # payload here so it is inserted as one transaction instead of being
+        # replayed as individual keystrokes (which is slow and auto-indents).
+        if seq.startswith(self._PASTE_START):
+            self.last_paste = self._read_bracketed_paste(
+                target, seq[len(self._PASTE_START) :]
+            )
+            logging.debug(
+                "get_key_input: captured bracketed paste (%d chars)",
+                len(self.last_paste),
+            )
+            return self.PASTE_EVENT
+
+        # Some terminals deliver ESC-prefixed sequences: strip any leading ESC.
+        if seq[0] == 0x1B:
+            seq = seq[1:]
+
+        # Alt chord: ESC + single printable -> "alt-<char>"
+        if len(seq) == 1:
+            alt_key = _ALT_KEY_TABLE[seq[0]]
+            if alt_key is not None:
+                if _log_debug_enabled():
+                    logging.debug("get_key_input: Alt chord -> %r", alt_key)
+                return alt_key
+
+        # Direct lookup (CSI/SS3, xterm modifiers)
+        code = self._ESC_KEY_CODES.get(seq)
+
+        if code is None:
+            # Tolerant cleanup: keep only tokens relevant to term sequences.
+            cleaned = seq.translate(None, _ESC_NOISE_BYTES)
+            code = self._ESC_KEY_CODES.get(cleaned)
+            if code is not None:
+                logging.debug("get_key_input: cleaned %r -> %r -> code %r", seq, cleaned, code)
+                seq = cleaned
+
+        if code is not None:
+            logging.debug("get_key_input: ESC %r -> code %r", seq, code)
+            return code
+
+        # Terminal replies (device attributes, focus and cursor reports) land
+        # here and can repeat on every focus change: log each one once.
+        logged = self._logged_unknown_escapes
+        if seq not in logged:
+            if len(logged) >= _UNKNOWN_ESC_LOG_LIMIT:
+                logged.clear()
+            logged.add(seq)
+            logging.debug("get_key_input: unknown escape sequence: ESC + %r", seq)
+        return 27
 
     def lookup(self, key_spec: str | int) -> Optional[str]:
         """Finds the action name associated with a given key specification.
@@ -1080,8 +1580,7 @@ class KeyBinder:
             return None  # Invalid key string
 
         # Look up the action associated with this decoded key
-        for action_name, key_list in self.keybindings.items():
-            if decoded_key in key_list:
-                return action_name
-
-        return None
+        key_type = type(decoded_key)
+        if key_type is not int and key_type is not str:
+            return None
+        return self._reverse_map.get(decoded_key)
@@ -100,7 +100,10 @@ class PanelManager:
 
     def is_panel_active(self) -> bool:
         """Checks if a panel is currently active and visible."""
-        return self.active_panel is not None and self.active_panel.visible
+        # Read live rather than cached: panels hide themselves via close()
+        # without going through the manager.
+        panel = self.active_panel
+        return panel is not None and panel.visible
 
     def show_panel(self, name: str, **kwargs: Any) -> None:
         """Creates and shows a panel in non-blocking mode.
@@ -114,14 +117,13 @@ class PanelManager:
             logging.error(msg)
             return
 
-        # Toggle behavior: if the requested panel is already active, close it.
-        if self.is_panel_active() and isinstance(self.active_panel, PanelCls):
-            self.close_active_panel()
-            return
-
-        # If another, different panel is active, close it before opening the new one.
         if self.is_panel_active():
+            # Toggle behavior: if the requested panel is already active, close it.
+            # If another, different panel is active, close it before opening the new one.
+            toggled_off = isinstance(self.active_panel, PanelCls)
             self.close_active_panel()
+            if toggled_off:
+                return
 
         try:
             # Create an instance of the requested panel.
@@ -167,6 +169,9 @@ class PanelManager:
 
     def close_active_panel(self) -> None:
         """Force-closes the currently active panel and returns focus to the editor."""
+        if self.active_panel is None and self.editor.focus == "editor":
+            # Nothing is shown and focus is already home: skip the full repaint.
+            return
         if self.active_panel:
             logging.info("Closing panel: %s", self.active_panel.__class__.__name__)
             try:
@@ -185,10 +190,11 @@ class PanelManager:
         """Passes a key to the active panel if it's in focus.
         Returns True if the panel consumed the event.
         """
-        if self.is_panel_active():
+        panel = self.active_panel
+        if panel is not None and panel.visible:
             try:
                 # The panel itself decides if it can handle the key.
-                return self.active_panel.handle_key(key)
+                return panel.handle_key(key)
             except Exception as exc:
                 log_exception_to_file_handlers(
                     "Panel key-handler crashed",
@@ -204,8 +210,10 @@ class PanelManager:
         """Calls the draw method of the active panel.
         This is called by the main editor loop on every refresh.
         """
-        if self.is_panel_active():
-            try:
-                self.active_panel.draw()
-            except Exception:
-                logging.exception("Panel draw() crashed")
+        panel = self.active_panel
+        if panel is None or not panel.visible:
+            return
+        try:
+            panel.draw()
+        except Exception:
+            logging.exception("Panel draw() crashed")
@@ -25,6 +25,19 @@ except Exception:  # pragma: no cover
     putp = None  # type: ignore[assignment]
 
 
+# Terminfo capability strings by name; b"" records a missing capability.
+# Cleared whenever setupterm() reloads the terminal description.
+_CAPS: dict[str, bytes] = {}
+
+
+def _cap(capname: str) -> bytes:
+    """Return the terminfo string for ``capname`` (b"" if absent), cached."""
+    cap = _CAPS.get(capname)
+    if cap is None:
+        cap = _CAPS[capname] = (tigetstr(capname) if tigetstr else None) or b""
+    return cap
+
+
 class TerminalAppMode:
     """
     Put the terminal into an application-friendly state:
@@ -49,6 +62,7 @@ class TerminalAppMode:
         try:
             if setupterm:
                 setupterm()
+                _CAPS.clear()
         except Exception as e:
             logging.debug("setupterm() failed or not required: %r", e)
 
@@ -127,10 +141,10 @@ class TerminalAppMode:
 
     def _tputs(self, capname: str) -> None:
         try:
-            if tigetstr and putp:
-                s = tigetstr(capname)
+            if putp:
+                s = _cap(capname)
                 if s:
-                    putp(s.decode("ascii", "ignore"))
+                    putp(s)
         except Exception as e:
             # Non-fatal where capability is missing (FreeBSD console, etc.).
             logging.debug("tputs(%s) skipped: %r", capname, e)
@@ -49,6 +49,10 @@ import shlex
 import shutil
 import textwrap
 import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
@@ -56,6 +60,11 @@ from typing import TYPE_CHECKING, Any, Optional
 import pyperclip
 from wcwidth import wcswidth
 
+try:
+    from watchdog.observers import Observer
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    Observer = None
+
 from ecli.extensions.linters.core.display import (
     diagnostic_display_path,
     truncate_end,
@@ -68,6 +77,7 @@ from ecli.ui.geometry import centered_modal_rect, compute_layout
 from ecli.services.models.doctor import DoctorContext, DoctorFinding
 from ecli.services.models.plan import CommandPlan
 from ecli.utils.logging_config import logger
+from ecli.utils.utils import get_file_icon
 
 
 if TYPE_CHECKING:
@@ -98,6 +108,19 @@ SIDE_PANEL_KINDS: frozenset[str] = frozenset(
         "terminal",  # PySH Console Panel (F11)
     }
 )
+
+# FileBrowserPanel directory listings are reused for this many seconds while
+# the directory's mtime is unchanged; at most this many directories are kept.
+DIR_CACHE_TTL_SECONDS = 2.0
+DIR_CACHE_MAX_DIRS = 32
+# While the panel is open, the shown directory's mtime is re-checked at most
+# this often, so external changes appear without re-scanning every frame.
+DIR_RECHECK_SECONDS = 1.0
+# How long leaving a watched directory waits for its watchdog thread to exit.
+DIR_WATCH_JOIN_SECONDS = 0.5
+# Re-opening the File Browser within this many seconds of its last Git status
+# refresh reuses the cache instead of running ``git status`` again.
+GIT_REFRESH_ON_OPEN_SECONDS = 1.0
 #: Centered modal panels (Help, dialogs); not part of the side-panel split.
 MODAL_PANEL_KINDS: frozenset[str] = frozenset({"help", "confirm", "info"})
 
@@ -161,12 +184,33 @@ class BasePanel:
         self.start_y = rect.y
         self.width = rect.width
         self.height = rect.height
-        win = curses.newwin(rect.height, rect.width, rect.y, rect.x)
-        win.keypad(True)
+        win = self._reshape_window(rect.height, rect.width, rect.y, rect.x)
+        if win is None:
+            win = curses.newwin(rect.height, rect.width, rect.y, rect.x)
+            win.keypad(True)
         self.win = win
         self._make_opaque(win)
         return win
 
+    def _reshape_window(
+        self, height: int, width: int, y: int, x: int
+    ) -> Optional[CursesWindow]:
+        """Resize and move the existing window in place, if there is one.
+
+        Reusing the window on repeated resize events avoids reallocating its
+        cell buffer. Returns None when there is no window yet or curses
+        rejects the new geometry, so the caller creates a fresh one.
+        """
+        win = self.win
+        if win is None or not hasattr(win, "resize") or not hasattr(win, "mvwin"):
+            return None
+        try:
+            win.resize(height, width)
+            win.mvwin(y, x)
+        except curses.error:
+            return None
+        return win
+
     def resize(self) -> None:
         """Recalculates terminal dimensions. Must be implemented in subclasses."""
         self.term_height, self.term_width = self.stdscr.getmaxyx()
@@ -362,6 +406,26 @@ class AiResponsePanel(BasePanel):
         sel_active (bool): A flag indicating if text selection is currently active.
     """
 
+    # Cursor moves (dy, dx, extend_selection) per key, including the raw
+    # Shift+arrow codes some terminals send instead of KEY_SR/KEY_SF/...
+    _NAV_MAP: dict[int, tuple[int, int, bool]] = {
+        curses.KEY_UP: (-1, 0, False),
+        curses.KEY_DOWN: (1, 0, False),
+        curses.KEY_LEFT: (0, -1, False),
+        curses.KEY_RIGHT: (0, 1, False),
+        BasePanel.key_s_up: (-1, 0, True),
+        337: (-1, 0, True),
+        BasePanel.key_s_down: (1, 0, True),
+        336: (1, 0, True),
+        BasePanel.key_s_left: (0, -1, True),
+        393: (0, -1, True),
+        BasePanel.key_s_right: (0, 1, True),
+        402: (0, 1, True),
+    }
+
+    # Set once, process-wide, by _init_colors.
+    _colors_initialized: bool = False
+
     def __init__(
         self, stdscr: CursesWindow, main_editor_instance: Ecli, **kwargs: Any
     ) -> None:
@@ -382,7 +446,8 @@ class AiResponsePanel(BasePanel):
 
         self.title: str = kwargs.get("title", "AI Response")
         raw = kwargs.get("content", "(no data)")
-        self.lines: list[str] = raw.splitlines() or [""]
+        # Read-only: a tuple, so the caches below can key on its identity.
+        self.lines: tuple[str, ...] = tuple(raw.splitlines()) or ("",)
 
         # Side-panel geometry (right 40% work area; never overlaps global chrome).
         self.panel_kind = "ai_provider"
@@ -399,14 +464,37 @@ class AiResponsePanel(BasePanel):
         self.visible = False
         self.is_running = False
 
+        # Wrapped visual lines from the last draw, keyed by the lines tuple
+        # they were built from and the wrap width (see _wrap_lines).
+        self._wrap_cache_key: Optional[tuple[tuple[str, ...], int]] = None
+        self._wrap_cache: list[tuple[int, int, str]] = []
+        # Index of each logical line's first visual row in _wrap_cache, plus
+        # a final entry for the total, so a line's rows are a known slice.
+        self._first_visual_rows: list[int] = [0]
+        # Wrap-column width of non-ASCII lines (see _line_display_width).
+        self._linewidth_cache: dict[str, int] = {}
+        # Column-0 Markdown attribute per line (see _line_start_attrs).
+        self._line_attrs_key: Optional[tuple[str, ...]] = None
+        self._line_attrs: list[int] = []
+        # Selection bounds fixed for the duration of one draw().
+        self._sel_norm: Optional[tuple[int, int, int, int]] = None
+        self._sel_norm_frozen = False
+        # Fallback status messages from _clipboard_copy_worker threads.
+        self._clipboard_status: queue.Queue[str] = queue.Queue()
+        # True while self.win is out of date; draw() only re-renders then.
+        self._dirty = True
+
         self._init_colors()
 
     def resize(self) -> None:
         """Handle terminal resize by recalculating dimensions and recreating the window."""
         super().resize()
         self._layout_window(modal_width=72, modal_height=22)
+        self._wrap_cache_key = None
+        self._dirty = True
 
-    def _init_colors(self) -> None:
+    @classmethod
+    def _init_colors(cls) -> None:
         """Initializes curses color pairs specific to this panel.
 
         This method defines a set of color pairs for various UI elements like
@@ -414,7 +502,13 @@ class AiResponsePanel(BasePanel):
         custom color definitions and falls back to monochrome attributes
         (e.g., `curses.A_BOLD`, `curses.A_REVERSE`) if `curses.error` is raised,
         ensuring graceful degradation on terminals with limited color support.
+
+        The pairs and attributes are class-wide, so once the pairs are set up
+        later panels reuse them. The monochrome fallback is not remembered, so
+        a panel built after colours become available still gets them.
         """
+        if cls._colors_initialized:
+            return
         try:
             curses.init_pair(201, curses.COLOR_WHITE, curses.COLOR_BLACK)
             curses.init_pair(202, curses.COLOR_CYAN, curses.COLOR_BLACK)
@@ -423,21 +517,22 @@ class AiResponsePanel(BasePanel):
             curses.init_pair(
                 206, curses.COLOR_MAGENTA, curses.COLOR_BLACK
             )  # Changed BG to BLACK
-            self.attr_text = curses.color_pair(201)
-            self.attr_title = curses.color_pair(202) | curses.A_BOLD
-            self.attr_md = curses.color_pair(203) | curses.A_BOLD
-            self.attr_border = curses.color_pair(204) | curses.A_BOLD
-            self.attr_cursor = curses.color_pair(206) | curses.A_REVERSE
-            self.attr_sel = curses.color_pair(206) | curses.A_REVERSE
-            self.attr_dim = curses.color_pair(204) | curses.A_DIM
+            cls.attr_text = curses.color_pair(201)
+            cls.attr_title = curses.color_pair(202) | curses.A_BOLD
+            cls.attr_md = curses.color_pair(203) | curses.A_BOLD
+            cls.attr_border = curses.color_pair(204) | curses.A_BOLD
+            cls.attr_cursor = curses.color_pair(206) | curses.A_REVERSE
+            cls.attr_sel = curses.color_pair(206) | curses.A_REVERSE
+            cls.attr_dim = curses.color_pair(204) | curses.A_DIM
+            cls._colors_initialized = True
         except curses.error:
-            self.attr_text = curses.A_NORMAL
-            self.attr_title = curses.A_BOLD
-            self.attr_md = curses.A_BOLD
-            self.attr_border = curses.A_BOLD
-            self.attr_cursor = curses.A_REVERSE
-            self.attr_sel = curses.A_REVERSE
-            self.attr_dim = curses.A_DIM
+            cls.attr_text = curses.A_NORMAL
+            cls.attr_title = curses.A_BOLD
+            cls.attr_md = curses.A_BOLD
+            cls.attr_border = curses.A_BOLD
+            cls.attr_cursor = curses.A_REVERSE
+            cls.attr_sel = curses.A_REVERSE
+            cls.attr_dim = curses.A_DIM
 
     def open(self) -> None:
         """Makes the panel visible and sets the editor status message.
@@ -450,6 +545,7 @@ class AiResponsePanel(BasePanel):
             return
         self.visible = True
         self.is_running = True
+        self._dirty = True
         curses.curs_set(1)
         self.editor._set_status_message(
             "Panel: arrows move, Shift+arrows select, Ctrl+C copy, Ctrl+P paste, F12 focus, F7/Esc close"
@@ -484,25 +580,68 @@ class AiResponsePanel(BasePanel):
             self.stdscr.refresh()
 
     def _wrap_lines(self, wrap_width: int) -> list[tuple[int, int, str]]:
-        """Wraps long lines to fit within the panel's width.
+        """Wraps long lines at the panel's width (character-exact, not by word).
 
         Args:
             wrap_width: Maximum line length before wrapping.
 
         Returns:
             A list of tuples (original_line_index, char_offset, wrapped_text).
+            The list is cached until ``self.lines`` or the width changes and
+            must not be modified by callers.
         """
-        visual_lines = []
+        key = self._wrap_cache_key
+        if key is not None and key[0] is self.lines and key[1] == wrap_width:
+            return self._wrap_cache
+        if key is None or key[0] is not self.lines:
+            self._linewidth_cache.clear()
+
+        # Hard wraps at wrap_width columns, so every chunk's offset is its
+        # exact index in the logical line (cursor and selection rely on it).
+        visual_lines: list[tuple[int, int, str]] = []
+        append = visual_lines.append
+        first_rows: list[int] = []
         for y, line in enumerate(self.lines):
-            wrapped = textwrap.wrap(line, wrap_width) or [""]
-            offset = 0
-            for chunk in wrapped:
-                visual_lines.append((y, offset, chunk))
-                offset += len(chunk)
-            if not wrapped:
-                visual_lines.append((y, 0, ""))
+            first_rows.append(len(visual_lines))
+            if len(line) <= wrap_width and line.isascii():
+                append((y, 0, line))
+            elif line.isascii():
+                for offset in range(0, len(line), wrap_width):
+                    append((y, offset, line[offset : offset + wrap_width]))
+            elif self._line_display_width(line) <= wrap_width:
+                append((y, 0, line))
+            else:
+                # Wide characters take two columns: cut by display width.
+                start = 0
+                columns = 0
+                for x, char in enumerate(line):
+                    char_width = max(wcswidth(char), 1)
+                    if columns + char_width > wrap_width and x > start:
+                        append((y, start, line[start:x]))
+                        start = x
+                        columns = 0
+                    columns += char_width
+                append((y, start, line[start:]))
+        first_rows.append(len(visual_lines))
+        self._wrap_cache_key = (self.lines, wrap_width)
+        self._wrap_cache = visual_lines
+        self._first_visual_rows = first_rows
         return visual_lines
 
+    def _line_display_width(self, line: str) -> int:
+        """Return the columns ``line`` takes when wrapped, cached per string.
+
+        Each character counts as at least one column, matching the cut rule
+        in ``_wrap_lines``. ASCII lines never reach the width tables.
+        """
+        if line.isascii():
+            return len(line)
+        width = self._linewidth_cache.get(line)
+        if width is None:
+            width = sum(max(wcswidth(char), 1) for char in line)
+            self._linewidth_cache[line] = width
+        return width
+
     def _update_scroll_position(
         self, visual_cursor_y: int, viewport_height: int
     ) -> None:
@@ -512,9 +651,6 @@ class AiResponsePanel(BasePanel):
             visual_cursor_y: Vertical position of the cursor in wrapped text.
             viewport_height: Height of the visible area.
         """
-        if not hasattr(self, "visual_scroll"):
-            self.visual_scroll = 0
-
         # Ensure cursor is within visible area
         if visual_cursor_y < self.visual_scroll:
             self.visual_scroll = visual_cursor_y
@@ -524,21 +660,52 @@ class AiResponsePanel(BasePanel):
     def _draw_text_chunk(self, y: int, start_x: int, chunk: str, row_y: int) -> None:
         """Draws a chunk of text at the specified position with attributes.
 
+        The attribute only changes at the start of a line (Markdown markers)
+        and at selection edges, so the chunk is written as one ``addnstr``
+        per run of equal attribute rather than one ``addch`` per character.
+
         Args:
             y: Original line number.
             start_x: Starting x position in original line.
             chunk: Text to draw.
             row_y: Screen row to draw at.
         """
-        for x, char in enumerate(chunk):
-            screen_x = 1 + x
-            doc_x = start_x + x
-            attr = self._get_attr(y, doc_x, chunk)
-            if screen_x < self.width - 1:
-                try:
-                    self.win.addch(row_y, screen_x, char, attr)
-                except curses.error:
-                    pass
+        end = min(len(chunk), self.width - 2)
+        if end <= 0:
+            return
+        attr_text = self.attr_text
+        selected = self._selected_columns(y)
+        if selected is None and (
+            start_x != 0 or self._line_start_attrs()[y] == attr_text
+        ):
+            # Plain row: one attribute across the whole chunk.
+            try:
+                self.win.addnstr(row_y, 1, chunk, end, attr_text)
+            except curses.error:
+                pass
+            return
+        cuts = {0, end}
+        if start_x == 0:
+            cuts.add(1)
+        if selected is not None:
+            for col in selected:
+                if 0 < col - start_x < end:
+                    cuts.add(col - start_x)
+        bounds = sorted(cuts)
+        get_attr = self._get_attr
+        addnstr = self.win.addnstr
+        for run_start, run_end in zip(bounds, bounds[1:]):
+            attr = get_attr(y, start_x + run_start, chunk)
+            try:
+                addnstr(
+                    row_y,
+                    1 + run_start,
+                    chunk[run_start:run_end],
+                    run_end - run_start,
+                    attr,
+                )
+            except curses.error:
+                pass
 
     def _draw_cursor(self, row_y: int, cursor_x: int, chunk: str) -> None:
         """Draws the cursor at the specified position.
@@ -577,6 +744,14 @@ class AiResponsePanel(BasePanel):
         if self.height < 3 or self.width < 3:
             return
 
+        # Nothing changed since the last frame: the window still holds it,
+        # so only re-copy it over the editor.
+        if not self._dirty:
+            self._present(self.win)
+            return
+
+        self._sel_norm = self._selection_bounds()
+        self._sel_norm_frozen = True
         try:
             # Clear the panel's dedicated window for this frame.
             self.win.erase()
@@ -605,25 +780,27 @@ class AiResponsePanel(BasePanel):
             self._update_scroll_position(visual_cursor_y, viewport_height)
 
             # --- Render the visible portion of the text ---
-            # Slice the visual_lines to get only the lines that fit in the current viewport.
-            visible_lines = visual_lines[
-                self.visual_scroll : self.visual_scroll + viewport_height
-            ]
+            # Index the cached visual_lines directly; only the rows that fit
+            # in the current viewport are visited and nothing is copied.
+            first_row = self.visual_scroll
+            last_row = min(len(visual_lines), first_row + viewport_height)
 
             # Iterate over the visible lines and draw them one by one.
-            for n, (original_line_idx, char_offset, chunk) in enumerate(visible_lines):
-                # The screen row `row_y` is the loop index plus 1 (to account for the top border).
-                row_y = n + 1
+            draw_text_chunk = self._draw_text_chunk
+            for v_idx in range(first_row, last_row):
+                original_line_idx, char_offset, chunk = visual_lines[v_idx]
+                # The screen row `row_y` is the viewport index plus 1 (to account for the top border).
+                row_y = v_idx - first_row + 1
 
                 # Draw the actual text chunk for this visual line.
-                self._draw_text_chunk(original_line_idx, char_offset, chunk, row_y)
+                draw_text_chunk(original_line_idx, char_offset, chunk, row_y)
 
                 # Check if the cursor is on the current visual line being drawn.
-                is_cursor_on_this_line = (self.visual_scroll + n) == visual_cursor_y
-                if is_cursor_on_this_line:
+                if v_idx == visual_cursor_y:
                     # If so, draw the cursor on top of the character at its position.
                     self._draw_cursor(row_y, visual_cursor_x, chunk)
 
+            self._dirty = False
             # Stage the changes for the next screen update without blocking.
             self._present(self.win)
 
@@ -631,6 +808,8 @@ class AiResponsePanel(BasePanel):
             # Catch any unexpected curses errors during the draw cycle to prevent a crash.
             logging.error(f"Curses error in AiResponsePanel.draw: {e}", exc_info=True)
             pass
+        finally:
+            self._sel_norm_frozen = False
 
     def _get_visual_cursor(
         self, visual_lines: list[tuple[int, int, str]]
@@ -645,7 +824,15 @@ class AiResponsePanel(BasePanel):
             A tuple (visual_row, visual_column) representing the cursor's
             position in the `visual_lines` structure.
         """
-        for v_idx, (ly, start_x, chunk) in enumerate(visual_lines):
+        rows = range(len(visual_lines))
+        if visual_lines is self._wrap_cache and 0 <= self.cursor_y < len(
+            self._first_visual_rows
+        ) - 1:
+            # Only the cursor line's own rows can hold the cursor.
+            first_rows = self._first_visual_rows
+            rows = range(first_rows[self.cursor_y], first_rows[self.cursor_y + 1])
+        for v_idx in rows:
+            ly, start_x, chunk = visual_lines[v_idx]
             if ly == self.cursor_y:
                 chunk_len = len(chunk)
                 if start_x <= self.cursor_x < start_x + chunk_len or (
@@ -677,18 +864,35 @@ class AiResponsePanel(BasePanel):
         if in_sel:
             return self.attr_sel
 
-        lstrip = self.lines[y].lstrip() if y < len(self.lines) else ""
         if x == 0:
-            if lstrip.startswith("#"):
-                return self.attr_title
-            if lstrip.startswith("```"):
-                return self.attr_md
-            if lstrip.startswith(">"):
-                return self.attr_md
-            if lstrip.startswith("- ") or lstrip.startswith("* "):
-                return self.attr_md
+            line_attrs = self._line_start_attrs()
+            if y < len(line_attrs):
+                return line_attrs[y]
         return self.attr_text
 
+    def _line_start_attrs(self) -> list[int]:
+        """Return the column-0 attribute of every line, built once per ``self.lines``.
+
+        Markdown headers get ``attr_title``; code fences, quotes and list
+        items get ``attr_md``; everything else ``attr_text``.
+        """
+        lines = self.lines
+        if self._line_attrs_key is lines:
+            return self._line_attrs
+
+        line_attrs: list[int] = []
+        for line in lines:
+            lstrip = line.lstrip()
+            if lstrip.startswith("#"):
+                line_attrs.append(self.attr_title)
+            elif lstrip.startswith(("```", ">", "- ", "* ")):
+                line_attrs.append(self.attr_md)
+            else:
+                line_attrs.append(self.attr_text)
+        self._line_attrs_key = lines
+        self._line_attrs = line_attrs
+        return line_attrs
+
     def _handle_navigation_key(self, key: int) -> bool:
         """Handle cursor navigation keys.
 
@@ -698,26 +902,12 @@ class AiResponsePanel(BasePanel):
         Returns:
             True if the key was handled, False otherwise.
         """
-        navigation_map = {
-            curses.KEY_UP: (-1, 0, False),
-            curses.KEY_DOWN: (1, 0, False),
-            curses.KEY_LEFT: (0, -1, False),
-            curses.KEY_RIGHT: (0, 1, False),
-            self.key_s_up: (-1, 0, True),
-            337: (-1, 0, True),
-            self.key_s_down: (1, 0, True),
-            336: (1, 0, True),
-            self.key_s_left: (0, -1, True),
-            393: (0, -1, True),
-            self.key_s_right: (0, 1, True),
-            402: (0, 1, True),
-        }
-
-        if key in navigation_map:
-            dy, dx, shift = navigation_map[key]
-            self._move_cursor(dy, dx, shift)
-            return True
-        return False
+        move = self._NAV_MAP.get(key)
+        if move is None:
+            return False
+        dy, dx, shift = move
+        self._move_cursor(dy, dx, shift)
+        return True
 
     def _handle_screen_movement_key(self, key: int) -> bool:
         """Handle keys that move cursor to edges or by pages.
@@ -752,6 +942,7 @@ class AiResponsePanel(BasePanel):
         if key in (27, curses.KEY_F7):
             self.sel_active = False
             self.sel_anchor = None
+            self._dirty = True
             self.editor.panel_manager.close_active_panel()
         elif key == 3:  # Ctrl+C
             self._copy_selection()
@@ -815,6 +1006,7 @@ class AiResponsePanel(BasePanel):
                    any active selection is cancelled.
         """
         prev_y, prev_x = self.cursor_y, self.cursor_x
+        self._dirty = True
 
         self.cursor_y = max(0, min(len(self.lines) - 1, self.cursor_y + dy))
 
@@ -840,11 +1032,28 @@ class AiResponsePanel(BasePanel):
             edge: A string, either 'home' to move to the beginning (column 0)
                   or 'end' to move to the end of the line.
         """
+        self._dirty = True
         if edge == "home":
             self.cursor_x = 0
         elif edge == "end":
             self.cursor_x = len(self.lines[self.cursor_y])
 
+    def _selection_bounds(self) -> Optional[tuple[int, int, int, int]]:
+        """Return the selection as ordered ``(y0, x0, y1, x1)``, or None.
+
+        During ``draw`` the value computed at the start of the frame is
+        reused, since neither the anchor nor the cursor moves mid-frame.
+        """
+        if self._sel_norm_frozen:
+            return self._sel_norm
+        if not self.sel_active or not self.sel_anchor:
+            return None
+        y0, x0 = self.sel_anchor
+        y1, x1 = self.cursor_y, self.cursor_x
+        if (y0, x0) > (y1, x1):
+            return y1, x1, y0, x0
+        return y0, x0, y1, x1
+
     def _is_selected(self, y: int, x: int) -> bool:
         """Checks if a given coordinate (y, x) is within the active selection.
 
@@ -855,12 +1064,10 @@ class AiResponsePanel(BasePanel):
         Returns:
             True if the coordinate is part of the selection, False otherwise.
         """
-        if not self.sel_active or not self.sel_anchor:
+        bounds = self._selection_bounds()
+        if bounds is None:
             return False
-        y0, x0 = self.sel_anchor
-        y1, x1 = self.cursor_y, self.cursor_x
-        if (y0, x0) > (y1, x1):
-            y0, x0, y1, x1 = y1, x1, y0, x0
+        y0, x0, y1, x1 = bounds
 
         if y < y0 or y > y1:
             return False
@@ -872,6 +1079,24 @@ class AiResponsePanel(BasePanel):
             return x < x1
         return True
 
+    def _selected_columns(self, y: int) -> Optional[tuple[int, int]]:
+        """Return the selected column range ``[start, end)`` on line *y*, if any.
+
+        ``end`` is ``len(self.lines[y])`` when the selection continues past
+        the line; None means nothing on the line is selected.
+        """
+        bounds = self._selection_bounds()
+        if bounds is None:
+            return None
+        y0, x0, y1, x1 = bounds
+
+        if y < y0 or y > y1:
+            return None
+        line_end = len(self.lines[y]) if y < len(self.lines) else 0
+        start = x0 if y == y0 else 0
+        end = x1 if y == y1 else line_end
+        return (start, end) if start < end else None
+
     def _copy_selection(self) -> None:
         """Copies the selected text to the system and internal clipboards.
 
@@ -881,33 +1106,56 @@ class AiResponsePanel(BasePanel):
         back to the editor's internal clipboard if `pyperclip` is unavailable
         or fails.
         """
-        if self.sel_active and self.sel_anchor:
-            y0, x0 = self.sel_anchor
-            y1, x1 = self.cursor_y, self.cursor_x
-            if (y0, x0) > (y1, x1):
-                y0, x0, y1, x1 = y1, x1, y0, x0
-            selected = []
-            for y in range(y0, y1 + 1):
-                line = self.lines[y]
-                if y == y0 and y == y1:
-                    selected.append(line[x0:x1])
-                elif y == y0:
-                    selected.append(line[x0:])
-                elif y == y1:
-                    selected.append(line[:x1])
-                else:
-                    selected.append(line)
-            text = "\n".join(selected)
+        bounds = self._selection_bounds()
+        if bounds is not None:
+            y0, x0, y1, x1 = bounds
+            lines = self.lines
+            if y0 == y1:
+                text = lines[y0][x0:x1]
+            else:
+                # Only the two boundary lines are sliced; middle lines are
+                # joined as-is.
+                text = "\n".join(
+                    (lines[y0][x0:], *lines[y0 + 1 : y1], lines[y1][:x1])
+                )
         else:
             text = self.lines[self.cursor_y]
 
+        # pyperclip shells out to xclip/xsel/wl-copy, which can stall the UI
+        # thread; copy in the background and report a fallback later.
+        self.editor._set_status_message("Copied selection → system clipboard")
+        threading.Thread(
+            target=self._clipboard_copy_worker,
+            args=(text,),
+            name="AiPanelClipboardCopy",
+            daemon=True,
+        ).start()
+
+    def _clipboard_copy_worker(self, text: str) -> None:
+        """Copy *text* to the system clipboard, else to the internal one.
+
+        Runs off the UI thread. On failure the status update is queued for
+        ``process_queues`` rather than written from this thread.
+        """
         try:
-            # Try to copy to system clipboard
             pyperclip.copy(text)
-            self.editor._set_status_message("Copied selection → system clipboard")
         except Exception:
             self.editor.internal_clipboard = text
-            self.editor._set_status_message("Copied selection → internal clipboard")
+            self._clipboard_status.put("Copied selection → internal clipboard")
+
+    def process_queues(self) -> bool:
+        """Apply status messages from background clipboard copies.
+
+        Returns ``True`` when a message was shown, so the editor redraws.
+        """
+        changed = False
+        while True:
+            try:
+                message = self._clipboard_status.get_nowait()
+            except queue.Empty:
+                return changed
+            self.editor._set_status_message(message)
+            changed = True
 
     def _paste_into_editor(self) -> None:
         """Pastes text from the clipboard directly into the main editor buffer.
@@ -948,6 +1196,40 @@ class AiResponsePanel(BasePanel):
 
 
 # ==================== FileBrowserPanel Class ====================
+@dataclass(frozen=True, slots=True)
+class _BrowserEntry:
+    """One File Browser row: a directory entry or the ".." parent link.
+
+    ``is_dir`` is looked up once when the listing is scanned (symlinks are
+    not followed), so drawing and file operations never call ``is_dir()``.
+    """
+
+    name: str
+    path: str
+    is_dir: bool
+    is_parent: bool = False
+
+
+class _DirChangeHandler:
+    """watchdog event handler that only flags "the watched directory changed".
+
+    Runs on the observer thread; the File Browser picks the flag up from
+    ``process_queues`` on the UI thread. Only events that can change the
+    listing count: open/close events (e.g. the browser reading a file) and
+    events for the watched directory itself are ignored.
+    """
+
+    _LISTING_EVENTS = frozenset({"created", "deleted", "moved", "modified"})
+
+    def __init__(self, path: str, changed: threading.Event) -> None:
+        self.path = path
+        self.changed = changed
+
+    def dispatch(self, event: Any) -> None:
+        if event.event_type in self._LISTING_EVENTS and event.src_path != self.path:
+            self.changed.set()
+
+
 class FileBrowserPanel(BasePanel):
     """Class FileBrowserPanel
     =========================
@@ -971,11 +1253,38 @@ class FileBrowserPanel(BasePanel):
         width (int): The calculated width of the panel window.
         height (int): The calculated height of the panel window.
         cwd (pathlib.Path): The current working directory being displayed.
-        entries (List[Optional[os.DirEntry]]): The list of files and directories
-            in the current `cwd`. `None` represents the ".." parent entry.
+        entries (list[_BrowserEntry]): The files and directories in the current
+            `cwd`, led by a ".." entry (``is_parent``) unless `cwd` is a root.
         idx (int): The index of the currently selected item in the `entries` list.
     """
 
+    # Git status -> (marker prefix, colour key) for file rows.
+    _GIT_STATUS_STYLES: dict[str, tuple[str, str]] = {
+        "M": ("M", "git_dirty"),
+        "??": ("?", "git_info"),
+        "D": ("D", "git_deleted"),
+        "A": ("A", "git_added"),
+        "R": ("R", "function"),
+    }
+
+    # Function-key hints shown in the bottom action bar, in display order.
+    _ACTION_HINTS: tuple[tuple[str, str], ...] = (
+        ("F2", "New"),
+        ("F3", "Dir"),
+        ("F5", "Copy"),
+        ("F6", "Ren"),
+        ("Del", "Del"),
+        ("Enter", "Open"),
+        ("r", "Refresh"),
+        ("F10", "Close"),
+    )
+
+    # Copy/delete worker started by _run_fs_operation and its progress text.
+    # Kept on the class: the operation outlives a closed panel, and at most
+    # one runs at a time so the listing it changes is never edited meanwhile.
+    _fs_operation: Optional[threading.Thread] = None
+    _fs_operation_label: str = ""
+
     def __init__(
         self,
         stdscr: CursesWindow,
@@ -999,7 +1308,39 @@ class FileBrowserPanel(BasePanel):
         self.panel_kind = "file_manager"
         self._layout_window()  # right 40% work area; no global-chrome overlap
         self.cwd = Path(start_path or os.getcwd()).resolve()
-        self.entries: list[Optional[os.DirEntry]] = []
+        self.entries: list[_BrowserEntry] = []
+        # (name, size, mtime) display strings per entry, see _entry_meta_at.
+        self._row_meta: list[Optional[tuple[str, str, str]]] = []
+        # cwd -> (mtime_ns, scanned_at, entries), LRU order.
+        self._dir_cache: OrderedDict[
+            Path, tuple[int, float, list[_BrowserEntry]]
+        ] = OrderedDict()
+        self._cwd_checked_at = 0.0
+        self._git_refreshed_on_open_at = float("-inf")
+        # Optional watchdog observer on the shown directory (see _watch_cwd);
+        # while it runs, _recheck_cwd reacts to its events instead of polling.
+        self._dir_observer: Any = None
+        self._watched_dir: Optional[Path] = None
+        self._dir_changed = threading.Event()
+        # (failure label, name to select, error) from _run_fs_operation workers.
+        self._fs_results: queue.Queue[
+            tuple[str, Optional[str], Optional[Exception]]
+        ] = queue.Queue()
+        # Redraw only when something shown changed: _dirty covers listing,
+        # Git and key-driven changes; _drawn_state the cheap-to-compare rest.
+        self._dirty = True
+        self._drawn_state: Optional[tuple[bool, int, Path, int, int, int]] = None
+        # Git marker per entry for the Git cache version they were built from;
+        # None forces a rebuild (new listing or Git panel).
+        self._git_markers: list[Optional[tuple[str, int]]] = []
+        self._git_markers_version: Optional[int] = None
+        # Border title for (cwd, width), see _frame_title.
+        self._frame_title_key: Optional[tuple[Path, int]] = None
+        self._frame_title_text: Optional[str] = None
+        # Action bar hint positions for one inner width, see _action_bar_layout.
+        self._action_bar_inner: Optional[int] = None
+        self._action_bar_segments: list[tuple[int, str, str]] = []
+        self._key_table = self._build_key_table()
         self.idx = 0
         self.attr_border = self.editor.colors.get("status", curses.A_BOLD)
         self.attr_dir = self.editor.colors.get("keyword", curses.A_BOLD)
@@ -1007,17 +1348,24 @@ class FileBrowserPanel(BasePanel):
         self.attr_sel = curses.A_REVERSE | curses.A_BOLD
         self.git_panel: Optional[GitPanel] = None
         self.attr_dim = self.editor.colors.get("comment", curses.A_DIM)
+        # Resolved once: the editor initialises its colours before panels exist.
+        self._git_attr_tbl = {
+            status: (prefix, self.editor.colors.get(color_key, self.attr_dim))
+            for status, (prefix, color_key) in self._GIT_STATUS_STYLES.items()
+        }
         self._refresh_entries()
 
     def resize(self) -> None:
         """Handle terminal resize by recalculating dimensions and recreating the window."""
         super().resize()
         self._layout_window()
+        self._dirty = True
 
     def set_git_panel(self, git_panel: GitPanel) -> None:
         """Sets a link to GitPanel for integration."""
         logger.debug("Setting GitPanel for FileBrowserPanel")
         self.git_panel = git_panel
+        self._git_markers_version = None
 
     def open(self) -> None:
         """Prepare the panel for display and schedule a non-blocking Git refresh.
@@ -1031,21 +1379,171 @@ class FileBrowserPanel(BasePanel):
         worker; results are applied on a later frame by ``process_queues``.
         """
         super().open()
+        self._dirty = True
+        self._watch_cwd()
         curses.curs_set(0)
-        if self.git_panel is not None:
+        now = time.monotonic()
+        if (
+            self.git_panel is not None
+            and now - self._git_refreshed_on_open_at >= GIT_REFRESH_ON_OPEN_SECONDS
+        ):
             logger.debug("FileBrowserPanel open: scheduling async Git status refresh.")
+            self._git_refreshed_on_open_at = now
             self.git_panel.request_file_status_refresh()
 
     def process_queues(self) -> bool:
         """Drain completed async Git status refreshes (called by the main loop).
 
-        Returns ``True`` only when new Git status data was applied, so the
-        editor redraws exactly once per update instead of looping continuously
-        while the panel is open.
+        Also picks up external changes to the shown directory (see
+        ``_recheck_cwd``). Returns ``True`` only when new Git status data or a
+        new listing was applied, so the editor redraws exactly once per update
+        instead of looping continuously while the panel is open.
+        """
+        changed = self._drain_fs_results()
+        changed = self._recheck_cwd() or changed
+        if self.git_panel is not None:
+            changed = self.git_panel.drain_file_status_results() or changed
+        if changed:
+            self._dirty = True
+        return changed
+
+    def _run_fs_operation(
+        self,
+        progress: str,
+        failure_label: str,
+        operation: Any,
+        select_name: Optional[str] = None,
+    ) -> None:
+        """Run a potentially slow copy/delete off the UI thread.
+
+        The result is applied by ``_drain_fs_results`` from ``process_queues``:
+        the listing is refreshed and ``select_name`` selected, or the error is
+        reported as ``"<failure_label> failed: <error>"``.
+        """
+        self.editor._set_status_message(progress)
+
+        def worker() -> None:
+            try:
+                operation()
+            except Exception as exc:
+                self._fs_results.put((failure_label, None, exc))
+            else:
+                self._fs_results.put((failure_label, select_name, None))
+
+        # Not a daemon: interpreter exit must not cut a copy/delete short and
+        # leave a half-copied or half-deleted tree (see Ecli.exit_editor).
+        thread = threading.Thread(target=worker, name="FileBrowserFsOp")
+        FileBrowserPanel._fs_operation = thread
+        FileBrowserPanel._fs_operation_label = progress
+        thread.start()
+
+    @classmethod
+    def pending_fs_operation(cls) -> Optional[str]:
+        """Progress text of the copy/delete still running, or ``None``."""
+        operation = cls._fs_operation
+        if operation is None or not operation.is_alive():
+            return None
+        return cls._fs_operation_label
+
+    @classmethod
+    def wait_for_fs_operation(cls) -> None:
+        """Block until the running copy/delete, if any, has finished."""
+        operation = cls._fs_operation
+        if operation is not None:
+            operation.join()
+
+    def _fs_operation_busy(self) -> bool:
+        """Report a running copy/delete on the status line; True if one runs."""
+        pending = self.pending_fs_operation()
+        if pending is None:
+            return False
+        self.editor._set_status_message(f"Busy: {pending} Wait for it to finish.")
+        return True
+
+    def _drain_fs_results(self) -> bool:
+        """Apply finished background file operations; True if any finished."""
+        changed = False
+        while True:
+            try:
+                failure_label, select_name, error = self._fs_results.get_nowait()
+            except queue.Empty:
+                return changed
+            changed = True
+            if error is not None:
+                self.editor._set_status_message(f"{failure_label} failed: {error}")
+                continue
+            self._refresh_entries(force=True)
+            if select_name:
+                self._select_by_name(select_name)
+            self.editor._set_status_message(f"{failure_label} finished")
+
+    def _recheck_cwd(self) -> bool:
+        """Re-list the shown directory if it changed on disk since its scan.
+
+        With a watchdog observer running this costs nothing until it reports
+        a change; otherwise it costs one ``stat`` per ``DIR_RECHECK_SECONDS``.
+        The selection stays on the same name. Returns ``True`` when the
+        listing was refreshed.
         """
-        if self.git_panel is None:
+        if self._dir_changed.is_set():
+            self._dir_changed.clear()
+        elif self._dir_observer is not None:
             return False
-        return self.git_panel.drain_file_status_results()
+        else:
+            now = time.monotonic()
+            if now - self._cwd_checked_at < DIR_RECHECK_SECONDS:
+                return False
+            self._cwd_checked_at = now
+            cached = self._dir_cache.get(self.cwd)
+            if cached is None:
+                return False
+            try:
+                mtime_ns = os.stat(self.cwd).st_mtime_ns
+            except OSError:
+                return False
+            if mtime_ns == cached[0]:
+                return False
+        selected = (
+            self.entries[self.idx] if 0 <= self.idx < len(self.entries) else None
+        )
+        self._refresh_entries(force=True)
+        if selected is not None and not selected.is_parent:
+            self._select_by_name(selected.name)
+        return True
+
+    def _watch_cwd(self) -> None:
+        """Watch the shown directory with watchdog, when it is installed.
+
+        One non-recursive observer at a time, moved along with ``cwd``. If
+        watchdog is missing or the watch cannot be set up (e.g. inotify
+        limits), ``_recheck_cwd`` keeps polling the directory mtime.
+        """
+        if Observer is None or self._watched_dir == self.cwd:
+            return
+        self._stop_watching()
+        observer = Observer()
+        # Each observer flags its own Event, so a late event from a stopped
+        # observer can never trigger a re-list of the next directory.
+        changed = threading.Event()
+        try:
+            path = str(self.cwd)
+            observer.schedule(_DirChangeHandler(path, changed), path, recursive=False)
+            observer.start()
+        except Exception as e:
+            logger.debug(f"FileBrowserPanel: not watching {self.cwd}: {e}")
+            return
+        self._dir_observer = observer
+        self._dir_changed = changed
+        self._watched_dir = self.cwd
+
+    def _stop_watching(self) -> None:
+        """Stop the directory observer, if one is running, and wait for it."""
+        observer, self._dir_observer = self._dir_observer, None
+        self._watched_dir = None
+        self._dir_changed = threading.Event()
+        if observer is not None:
+            observer.stop()
+            observer.join(timeout=DIR_WATCH_JOIN_SECONDS)
 
     def close(self) -> None:
         """Cleans up the panel upon closing and restores the terminal cursor.
@@ -1054,97 +1552,78 @@ class FileBrowserPanel(BasePanel):
         (visible) for the main editor and ensures the editor's focus is correctly
         restored.
         """
+        self._stop_watching()
         super().close()
         curses.curs_set(1)
         self.editor.focus = "editor"
         if hasattr(self.editor, "_force_full_redraw"):
             self.editor._force_full_redraw = True
 
-    def _handle_navigation_keys(self, key: Any) -> bool:
-        """Handles navigation key presses (up/down/left/right).
+    def _build_key_table(self) -> dict[Any, Callable[[], Any]]:
+        """Build the flat ``key -> action`` dispatch table used by ``handle_key``.
 
-        Args:
-            key: The key event.
+        Groups are inserted lowest priority first so that, should a key ever
+        appear in two groups, the panel-level binding wins. Editor callbacks
+        are resolved here once instead of being probed on each key press; a
+        missing one leaves its keys handled as no-ops.
 
         Returns:
-            True if the key was handled, False otherwise.
+            A dict mapping every handled key code (int or str) to a bound method.
         """
-        if key in (curses.KEY_UP, ord("k")):
-            if self.entries:
-                self.idx = (self.idx - 1 + len(self.entries)) % len(self.entries)
-        elif key in (curses.KEY_DOWN, ord("j")):
-            if self.entries:
-                self.idx = (self.idx + 1) % len(self.entries)
-        elif key in (curses.KEY_LEFT, ord("h"), curses.KEY_BACKSPACE, 127):
-            self._go_parent()
-        elif key in (curses.KEY_RIGHT, ord("l"), curses.KEY_ENTER, 10, 13, "\n"):
-            self._enter_selected()
-        else:
-            return False
-        return True
+        groups: list[tuple[tuple[Any, ...], Callable[[], Any]]] = [
+            # File operations (F2-F6, Del).
+            ((curses.KEY_F2, 266), self._new_file),
+            ((curses.KEY_F3, 267), self._new_folder),
+            ((curses.KEY_F5, 269), self._copy_entry),
+            ((curses.KEY_F6, 270), self._rename_entry),
+            ((curses.KEY_DC, 330), self._delete_entry),
+            # Navigation.
+            ((curses.KEY_UP, ord("k")), self._select_previous),
+            ((curses.KEY_DOWN, ord("j")), self._select_next),
+            ((curses.KEY_LEFT, ord("h"), curses.KEY_BACKSPACE, 127), self._go_parent),
+            (
+                (curses.KEY_RIGHT, ord("l"), curses.KEY_ENTER, 10, 13, "\n"),
+                self._enter_selected,
+            ),
+            # Panel keys: exit (Ctrl+Q), close (F10, ESC, q), focus (F12), refresh.
+            (
+                (17, "\x11"),
+                getattr(self.editor, "exit_editor", None) or self._ignore_key,
+            ),
+            (
+                (curses.KEY_F10, 274, 27, ord("q")),
+                getattr(self.editor, "toggle_file_browser", None) or self.close,
+            ),
+            (
+                (getattr(curses, "KEY_F12", 276),),
+                getattr(self.editor, "toggle_focus", None) or self._ignore_key,
+            ),
+            ((ord("r"), ord("R")), self._manual_refresh),
+        ]
+        return {key: action for keys, action in groups for key in keys}
 
-    def _handle_operation_keys(self, key: Any) -> bool:
-        """Handles file operation key presses (F2-F6, Del).
+    def _select_previous(self) -> None:
+        """Move the selection up one entry, wrapping to the bottom."""
+        if self.entries:
+            self.idx = (self.idx - 1 + len(self.entries)) % len(self.entries)
 
-        Args:
-            key: The key event.
+    def _select_next(self) -> None:
+        """Move the selection down one entry, wrapping to the top."""
+        if self.entries:
+            self.idx = (self.idx + 1) % len(self.entries)
 
-        Returns:
-            True if the key was handled, False otherwise.
-        """
-        operations = {
-            (curses.KEY_F2, 266): self._new_file,
-            (curses.KEY_F3, 267): self._new_folder,
-            (curses.KEY_F5, 269): self._copy_entry,
-            (curses.KEY_F6, 270): self._rename_entry,
-            (curses.KEY_DC, 330): self._delete_entry,
-        }
-
-        for keys, operation in operations.items():
-            if key in keys:
-                operation()
-                return True
-        return False
+    def _ignore_key(self) -> None:
+        """Swallow a panel key whose editor callback is unavailable."""
 
-    def _handle_panel_keys(self, key: Any) -> bool:
-        """Handles panel-specific key presses (exit, close, focus).
+    def _manual_refresh(self) -> None:
+        """Rescan the directory and schedule a bounded, async Git status refresh.
 
-        Args:
-            key: The key event.
-
-        Returns:
-            True if the key was handled, False otherwise.
+        Never blocks the UI thread on a subprocess. Returning True from
+        ``handle_key`` already drives exactly one redraw via the main loop.
         """
-        # Handle exit (Ctrl+Q)
-        if key in (17, "\x11"):
-            if hasattr(self.editor, "exit_editor"):
-                self.editor.exit_editor()
-            return True
-
-        # Handle close panel (F10, ESC, q)
-        if key in (curses.KEY_F10, 274, 27, ord("q"), ord("\x1b")):
-            if hasattr(self.editor, "toggle_file_browser"):
-                self.editor.toggle_file_browser()
-            else:
-                self.close()
-            return True
-
-        # Handle focus toggle (F12)
-        if key == getattr(curses, "KEY_F12", 276):
-            if hasattr(self.editor, "toggle_focus"):
-                self.editor.toggle_focus()
-            return True
-
-        # Manual refresh: rescan the directory and schedule a bounded, async
-        # Git status refresh. Never blocks the UI thread on a subprocess.
-        # Returning True already drives exactly one redraw via the main loop.
-        if key in (ord("r"), ord("R")):
-            self._refresh_entries()
-            if self.git_panel is not None:
-                self.git_panel.request_file_status_refresh()
-            return True
-
-        return False
+        self._refresh_entries(force=True)
+        if self.git_panel is not None:
+            self.git_panel.request_file_status_refresh()
 
     def handle_key(self, key: Any) -> bool:
         """Processes a single key press to navigate or perform file operations.
@@ -1164,23 +1643,23 @@ class FileBrowserPanel(BasePanel):
         """
         logging.debug(f"FileBrowserPanel.handle_key: key={key!r}")
 
-        # Try each handler in order of priority
-        return (
-            self._handle_panel_keys(key)
-            or self._handle_navigation_keys(key)
-            or self._handle_operation_keys(key)
-        )
+        action = self._key_table.get(key)
+        if action is None:
+            return False  # ignored keys change nothing, so no repaint
+        action()
+        self._dirty = True
+        return True
 
-    def _get_git_entry_info(self, entry: Optional[Path]) -> tuple[str, int]:
+    def _get_git_entry_info(self, entry: _BrowserEntry) -> tuple[str, int]:
         """Gets the Git status prefix and color attribute for a file entry.
 
         Args:
-            entry: The file entry to check. None for parent directory.
+            entry: The list entry to check. Directories and ".." get no status.
 
         Returns:
             A tuple of (prefix, attribute) for the file.
         """
-        if entry is None or entry.is_dir() or not self.git_panel:
+        if entry.is_dir or not self.git_panel:
             return " ", 0
 
         # Note: intentionally no per-entry logging here. ``draw`` calls this for
@@ -1190,18 +1669,7 @@ class FileBrowserPanel(BasePanel):
 
         if not git_status:
             return " ", 0
-
-        status_map = {
-            "M": ("M", "git_dirty"),
-            "??": ("?", "git_info"),
-            "D": ("D", "git_deleted"),
-            "A": ("A", "git_added"),
-            "R": ("R", "function"),
-        }
-
-        prefix, color_key = status_map.get(git_status, (" ", None))
-        attr = self.editor.colors.get(color_key, 0) if color_key else 0
-        return prefix, attr
+        return self._git_attr_tbl.get(git_status, (" ", 0))
 
     # --- Midnight Commander-style rendering ----------------------------
     @staticmethod
@@ -1227,36 +1695,72 @@ class FileBrowserPanel(BasePanel):
             return when.strftime("%H:%M")
         return when.strftime("%b %d")
 
-    def _is_dir(self, entry: Optional[os.DirEntry]) -> bool:
-        if entry is None:
-            return True
+    @staticmethod
+    def _scan_entry(dir_entry: os.DirEntry) -> _BrowserEntry:
+        """Build the list record for one ``os.scandir`` result."""
         try:
-            return entry.is_dir(follow_symlinks=False)
+            is_dir = dir_entry.is_dir(follow_symlinks=False)
         except OSError:
-            return False
+            is_dir = False
+        return _BrowserEntry(dir_entry.name, dir_entry.path, is_dir)
+
+    def _entry_meta_at(self, index: int) -> tuple[str, str, str]:
+        """Return ``_entry_meta`` for ``entries[index]``, formatted once per listing.
 
-    def _entry_meta(self, entry: Optional[os.DirEntry]) -> tuple[str, str, str]:
+        Rows are filled lazily, so only entries that are actually shown pay
+        for the ``stat`` and the size/time formatting.
+        """
+        meta = self._row_meta[index]
+        if meta is None:
+            meta = self._entry_meta(self.entries[index])
+            self._row_meta[index] = meta
+        return meta
+
+    def _entry_meta(self, entry: Optional[_BrowserEntry]) -> tuple[str, str, str]:
         """Return (display_name, size_str, mtime_str) for a list entry."""
-        if entry is None:
+        if entry is None or entry.is_parent:
             return ("..", "", "")
-        is_dir = self._is_dir(entry)
+        is_dir = entry.is_dir
         name = entry.name + ("/" if is_dir else "")
         try:
-            st = entry.stat(follow_symlinks=False)
+            st = os.stat(entry.path, follow_symlinks=False)
             size_str = "<DIR>" if is_dir else self._format_size(st.st_size)
             mtime_str = self._format_mtime(st.st_mtime)
         except OSError:
             size_str, mtime_str = ("<DIR>" if is_dir else "—"), "—"
         return (name, size_str, mtime_str)
 
-    def _git_marker(self, entry: Optional[os.DirEntry]) -> tuple[str, str]:
-        """Return (1-char git status marker, color_key) for an entry."""
-        prefix, _attr = self._get_git_entry_info(entry)
-        prefix = (prefix or " ")[:1]
-        key = {"M": "git_dirty", "?": "git_clean", "A": "git_clean", "D": "error"}.get(
-            prefix.strip(), "panel_dim"
-        )
-        return prefix, key
+    def _git_status_version(self) -> int:
+        return getattr(self.git_panel, "file_status_version", 0)
+
+    def _entry_git_markers(self) -> list[Optional[tuple[str, int]]]:
+        """Return the Git ``(marker, attr)`` of every entry, from one batched lookup.
+
+        Rebuilt only when the listing or the Git status cache changes;
+        directories, "..", clean and unknown-status files get ``None``.
+        """
+        entries = self.entries
+        version = self._git_status_version()
+        if self._git_markers_version == version and len(self._git_markers) == len(
+            entries
+        ):
+            return self._git_markers
+
+        markers: list[Optional[tuple[str, int]]] = [None] * len(entries)
+        if self.git_panel is not None:
+            files = [i for i, entry in enumerate(entries) if not entry.is_dir]
+            statuses = self.git_panel.get_statuses_for(
+                [entries[i].path for i in files]
+            )
+            if statuses:
+                marker_for = self._git_attr_tbl.get
+                for i in files:
+                    status = statuses.get(entries[i].path)
+                    if status:
+                        markers[i] = marker_for(status)
+        self._git_markers_version = version
+        self._git_markers = markers
+        return markers
 
     def _column_widths(self, inner: int) -> tuple[int, int, int]:
         """Return (name_w, size_w, mod_w); drops columns on narrow panels."""
@@ -1296,13 +1800,24 @@ class FileBrowserPanel(BasePanel):
         if self.height < 6 or self.width < 10:
             return
 
-        d = TuiDesign(self.editor.colors)
         is_focused = self.editor.focus == "panel"
-        inner = self.width - 2
+        state = (
+            is_focused,
+            self.idx,
+            self.cwd,
+            self.height,
+            self.width,
+            self._git_status_version(),
+        )
+        if not self._dirty and state == self._drawn_state:
+            self._present(self.win)  # unchanged: only re-copy over the editor
+            return
 
-        self.win.erase()
-        self._draw_frame(is_focused, d)
+        d = TuiDesign(self.editor.colors)
+        inner = self.width - 2
 
+        # No erase(): every interior row below is overwritten in full, rows
+        # past the listing are cleared individually and the frame is drawn last.
         name_w, size_w, mod_w = self._column_widths(inner)
         name_x, size_x = 3, 3 + name_w + 1
         mod_x = size_x + size_w + 1
@@ -1332,22 +1847,25 @@ class FileBrowserPanel(BasePanel):
         self._list_last_row = list_bottom
         self._visible_top = top
         sel_attr = d.selected(is_focused)
+        git_markers = self._entry_git_markers()
         dir_attr = d.attr("panel_accent", self.attr_dir)
         file_attr = d.attr("panel_text", self.attr_file)
         dim_attr = d.attr("panel_dim", self.attr_dim)
 
-        for n, entry in enumerate(self.entries[top : top + viewport_h]):
+        shown = self.entries[top : top + viewport_h]
+        for n, entry in enumerate(shown):
             gi = top + n
             row_y = list_top + n
             is_selected = gi == self.idx
-            is_dir = self._is_dir(entry)
-            name, size_str, mtime_str = self._entry_meta(entry)
-            gchar, gkey = self._git_marker(entry)
+            is_dir = entry.is_dir
+            name, size_str, mtime_str = self._entry_meta_at(gi)
+            marker = git_markers[gi]
+            gchar, gattr = (" ", dim_attr) if marker is None else marker
 
             row_bg = sel_attr if is_selected else file_attr
             name_attr = sel_attr if is_selected else (dir_attr if is_dir else file_attr)
             meta_attr = sel_attr if is_selected else dim_attr
-            git_attr = sel_attr if is_selected else d.attr(gkey, dim_attr)
+            git_attr = sel_attr if is_selected else gattr
             try:
                 self.win.addnstr(row_y, 1, " " * inner, inner, row_bg)  # full-row
                 self.win.addnstr(row_y, 1, gchar, 1, git_attr)
@@ -1360,9 +1878,15 @@ class FileBrowserPanel(BasePanel):
                     self.win.addnstr(row_y, mod_x, mtime_str[:mod_w], mod_w, meta_attr)
             except curses.error:
                 pass
+        for row_y in range(list_top + len(shown), list_bottom):
+            self.win.move(row_y, 1)
+            self.win.clrtoeol()  # also clears the right border, redrawn below
 
         self._draw_status_line(self.height - 2, inner, d)
         self._draw_action_bar(self.height - 1, inner, d)
+        self._draw_frame(is_focused, d)
+        self._dirty = False
+        self._drawn_state = state
         self._present(self.win)  # touchwin + noutrefresh: opaque, no ghosting
 
     def _draw_status_line(self, y: int, inner: int, d: TuiDesign) -> None:
@@ -1373,8 +1897,10 @@ class FileBrowserPanel(BasePanel):
             if self.entries and 0 <= self.idx < len(self.entries)
             else None
         )
-        name, size_str, mtime_str = self._entry_meta(entry)
-        kind = "dir" if self._is_dir(entry) else "file"
+        name, size_str, mtime_str = (
+            self._entry_meta(None) if entry is None else self._entry_meta_at(self.idx)
+        )
+        kind = "dir" if entry is None or entry.is_dir else "file"
         parts = [name.rstrip("/")]
         parts.append(kind)
         if size_str and size_str != "<DIR>":
@@ -1396,27 +1922,53 @@ class FileBrowserPanel(BasePanel):
             self.win.addnstr(y, 1, " " * inner, inner, bar)
         except curses.error:
             pass
-        hints = [
-            ("F2", "New"),
-            ("F3", "Dir"),
-            ("F5", "Copy"),
-            ("F6", "Ren"),
-            ("Del", "Del"),
-            ("Enter", "Open"),
-            ("r", "Refresh"),
-            ("F10", "Close"),
-        ]
-        x = 1
-        for k, label in hints:
-            seg = f"{k} {label} "
-            if x + wcswidth(seg) >= inner + 1:
-                break
+        for x, k, label in self._action_bar_layout(inner):
             try:
                 self.win.addnstr(y, x, k, len(k), key)
-                self.win.addnstr(y, x + len(k), f" {label} ", len(label) + 2, bar)
+                self.win.addnstr(y, x + len(k), label, len(label), bar)
             except curses.error:
                 break
-            x += wcswidth(seg)
+
+    def _action_bar_layout(self, inner: int) -> list[tuple[int, str, str]]:
+        """Return ``(x, key, " label ")`` for the hints that fit ``inner`` columns.
+
+        The hints are constant, so the layout is measured once per width.
+        """
+        if self._action_bar_inner == inner:
+            return self._action_bar_segments
+        segments: list[tuple[int, str, str]] = []
+        x = 1
+        for k, label in self._ACTION_HINTS:
+            seg = f"{k} {label} "
+            seg_w = wcswidth(seg)
+            if x + seg_w >= inner + 1:
+                break
+            segments.append((x, k, f" {label} "))
+            x += seg_w
+        self._action_bar_inner = inner
+        self._action_bar_segments = segments
+        return segments
+
+    def _frame_title(self) -> Optional[str]:
+        """Return the breadcrumb title for the border, or None if it won't fit.
+
+        Only depends on ``cwd`` and the panel width, so the ``wcswidth`` scans
+        run once per directory/size rather than on every frame.
+        """
+        key = (self.cwd, self.width)
+        if self._frame_title_key == key:
+            return self._frame_title_text
+        # Breadcrumb: shortened current directory path.
+        path = str(self.cwd)
+        max_title = max(3, self.width - 6)
+        if wcswidth(path) > max_title:
+            path = "…" + path[-(max_title - 1) :]
+        title_display: Optional[str] = f" {path} "
+        if wcswidth(title_display) > self.width - 2:
+            title_display = None
+        self._frame_title_key = key
+        self._frame_title_text = title_display
+        return title_display
 
     def _draw_frame(self, is_focused: bool, d: TuiDesign | None = None) -> None:
         """Draw the panel border with the current directory embedded as title."""
@@ -1426,17 +1978,12 @@ class FileBrowserPanel(BasePanel):
         border_attr = d.border(is_focused)
         title_attr = d.attr("panel_title", border_attr)
 
-        # Breadcrumb: shortened current directory path.
-        path = str(self.cwd)
-        max_title = max(3, self.width - 6)
-        if wcswidth(path) > max_title:
-            path = "…" + path[-(max_title - 1) :]
-        title_display = f" {path} "
+        title_display = self._frame_title()
 
         self.win.attron(border_attr)
         self.win.border()
         self.win.attroff(border_attr)
-        if wcswidth(title_display) <= self.width - 2:
+        if title_display is not None:
             try:
                 self.win.addnstr(0, 2, title_display, self.width - 4, title_attr)
             except curses.error:
@@ -1458,12 +2005,13 @@ class FileBrowserPanel(BasePanel):
             return
 
         entry = self.entries[self.idx]
-        if entry is None:
+        if entry.is_parent:
             self._go_parent()
             return
 
-        path = Path(entry.path)
-        if entry.is_dir(follow_symlinks=False):
+        # Stay on the entry's str path; a Path is only built for the new cwd.
+        path = entry.path
+        if entry.is_dir:
             try:
                 # Check access to the directory. If there are no rights,
                 # os.scandir will throw a PermissionError.
@@ -1471,21 +2019,21 @@ class FileBrowserPanel(BasePanel):
                     pass  # Don't need to iterate, just check opening
 
                 # If the check passed, change the directory
-                self.cwd = path.resolve()
+                self.cwd = Path(path).resolve()
                 self._refresh_entries()
 
             except PermissionError:
-                self.editor._set_status_message(f"Permission denied: {path.name}")
+                self.editor._set_status_message(f"Permission denied: {entry.name}")
             except Exception as e:
                 self.editor._set_status_message(f"Error entering directory: {e}")
         else:
             try:
-                self.editor.open_file(str(path))
-                self.editor._set_status_message(f"Opened file: {path.name}")
+                self.editor.open_file(path)
+                self.editor._set_status_message(f"Opened file: {entry.name}")
             except Exception as e:
                 self.editor._set_status_message(f"Error opening file: {e}")
 
-    def _refresh_entries(self) -> None:
+    def _refresh_entries(self, force: bool = False) -> None:
         """Scans the current directory and updates the list of file entries.
 
         This method populates `self.entries` with the contents of `self.cwd`.
@@ -1493,12 +2041,54 @@ class FileBrowserPanel(BasePanel):
         alphabetically. It also adds a ".." entry to navigate to the parent
         directory if applicable. Handles `PermissionError` and other exceptions
         gracefully by displaying a status message.
+
+        A listing scanned less than ``DIR_CACHE_TTL_SECONDS`` ago is reused
+        when the directory's mtime has not changed, so moving back and forth
+        between directories costs one ``stat`` instead of a full scan.
+
+        Args:
+            force: Rescan even if a cached listing is still valid. Used after
+                the panel's own file operations and for a manual refresh.
         """
         try:
-            with os.scandir(self.cwd) as it:
-                listed = sorted(it, key=lambda e: (not e.is_dir(), e.name.lower()))
-            self.entries = ([] if self.cwd.parent == self.cwd else [None]) + listed
+            mtime_ns = os.stat(self.cwd).st_mtime_ns
+            cache = self._dir_cache
+            cached = None if force else cache.get(self.cwd)
+            if (
+                cached is not None
+                and cached[0] == mtime_ns
+                and time.monotonic() - cached[1] < DIR_CACHE_TTL_SECONDS
+            ):
+                cache.move_to_end(self.cwd)
+                _, _, entries = cached
+            else:
+                # One is_dir lookup per entry, kept on its record and shared by
+                # the sort, draw and the file operations.
+                with os.scandir(self.cwd) as it:
+                    scanned = [self._scan_entry(e) for e in it]
+                # Decorate-sort-undecorate: directories first, then by lower-cased
+                # name; the index keeps ties stable and records out of compares.
+                order = sorted(
+                    (not entry.is_dir, entry.name.lower(), i)
+                    for i, entry in enumerate(scanned)
+                )
+                entries = [scanned[i] for _, _, i in order]
+                if self.cwd.parent != self.cwd:
+                    parent = _BrowserEntry(
+                        "..", str(self.cwd.parent), is_dir=True, is_parent=True
+                    )
+                    entries.insert(0, parent)
+                cache[self.cwd] = (mtime_ns, time.monotonic(), entries)
+                cache.move_to_end(self.cwd)
+                if len(cache) > DIR_CACHE_MAX_DIRS:
+                    cache.popitem(last=False)
+            self.entries = list(entries)
+            self._row_meta = [None] * len(self.entries)
             self.idx = 0
+            self._git_markers_version = None
+            self._dirty = True
+            if self.visible:
+                self._watch_cwd()
         except (PermissionError, FileNotFoundError) as e:
             self.editor._set_status_message(f"Error reading dir: {e}")
             if self.cwd.parent != self.cwd:
@@ -1536,16 +2126,34 @@ class FileBrowserPanel(BasePanel):
         box.border()
         box.addstr(0, 2, f" {message} ")
 
-        buf = list(initial)
+        buf = initial
         pos = len(buf)
+        # Only the text row is rewritten, and only after an edit; ``shown`` is
+        # the length last drawn, so a shrinking buffer clears just its old tail
+        # with one clrtoeol (the right border cell is put back afterwards).
+        changed = True
+        shown = 0
         while True:
-            box.addstr(1, 1, " " * (win_w - 2))
-            box.addstr(1, 2, "".join(buf))
+            if changed:
+                if buf:
+                    box.addnstr(1, 2, buf, win_w - 4)
+                if len(buf) < shown:
+                    box.move(1, 2 + len(buf))
+                    box.clrtoeol()
+                    box.addch(1, win_w - 1, curses.ACS_VLINE)
+                shown = len(buf)
+                changed = False
             box.move(1, 2 + pos)
-            box.refresh()
+            # Drain keys already queued (e.g. a paste) before the next refresh,
+            # so a burst costs one screen update rather than one per character.
+            box.nodelay(True)
             ch = box.getch()
+            box.nodelay(False)
+            if ch == -1:
+                box.refresh()
+                ch = box.getch()
             if ch in (10, 13):
-                txt = "".join(buf).strip()
+                txt = buf.strip()
                 curses.curs_set(0)
                 return txt or None
             if ch == 27:
@@ -1557,11 +2165,13 @@ class FileBrowserPanel(BasePanel):
                 pos = min(len(buf), pos + 1)
             elif ch in (curses.KEY_BACKSPACE, 127, 8):
                 if pos > 0:
-                    buf.pop(pos - 1)
-                pos -= 1
+                    buf = buf[: pos - 1] + buf[pos:]
+                    pos -= 1
+                    changed = True
             elif 32 <= ch < 127 and len(buf) < win_w - 4:
-                buf.insert(pos, chr(ch))
+                buf = buf[:pos] + chr(ch) + buf[pos:]
                 pos += 1
+                changed = True
 
     def _icon(self, fname: str) -> str:
         """Retrieves a file-type-specific icon for a given filename.
@@ -1576,8 +2186,6 @@ class FileBrowserPanel(BasePanel):
             A string (typically a single Unicode character) representing the icon.
         """
         try:
-            from ecli.utils.utils import get_file_icon
-
             return get_file_icon(fname, self.editor.config)
         except Exception:
             return "📄"
@@ -1613,7 +2221,7 @@ class FileBrowserPanel(BasePanel):
             name: The filename to find and select in the `self.entries` list.
         """
         for i, e in enumerate(self.entries):
-            if e and e.name == name:
+            if e.name == name:
                 self.idx = i
                 break
 
@@ -1624,7 +2232,7 @@ class FileBrowserPanel(BasePanel):
             return
         try:
             (self.cwd / name).touch(exist_ok=False)
-            self._refresh_entries()
+            self._refresh_entries(force=True)
             self._select_by_name(name)
         except Exception as e:
             self.editor._set_status_message(f"Error: {e}")
@@ -1636,7 +2244,7 @@ class FileBrowserPanel(BasePanel):
             return
         try:
             (self.cwd / name).mkdir()
-            self._refresh_entries()
+            self._refresh_entries(force=True)
             self._select_by_name(name)
         except Exception as e:
             self.editor._set_status_message(f"Error: {e}")
@@ -1647,29 +2255,29 @@ class FileBrowserPanel(BasePanel):
             return
 
         entry = self.entries[self.idx]
-        if entry is None:  # Checking the ".." entry
+        if entry.is_parent:  # Checking the ".." entry
+            return
+        if self._fs_operation_busy():
             return
 
-        # Now `entry` is definitely os.DirEntry, and access to .path and .name is safe
-        src = Path(entry.path)
+        # Now `entry` is a real file or directory in `cwd`
+        src = entry.path
         stem, ext = os.path.splitext(entry.name)
         dst_name = self._unique_name(stem, "_copy", ext)
-        dst = self.cwd / dst_name
+        dst = os.path.join(os.path.dirname(src), dst_name)
 
         # Correctly check the result of _prompt, which may return None
         response = self._prompt(f"Copy '{entry.name}' to '{dst_name}'? (y/n)")
         if not response or response.lower() != "y":
             return
 
-        try:
-            if entry.is_dir(follow_symlinks=False):
-                shutil.copytree(src, dst)
-            else:
-                shutil.copy2(src, dst)
-            self._refresh_entries()
-            self._select_by_name(dst.name)
-        except Exception as e:
-            self.editor._set_status_message(f"Copy failed: {e}")
+        copy = shutil.copytree if entry.is_dir else shutil.copy2
+        self._run_fs_operation(
+            f"Copying '{entry.name}'...",
+            "Copy",
+            lambda: copy(src, dst),
+            select_name=dst_name,
+        )
 
     def _rename_entry(self) -> None:
         """Prompts for a new name and renames the selected file or directory."""
@@ -1677,18 +2285,22 @@ class FileBrowserPanel(BasePanel):
             return
 
         entry = self.entries[self.idx]
-        if entry is None:  # Checking the ".." entry
+        if entry.is_parent:  # Checking the ".." entry
+            return
+        if self._fs_operation_busy():
             return
 
-        # Now `entry` is definitely os.DirEntry
+        # Now `entry` is a real file or directory in `cwd`
         new_name = self._prompt("Rename to:", entry.name)
         # `if not new_name` checks for both None and empty string ""
         if not new_name or new_name == entry.name:
             return
 
         try:
-            (self.cwd / entry.name).rename(self.cwd / new_name)
-            self._refresh_entries()
+            os.rename(
+                entry.path, os.path.join(os.path.dirname(entry.path), new_name)
+            )
+            self._refresh_entries(force=True)
             self._select_by_name(new_name)
         except Exception as e:
             self.editor._set_status_message(f"Rename failed: {e}")
@@ -1699,25 +2311,25 @@ class FileBrowserPanel(BasePanel):
             return
 
         entry = self.entries[self.idx]
-        if entry is None:  # Checking the ".." entry
+        if entry.is_parent:  # Checking the ".." entry
+            return
+        if self._fs_operation_busy():
             return
 
-        # Now `entry` is definitely os.DirEntry
-        path = Path(entry.path)
+        # Now `entry` is a real file or directory in `cwd`
+        path = entry.path
 
         # Correctly check the result of _prompt
-        response = self._prompt(f"DELETE '{path.name}'? (y/n)")
+        response = self._prompt(f"DELETE '{entry.name}'? (y/n)")
         if not response or response.lower() != "y":
             return
 
-        try:
-            if entry.is_dir(follow_symlinks=False):
-                shutil.rmtree(path)
-            else:
-                path.unlink()
-            self._refresh_entries()
-        except Exception as e:
-            self.editor._set_status_message(f"Delete failed: {e}")
+        remove = shutil.rmtree if entry.is_dir else os.unlink
+        self._run_fs_operation(
+            f"Deleting '{entry.name}'...",
+            "Delete",
+            lambda: remove(path),
+        )
 
 
 # ==================== Phase 1 Service Panels ====================
@@ -2807,6 +3419,9 @@ class GitPanel(BasePanel):
         self.should_stop_auto_update: threading.Event = threading.Event()
 
         self.file_status_cache: dict[str, str] = {}
+        # Bumped whenever file_status_cache changes, so views such as the
+        # File Browser can tell when their per-entry markers are stale.
+        self.file_status_version = 0
         self.watched_files: set[str] = set()
 
         # Async file-status refresh plumbing (used by the File Browser panel).
@@ -3089,6 +3704,7 @@ class GitPanel(BasePanel):
                     self._file_status_refresh_in_flight = False
                 if cache is not None and cache != self.file_status_cache:
                     self.file_status_cache = cache
+                    self.file_status_version += 1
                     changed = True
         except queue.Empty:
             pass
@@ -3127,6 +3743,7 @@ class GitPanel(BasePanel):
             del self.file_status_cache[file_path]
         if rel_path in self.file_status_cache:
             del self.file_status_cache[rel_path]
+        self.file_status_version += 1
 
     def _update_file_cache_entry(
         self, file_path: str, rel_path: str, status: str
@@ -3140,6 +3757,7 @@ class GitPanel(BasePanel):
         """
         self.file_status_cache[file_path] = status
         self.file_status_cache[rel_path] = status
+        self.file_status_version += 1
 
     def update_file_status(self, file_path: str) -> None:
         """Updates the Git status cache for a specific file after it is saved.
@@ -3225,6 +3843,7 @@ class GitPanel(BasePanel):
             return
         if cache is not None:
             self.file_status_cache = cache
+            self.file_status_version += 1
 
     def get_file_git_status(self, file_path: str) -> Optional[str]:
         """Returns the git status of a file for integration with the file manager.
@@ -3237,6 +3856,14 @@ class GitPanel(BasePanel):
         """
         return self.file_status_cache.get(file_path)
 
+    def get_statuses_for(self, file_paths: list[str]) -> dict[str, str]:
+        """Returns the git status of each of *file_paths* that has one.
+
+        One call for a whole directory listing instead of one per file.
+        """
+        cache = self.file_status_cache
+        return {path: status for path in file_paths if (status := cache.get(path))}
+
     def add_watched_file(self, file_path: str) -> None:
         """Adds a file to the list of watched files."""
         self.watched_files.add(file_path)
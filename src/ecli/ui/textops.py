@@ -89,7 +89,7 @@ def selection_to_text(
     return "\n".join(parts)
 
 
-def utf8_continuation_needed(data: bytes) -> int:
+def utf8_continuation_needed(data: bytes | bytearray) -> int:
     """Return how many more bytes are needed to finish a trailing UTF-8 char.
 
     Used by the input layer to reassemble a multi-byte character whose bytes
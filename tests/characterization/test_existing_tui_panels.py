@@ -153,6 +153,22 @@ def test_panel_manager_show_close_and_toggle_transitions_are_stable() -> None:
     assert manager.is_panel_active() is False
 
 
+def test_panel_manager_close_without_panel_skips_full_redraw() -> None:
+    editor = FakeEditor()
+    manager = PanelManager(editor)  # type: ignore[arg-type]
+
+    manager.close_active_panel()
+
+    assert editor._force_full_redraw is False
+    assert editor.focus == "editor"
+
+    editor.focus = "panel"
+    manager.close_active_panel()
+
+    assert editor._force_full_redraw is True
+    assert editor.focus == "editor"
+
+
 def test_panel_manager_delegates_keys_to_active_panel() -> None:
     editor = FakeEditor()
     manager = PanelManager(editor)  # type: ignore[arg-type]
@@ -0,0 +1,354 @@
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# Project: Ecli
+# File: tests/ui/test_ai_response_panel.py
+#
+# Licensed under the GNU General Public License version 2 only.
+# See the LICENSE file in the project root for full license text.
+
+"""Tests for AiResponsePanel line wrapping."""
+
+from __future__ import annotations
+
+import curses
+from typing import Any
+
+import pytest
+
+from ecli.ui.panels import AiResponsePanel
+
+
+class FakeWindow:
+    def getmaxyx(self) -> tuple[int, int]:
+        return (30, 100)
+
+    def keypad(self, value: bool) -> None:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def fake_curses(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("ecli.ui.panels.curses.newwin", lambda *args: FakeWindow())
+    monkeypatch.setattr("ecli.ui.panels.curses.init_pair", lambda *args: None)
+    monkeypatch.setattr("ecli.ui.panels.curses.color_pair", lambda pair: pair)
+    monkeypatch.setattr(AiResponsePanel, "_colors_initialized", False)
+
+
+def make_panel(content: str) -> AiResponsePanel:
+    editor: Any = type("Editor", (), {"colors": {}})()
+    return AiResponsePanel(FakeWindow(), editor, content=content)
+
+
+def test_wrapped_lines_are_reused_until_lines_or_width_change() -> None:
+    panel = make_panel("alpha beta gamma\n\nshort")
+
+    wrapped = panel._wrap_lines(10)
+
+    assert wrapped == [
+        (0, 0, "alpha beta"),
+        (0, 10, " gamma"),
+        (1, 0, ""),
+        (2, 0, "short"),
+    ]
+    assert panel._wrap_lines(10) is wrapped
+    assert panel._wrap_lines(20) is not wrapped
+
+    panel.lines = ("other",)
+    assert panel._wrap_lines(20) == [(0, 0, "other")]
+
+
+def test_wrap_offsets_index_the_logical_line_and_respect_wide_chars() -> None:
+    panel = make_panel("a  b\tcdefgh\n\u4f60\u597d\u4e16\u754cx")
+
+    wrapped = panel._wrap_lines(4)
+
+    assert wrapped == [
+        (0, 0, "a  b"),
+        (0, 4, "\tcde"),
+        (0, 8, "fgh"),
+        (1, 0, "\u4f60\u597d"),
+        (1, 2, "\u4e16\u754c"),
+        (1, 4, "x"),
+    ]
+    for y, offset, chunk in wrapped:
+        assert panel.lines[y][offset : offset + len(chunk)] == chunk
+
+
+class RecordingWindow(FakeWindow):
+    def __init__(self) -> None:
+        """Initialize the window with an empty draw log."""
+        self.calls: list[tuple[int, int, str, int]] = []
+
+    def addnstr(self, y: int, x: int, text: str, n: int, attr: int) -> None:
+        self.calls.append((y, x, text[:n], attr))
+
+
+def test_text_chunk_is_drawn_in_attribute_runs() -> None:
+    panel = make_panel("# title here\nplain text line")
+    panel.win = RecordingWindow()
+    panel.width = 12
+
+    panel._draw_text_chunk(1, 0, "plain text line", 2)
+
+    assert panel.win.calls == [(2, 1, "plain text", panel.attr_text)]
+
+    panel.win.calls.clear()
+    panel.sel_active = True
+    panel.sel_anchor = (0, 3)
+    panel.cursor_y, panel.cursor_x = 1, 5
+    panel._draw_text_chunk(0, 0, "# title here", 1)
+    panel._draw_text_chunk(1, 0, "plain text line", 2)
+
+    assert panel.win.calls == [
+        (1, 1, "#", panel.attr_title),
+        (1, 2, " t", panel.attr_text),
+        (1, 4, "itle he", panel.attr_sel),
+        (2, 1, "p", panel.attr_sel),
+        (2, 2, "lain", panel.attr_sel),
+        (2, 6, " text", panel.attr_text),
+    ]
+
+
+def test_line_start_attributes_follow_markdown_markers() -> None:
+    panel = make_panel("  # head\n```py\n> quote\n* item\n-nope\nplain")
+
+    attrs = panel._line_start_attrs()
+
+    assert attrs == [
+        panel.attr_title,
+        panel.attr_md,
+        panel.attr_md,
+        panel.attr_md,
+        panel.attr_text,
+        panel.attr_text,
+    ]
+    assert panel._line_start_attrs() is attrs
+    assert panel._get_attr(0, 0, "") == panel.attr_title
+    assert panel._get_attr(0, 1, "") == panel.attr_text
+
+
+def test_visual_cursor_only_scans_the_cursor_line_rows() -> None:
+    panel = make_panel("alpha beta gamma\n\nshort")
+    wrapped = panel._wrap_lines(10)
+
+    assert panel._first_visual_rows == [0, 2, 3, 4]
+
+    panel.cursor_y, panel.cursor_x = 0, 12
+    assert panel._get_visual_cursor(wrapped) == (1, 2)
+    panel.cursor_y, panel.cursor_x = 1, 0
+    assert panel._get_visual_cursor(wrapped) == (2, 0)
+    panel.cursor_y, panel.cursor_x = 2, 5
+    assert panel._get_visual_cursor(wrapped) == (3, 0)
+
+
+def test_line_display_width_is_cached_for_non_ascii_lines(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[str] = []
+
+    def counting_wcswidth(text: str) -> int:
+        calls.append(text)
+        return 2 if text == "你" else 1
+
+    monkeypatch.setattr("ecli.ui.panels.wcswidth", counting_wcswidth)
+    panel = make_panel("plain\n你ab")
+
+    assert panel._wrap_lines(10) == [(0, 0, "plain"), (1, 0, "你ab")]
+    assert panel._wrap_lines(3) == [
+        (0, 0, "pla"),
+        (0, 3, "in"),
+        (1, 0, "你a"),
+        (1, 2, "b"),
+    ]
+    scanned = len(calls)
+    panel._wrap_lines(10)
+
+    assert panel._line_display_width("plain") == 5
+    assert panel._line_display_width("你ab") == 4
+    assert len(calls) == scanned
+
+
+def test_navigation_keys_use_the_shared_move_table() -> None:
+    panel = make_panel("first\nsecond")
+
+    assert panel._handle_navigation_key(curses.KEY_DOWN)
+    assert (panel.cursor_y, panel.sel_active) == (1, False)
+    assert panel._handle_navigation_key(402)
+    assert (panel.cursor_x, panel.sel_active) == (1, True)
+    assert not panel._handle_navigation_key(ord("x"))
+
+
+def test_selection_bounds_are_ordered_and_fixed_while_drawing() -> None:
+    panel = make_panel("first\nsecond")
+    assert panel._selection_bounds() is None
+
+    panel.sel_active = True
+    panel.sel_anchor = (1, 3)
+    panel.cursor_y, panel.cursor_x = 0, 2
+    assert panel._selection_bounds() == (0, 2, 1, 3)
+
+    panel._sel_norm = panel._selection_bounds()
+    panel._sel_norm_frozen = True
+    panel.cursor_y, panel.cursor_x = 1, 5
+    assert panel._selected_columns(1) == (0, 3)
+
+
+class ImmediateThread:
+    def __init__(self, target: Any, args: tuple[Any, ...] = (), **kwargs: Any) -> None:
+        """Record the target so start() can run it synchronously."""
+        self.target = target
+        self.args = args
+
+    def start(self) -> None:
+        self.target(*self.args)
+
+
+def test_copy_selection_slices_only_the_boundary_lines(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    copied: list[str] = []
+    monkeypatch.setattr("ecli.ui.panels.pyperclip.copy", copied.append)
+    monkeypatch.setattr("ecli.ui.panels.threading.Thread", ImmediateThread)
+    panel = make_panel("first\nmiddle\nlast")
+    panel.editor._set_status_message = lambda message: None
+
+    panel.sel_active = True
+    panel.sel_anchor = (2, 2)
+    panel.cursor_y, panel.cursor_x = 0, 3
+    panel._copy_selection()
+    panel.sel_anchor = (1, 1)
+    panel.cursor_y, panel.cursor_x = 1, 4
+    panel._copy_selection()
+
+    assert copied == ["st\nmiddle\nla", "idd"]
+
+
+def test_clipboard_copy_failure_falls_back_on_the_ui_thread(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def failing_copy(text: str) -> None:
+        raise RuntimeError("no clipboard tool")
+
+    monkeypatch.setattr("ecli.ui.panels.pyperclip.copy", failing_copy)
+    panel = make_panel("line")
+    messages: list[str] = []
+    panel.editor._set_status_message = messages.append
+
+    panel._clipboard_copy_worker("line")
+
+    assert panel.editor.internal_clipboard == "line"
+    assert messages == []
+    assert panel.process_queues() is True
+    assert messages == ["Copied selection → internal clipboard"]
+    assert panel.process_queues() is False
+
+
+class AnyWindow(FakeWindow):
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args, **kwargs: None
+
+
+def test_draw_visits_only_the_viewport_rows(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("ecli.ui.panels.curses.curs_set", lambda visibility: None)
+    panel = make_panel("\n".join(f"line {n}" for n in range(10)))
+    panel.win = AnyWindow()
+    panel.height, panel.width = 5, 20
+    panel.visible = True
+    panel.cursor_y = 5
+    drawn: list[tuple[int, int]] = []
+    cursor_rows: list[int] = []
+    panel._draw_text_chunk = lambda y, start_x, chunk, row_y: drawn.append((y, row_y))
+    panel._draw_cursor = lambda row_y, x, chunk: cursor_rows.append(row_y)
+
+    panel.draw()
+
+    assert panel.visual_scroll == 3
+    assert drawn == [(3, 1), (4, 2), (5, 3)]
+    assert cursor_rows == [3]
+
+
+def test_draw_skips_rendering_until_the_panel_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr("ecli.ui.panels.curses.curs_set", lambda visibility: None)
+    panel = make_panel("first\nsecond")
+    panel.win = AnyWindow()
+    panel.height, panel.width = 5, 20
+    panel.visible = True
+    drawn: list[int] = []
+    panel._draw_text_chunk = lambda y, start_x, chunk, row_y: drawn.append(y)
+
+    panel.draw()
+    panel.draw()
+    assert drawn == [0, 1]
+
+    panel._move_cursor(1, 0, shift=False)
+    panel.draw()
+    assert drawn == [0, 1, 0, 1]
+
+
+class ResizableWindow(FakeWindow):
+    def __init__(self, fail: bool = False) -> None:
+        """Initialize the window; ``fail`` makes mvwin raise curses.error."""
+        self.fail = fail
+        self.calls: list[tuple[str, int, int]] = []
+
+    def resize(self, height: int, width: int) -> None:
+        self.calls.append(("resize", height, width))
+
+    def mvwin(self, y: int, x: int) -> None:
+        if self.fail:
+            raise curses.error("off screen")
+        self.calls.append(("mvwin", y, x))
+
+
+def test_resize_reshapes_the_existing_window_in_place() -> None:
+    panel = make_panel("text")
+    window = ResizableWindow()
+    panel.win = window
+
+    panel.resize()
+
+    assert panel.win is window
+    assert window.calls == [
+        ("resize", panel.height, panel.width),
+        ("mvwin", panel.start_y, panel.start_x),
+    ]
+
+    panel.win = ResizableWindow(fail=True)
+    panel.resize()
+    assert isinstance(panel.win, FakeWindow)
+    assert not isinstance(panel.win, ResizableWindow)
+
+
+def test_colors_are_initialized_once_per_process(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pairs: list[int] = []
+    monkeypatch.setattr(AiResponsePanel, "_colors_initialized", False)
+    monkeypatch.setattr(
+        "ecli.ui.panels.curses.init_pair", lambda pair, fg, bg: pairs.append(pair)
+    )
+
+    first = make_panel("one")
+    second = make_panel("two")
+
+    assert pairs == [201, 202, 203, 204, 206]
+    assert second.attr_title == first.attr_title == AiResponsePanel.attr_title
+
+
+def test_color_init_is_retried_after_a_monochrome_fallback(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def no_colors(pair: int, fg: int, bg: int) -> None:
+        raise curses.error("no colors yet")
+
+    monkeypatch.setattr("ecli.ui.panels.curses.init_pair", no_colors)
+    first = make_panel("one")
+    assert first.attr_title == curses.A_BOLD
+    assert AiResponsePanel._colors_initialized is False
+
+    monkeypatch.setattr("ecli.ui.panels.curses.init_pair", lambda *args: None)
+    second = make_panel("two")
+    assert second.attr_title == 202 | curses.A_BOLD
+    assert AiResponsePanel._colors_initialized is True
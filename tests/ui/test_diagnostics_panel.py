@@ -322,8 +322,8 @@ def test_event_queues_are_drained_after_waiting_for_key_before_dispatch() -> Non
         PASTE_EVENT = KeyBinder.PASTE_EVENT
         last_paste = ""
 
-        def get_key_input(self) -> int:
-            return curses.KEY_ENTER
+        def get_key_batch(self) -> list[int]:
+            return [curses.KEY_ENTER]
 
     editor = cast(Any, Ecli.__new__(Ecli))
     editor.keybinder = FakeKeyReader()
@@ -22,15 +22,17 @@ from __future__ import annotations
 
 import curses
 import logging
+import os
 import queue
 import shutil
 import threading
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
 import pytest
 
+from ecli.core.Ecli import Ecli
 from ecli.integrations.GitBridge import GitBridge
 from ecli.ui.panels import FileBrowserPanel, GitPanel
 
@@ -39,10 +41,18 @@ class FakeWindow:
     def __init__(self) -> None:
         """Initialize a fake curses window."""
         self.drawn: list[str] = []
+        self.cleared_rows: list[int] = []
+        self.cursor_row = 0
 
     def getmaxyx(self) -> tuple[int, int]:
         return (30, 120)
 
+    def move(self, y: int, _x: int) -> None:
+        self.cursor_row = y
+
+    def clrtoeol(self) -> None:
+        self.cleared_rows.append(self.cursor_row)
+
     def keypad(self, value: bool) -> None:
         return None
 
@@ -137,6 +147,8 @@ class FakeGitPanel:
         self.async_calls = 0
         self.sync_calls = 0
         self.statuses: dict[str, str] = {}
+        self.file_status_version = 0
+        self.batch_calls = 0
         self._pending: Optional[dict[str, str]] = None
 
     def request_file_status_refresh(self) -> None:
@@ -148,6 +160,10 @@ class FakeGitPanel:
     def get_file_git_status(self, path: str) -> Optional[str]:
         return self.statuses.get(path)
 
+    def get_statuses_for(self, paths: list[str]) -> dict[str, str]:
+        self.batch_calls += 1
+        return {path: self.statuses[path] for path in paths if path in self.statuses}
+
     def queue_result(self, statuses: dict[str, str]) -> None:
         self._pending = statuses
 
@@ -155,6 +171,7 @@ class FakeGitPanel:
         if self._pending is None:
             return False
         self.statuses = self._pending
+        self.file_status_version += 1
         self._pending = None
         return True
 
@@ -165,6 +182,7 @@ def fake_curses(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("ecli.ui.panels.curses.curs_set", lambda value: None)
     monkeypatch.setattr("ecli.ui.panels.curses.init_pair", lambda *args: None)
     monkeypatch.setattr("ecli.ui.panels.curses.color_pair", lambda pair: pair)
+    monkeypatch.setattr(FileBrowserPanel, "_fs_operation", None)
 
 
 def make_browser(
@@ -374,3 +392,586 @@ def test_r_key_triggers_async_refresh(tmp_path: Path) -> None:
     assert panel.handle_key(ord("r")) is True
     assert git_panel.async_calls == 2
     assert git_panel.sync_calls == 0
+
+
+# ---------------------------------------------------------------------------
+# Directory flags are looked up once per listing and drive sort and draw.
+# ---------------------------------------------------------------------------
+def test_listing_caches_directory_flags_in_entry_order(tmp_path: Path) -> None:
+    (tmp_path / "b.txt").write_text("b", encoding="utf-8")
+    (tmp_path / "a_dir").mkdir()
+    (tmp_path / "c_dir").mkdir()
+    git_panel = FakeGitPanel()
+    git_panel.statuses = {str(tmp_path / "a_dir"): "??"}
+    _editor, panel = make_browser(tmp_path, git_panel)
+
+    names = [entry.name for entry in panel.entries]
+    assert names == ["..", "a_dir", "c_dir", "b.txt"]
+    assert [entry.is_dir for entry in panel.entries] == [True, True, True, False]
+    assert [entry.is_parent for entry in panel.entries] == [True, False, False, False]
+
+    panel.open()
+    panel.draw()
+
+    # Directories never show a Git marker, even when Git reports one.
+    assert "?" not in panel.win.drawn
+    assert "a_dir/" in panel.win.drawn
+    assert "b.txt" in panel.win.drawn
+
+
+def test_listing_is_reused_until_directory_changes_or_ttl_expires(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    _editor, panel = make_browser(tmp_path)
+    scans: list[Any] = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path: Any) -> Any:
+        scans.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr("ecli.ui.panels.os.scandir", counting_scandir)
+
+    panel._refresh_entries()
+    assert scans == []
+
+    panel._refresh_entries(force=True)
+    assert len(scans) == 1
+
+    (tmp_path / "b.txt").write_text("b", encoding="utf-8")
+    os.utime(tmp_path, ns=(0, 12345))
+    panel._refresh_entries()
+    assert len(scans) == 2
+    assert [e.name for e in panel.entries if not e.is_parent] == ["a.txt", "b.txt"]
+
+    monkeypatch.setattr("ecli.ui.panels.DIR_CACHE_TTL_SECONDS", 0.0)
+    panel._refresh_entries()
+    assert len(scans) == 3
+
+
+def test_process_queues_picks_up_external_changes_at_a_bounded_rate(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    (tmp_path / "c.txt").write_text("c", encoding="utf-8")
+    _editor, panel = make_browser(tmp_path)
+    panel._select_by_name("c.txt")
+
+    assert panel.process_queues() is False
+
+    (tmp_path / "b.txt").write_text("b", encoding="utf-8")
+    os.utime(tmp_path, ns=(0, 12345))
+    assert panel.process_queues() is False  # re-checked less than 1 s ago
+
+    monkeypatch.setattr("ecli.ui.panels.DIR_RECHECK_SECONDS", 0.0)
+    assert panel.process_queues() is True
+    names = [e.name for e in panel.entries if not e.is_parent]
+    assert names == ["a.txt", "b.txt", "c.txt"]
+    assert panel.entries[panel.idx].name == "c.txt"
+    assert panel.process_queues() is False
+
+
+class ImmediateThread:
+    def __init__(self, target: Any, **kwargs: Any) -> None:
+        """Record the target so start() can run it synchronously."""
+        self.target = target
+
+    def start(self) -> None:
+        self.target()
+
+    def is_alive(self) -> bool:
+        return False
+
+
+def test_copy_and_delete_run_off_thread_and_apply_on_process_queues(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "doc.txt").write_text("doc", encoding="utf-8")
+    (tmp_path / "folder").mkdir()
+    monkeypatch.setattr("ecli.ui.panels.threading.Thread", ImmediateThread)
+    editor, panel = make_browser(tmp_path)
+    panel._prompt = lambda message, initial="": "y"  # type: ignore[method-assign]
+
+    panel._select_by_name("folder")
+    panel._copy_entry()
+    assert (tmp_path / "folder_copy").is_dir()
+    assert editor.status_messages[-1] == "Copying 'folder'..."
+
+    assert panel.process_queues() is True
+    assert panel.entries[panel.idx].name == "folder_copy"
+    assert editor.status_messages[-1] == "Copy finished"
+
+    panel._select_by_name("doc.txt")
+    panel._delete_entry()
+    assert panel.process_queues() is True
+    assert not (tmp_path / "doc.txt").exists()
+    assert "doc.txt" not in [e.name for e in panel.entries if not e.is_parent]
+
+    panel._select_by_name("folder")
+    shutil.rmtree(tmp_path / "folder")
+    panel._delete_entry()
+    assert panel.process_queues() is True
+    assert editor.status_messages[-1].startswith("Delete failed: ")
+
+
+def test_file_operations_are_refused_while_a_copy_or_delete_runs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "doc.txt").write_text("doc", encoding="utf-8")
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_copy(src: str, dst: str) -> None:
+        started.set()
+        release.wait(5)
+        shutil.copyfile(src, dst)
+
+    monkeypatch.setattr("ecli.ui.panels.shutil.copy2", slow_copy)
+    editor, panel = make_browser(tmp_path)
+    panel._prompt = lambda message, initial="": "y"  # type: ignore[method-assign]
+    panel._select_by_name("doc.txt")
+    panel._copy_entry()
+    try:
+        assert started.wait(5)
+        operation = FileBrowserPanel._fs_operation
+        assert operation is not None and not operation.daemon
+        assert FileBrowserPanel.pending_fs_operation() == "Copying 'doc.txt'..."
+
+        prompts: list[str] = []
+
+        def record_prompt(message: str, initial: str = "") -> str:
+            prompts.append(message)
+            return "y"
+
+        panel._prompt = record_prompt  # type: ignore[method-assign]
+        panel._delete_entry()
+        panel._rename_entry()
+        panel._copy_entry()
+        assert prompts == []
+        assert editor.status_messages[-1] == (
+            "Busy: Copying 'doc.txt'... Wait for it to finish."
+        )
+    finally:
+        release.set()
+    FileBrowserPanel.wait_for_fs_operation()
+
+    assert FileBrowserPanel.pending_fs_operation() is None
+    assert panel.process_queues() is True
+    assert (tmp_path / "doc.txt").exists()
+    assert (tmp_path / "doc_copy.txt").read_text(encoding="utf-8") == "doc"
+
+
+def test_exit_waits_for_a_running_file_operation_only_when_confirmed(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    release = threading.Event()
+    operation = threading.Thread(target=release.wait, args=(5,))
+    operation.start()
+    monkeypatch.setattr(FileBrowserPanel, "_fs_operation", operation)
+    monkeypatch.setattr(FileBrowserPanel, "_fs_operation_label", "Deleting 'big'...")
+    editor = cast(Any, Ecli.__new__(Ecli))
+    editor.is_lightweight = False
+    editor.running = True
+    editor.async_engine = None
+    editor.linter_bridge = None
+    editor._set_status_message = lambda _message: None
+    answers = ["n", "y"]
+    prompts: list[str] = []
+    editor.prompt = lambda message: prompts.append(message) or answers.pop(0)
+    try:
+        editor.exit_editor()
+        assert editor.running is True
+        assert editor._exit_in_progress is False
+        assert operation.is_alive()
+
+        threading.Timer(0.05, release.set).start()
+        editor.exit_editor()
+        assert not operation.is_alive()  # joined before exiting
+    finally:
+        release.set()
+        operation.join()
+
+    assert editor.running is False
+    assert prompts == ["Deleting 'big'... still running. Wait and exit? (y/n): "] * 2
+
+
+def test_draw_repaints_only_after_a_visible_change(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    (tmp_path / "b.txt").write_text("b", encoding="utf-8")
+    editor, panel = make_browser(tmp_path)
+    panel.open()
+
+    panel.draw()
+    painted = len(panel.win.drawn)
+    assert painted > 0
+
+    panel.draw()
+    assert len(panel.win.drawn) == painted
+
+    panel.idx = 1
+    panel.draw()
+    assert len(panel.win.drawn) == 2 * painted
+
+    editor.focus = "editor"
+    panel.draw()
+    assert len(panel.win.drawn) == 3 * painted
+
+    assert panel.handle_key(ord("x")) is False  # ignored key: no repaint
+    panel.draw()
+    assert len(panel.win.drawn) == 3 * painted
+
+
+def test_git_markers_are_looked_up_once_per_listing_and_git_update(
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    (tmp_path / "b.txt").write_text("b", encoding="utf-8")
+    git_panel = FakeGitPanel()
+    git_panel.statuses = {str(tmp_path / "a.txt"): "M"}
+    editor, panel = make_browser(tmp_path, git_panel)
+    per_file: list[str] = []
+    git_panel.get_file_git_status = per_file.append  # type: ignore[method-assign]
+    panel.open()
+
+    panel.draw()
+    panel.idx = 2
+    panel.draw()
+    assert git_panel.batch_calls == 1
+    dirty = editor.colors["git_dirty"]
+    assert panel._entry_git_markers()[1:] == [("M", dirty), None]
+
+    git_panel.queue_result({str(tmp_path / "b.txt"): "??"})
+    assert panel.process_queues() is True
+    panel.draw()
+    assert git_panel.batch_calls == 2
+    assert panel._entry_git_markers()[1:] == [None, ("?", panel.attr_dim)]
+    assert per_file == []  # no per-file lookups besides the batched one
+
+
+def test_frame_title_is_measured_once_per_directory_and_width(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _editor, panel = make_browser(tmp_path)
+    measured: list[str] = []
+    monkeypatch.setattr(
+        "ecli.ui.panels.wcswidth", lambda text: measured.append(text) or len(text)
+    )
+    panel.width = 200
+
+    title = panel._frame_title()
+    assert title == f" {tmp_path.resolve()} "
+    assert panel._frame_title() is title
+    assert len(measured) == 2
+
+    panel.width = 12
+    assert panel._frame_title() == " …" + str(tmp_path.resolve())[-5:] + " "
+    assert len(measured) == 4
+
+
+def test_keys_dispatch_through_one_flat_table(tmp_path: Path) -> None:
+    (tmp_path / "a.txt").write_text("a", encoding="utf-8")
+    (tmp_path / "b.txt").write_text("b", encoding="utf-8")
+    _editor, panel = make_browser(tmp_path)
+
+    assert panel._key_table[ord("j")] == panel._select_next
+    assert panel._key_table["\n"] == panel._enter_selected
+    assert panel._key_table[curses.KEY_F5] == panel._copy_entry
+
+    start = panel.idx
+    assert panel.handle_key(ord("j")) is True
+    assert panel.idx == (start + 1) % len(panel.entries)
+    assert panel.handle_key(curses.KEY_UP) is True
+    assert panel.idx == start
+    assert panel.handle_key(ord("x")) is False
+
+
+def test_enter_opens_files_by_their_scandir_path(tmp_path: Path) -> None:
+    target = tmp_path / "notes.txt"
+    target.write_text("x", encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+    editor, panel = make_browser(tmp_path)
+
+    panel._select_by_name("notes.txt")
+    panel._enter_selected()
+    panel._select_by_name("sub")
+    panel._enter_selected()
+
+    assert editor.opened_files == [str(target.resolve())]
+    assert "Opened file: notes.txt" in editor.status_messages
+    assert panel.cwd == (tmp_path / "sub").resolve()
+
+
+class PromptWindow(FakeWindow):
+    """Prompt box double fed from a key script; None marks an idle gap."""
+
+    def __init__(self, keys: list[int | None]) -> None:
+        """Initialize the window with the scripted keys."""
+        super().__init__()
+        self.keys = keys
+        self.delay = True
+        self.refreshes = 0
+        self.writes: list[str] = []
+
+    def addnstr(self, _y: int, _x: int, text: str, n: int, *_args: Any) -> None:
+        self.writes.append(text[:n])
+
+    def move(self, _y: int, x: int) -> None:
+        self.x = x
+
+    def clrtoeol(self) -> None:
+        self.writes.append(f"<clear from {self.x}>")
+
+    def addch(self, *_args: Any) -> None:
+        return None
+
+    def nodelay(self, flag: bool) -> None:
+        self.delay = not flag
+
+    def refresh(self) -> None:
+        self.refreshes += 1
+
+    def getch(self) -> int:
+        key = self.keys.pop(0)
+        if key is None:
+            return -1 if not self.delay else self.getch()
+        return key
+
+
+def test_prompt_refreshes_once_per_input_burst(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _editor, panel = make_browser(tmp_path)
+    box = PromptWindow(
+        [None, ord("a"), ord("b"), ord("c"), None, 127, 127, None, 10]
+    )
+    monkeypatch.setattr("ecli.ui.panels.curses.newwin", lambda *args: box)
+    monkeypatch.setattr("ecli.ui.panels.curses.ACS_VLINE", ord("|"), raising=False)
+
+    assert panel._prompt("Name:", "x") == "xa"
+    assert box.refreshes == 3
+    assert box.writes == [
+        "x",
+        "xa",
+        "xab",
+        "xabc",
+        "xab",
+        "<clear from 5>",
+        "xa",
+        "<clear from 4>",
+    ]
+
+
+def test_git_entry_info_uses_the_prebuilt_style_table(tmp_path: Path) -> None:
+    for name in ("mod.txt", "new.txt", "odd.txt"):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+    git_panel = FakeGitPanel()
+    editor, panel = make_browser(tmp_path, git_panel)
+    git_panel.statuses = {
+        str(tmp_path / "mod.txt"): "M",
+        str(tmp_path / "new.txt"): "??",
+        str(tmp_path / "odd.txt"): "UU",
+    }
+    by_name = {entry.name: entry for entry in panel.entries if not entry.is_parent}
+
+    assert panel._get_git_entry_info(by_name["mod.txt"]) == (
+        "M",
+        editor.colors["git_dirty"],
+    )
+    # No "git_info" colour in this editor: falls back to the dim attribute.
+    assert panel._get_git_entry_info(by_name["new.txt"]) == ("?", panel.attr_dim)
+    assert panel._get_git_entry_info(by_name["odd.txt"]) == (" ", 0)
+
+
+def test_draw_clears_only_the_rows_below_the_listing(tmp_path: Path) -> None:
+    (tmp_path / "only.txt").write_text("x", encoding="utf-8")
+    _editor, panel = make_browser(tmp_path)
+    panel.open()
+    panel.win = FakeWindow()
+
+    panel.draw()
+
+    list_rows = range(2 + len(panel.entries), panel.height - 3)
+    assert panel.win.cleared_rows == list(list_rows)
+    assert "only.txt" in "".join(panel.win.drawn)
+
+
+def test_row_metadata_is_formatted_once_per_listing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "a.txt").write_text("abc", encoding="utf-8")
+    _editor, panel = make_browser(tmp_path)
+    formatted: list[float] = []
+    real_format = FileBrowserPanel._format_mtime
+    monkeypatch.setattr(
+        panel,
+        "_format_mtime",
+        lambda ts: formatted.append(ts) or real_format(ts),
+    )
+    index = next(i for i, e in enumerate(panel.entries) if e.name == "a.txt")
+
+    name, size, _mtime = panel._entry_meta_at(index)
+    assert (name, size) == ("a.txt", "3B")
+    assert panel._entry_meta_at(index) is panel._entry_meta_at(index)
+    assert len(formatted) == 1
+
+    panel._refresh_entries(force=True)
+    panel._entry_meta_at(index)
+    assert len(formatted) == 2
+
+
+def test_listing_puts_directories_first_then_sorts_case_insensitively(
+    tmp_path: Path,
+) -> None:
+    for name in ("b.txt", "A.txt", "c.txt"):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+    for name in ("zeta", "Alpha"):
+        (tmp_path / name).mkdir()
+    _editor, panel = make_browser(tmp_path)
+
+    names = [entry.name for entry in panel.entries if not entry.is_parent]
+
+    assert names == ["Alpha", "zeta", "A.txt", "b.txt", "c.txt"]
+    assert [e.is_dir for e in panel.entries[-5:]] == [True, True, False, False, False]
+
+
+def test_editor_callbacks_are_resolved_once_into_the_key_table(
+    tmp_path: Path,
+) -> None:
+    editor, panel = make_browser(tmp_path)
+
+    assert panel._key_table[17] == editor.exit_editor
+    assert panel._key_table[27] == editor.toggle_file_browser
+    assert panel.handle_key(27) is True
+    assert editor.toggle_calls == 1
+
+    no_exit = type("NoExitEditor", (FakeEditor,), {"exit_editor": None})()
+    bare = FileBrowserPanel(no_exit.stdscr, no_exit, start_path=str(tmp_path))  # type: ignore[arg-type]
+    assert bare._key_table[17] == bare._ignore_key
+    assert bare.handle_key(17) is True
+
+
+def test_action_bar_layout_is_measured_once_per_width(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _editor, panel = make_browser(tmp_path)
+    measured: list[str] = []
+    monkeypatch.setattr(
+        "ecli.ui.panels.wcswidth", lambda text: measured.append(text) or len(text)
+    )
+
+    layout = panel._action_bar_layout(20)
+    assert layout == [(1, "F2", " New "), (8, "F3", " Dir ")]
+    assert panel._action_bar_layout(20) is layout
+    calls = len(measured)
+
+    assert len(panel._action_bar_layout(200)) == len(FileBrowserPanel._ACTION_HINTS)
+    assert len(measured) > calls
+
+
+class FakeObserver:
+    """watchdog Observer double that records the watched paths."""
+
+    instances: list[FakeObserver] = []
+
+    def __init__(self) -> None:
+        """Initialize an unscheduled, stopped observer."""
+        self.handler: Any = None
+        self.path = ""
+        self.running = False
+        self.joined = False
+        FakeObserver.instances.append(self)
+
+    def schedule(self, handler: Any, path: str, recursive: bool = False) -> None:
+        assert recursive is False
+        self.handler, self.path = handler, path
+
+    def start(self) -> None:
+        self.running = True
+
+    def stop(self) -> None:
+        self.running = False
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        assert not self.running and timeout is not None
+        self.joined = True
+
+
+class FsEvent:
+    """Minimal watchdog event: only the fields the handler reads."""
+
+    def __init__(self, event_type: str, src_path: str) -> None:
+        """Initialize the event."""
+        self.event_type = event_type
+        self.src_path = src_path
+
+
+def test_directory_watcher_replaces_polling_and_follows_cwd(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("ecli.ui.panels.Observer", FakeObserver)
+    monkeypatch.setattr(FakeObserver, "instances", [])
+    (tmp_path / "sub").mkdir()
+    _editor, panel = make_browser(tmp_path)
+    assert FakeObserver.instances == []
+
+    panel.open()
+    (first,) = FakeObserver.instances
+    assert (first.path, first.running) == (str(tmp_path.resolve()), True)
+
+    (tmp_path / "new.txt").write_text("x", encoding="utf-8")
+    panel._cwd_checked_at = 0.0
+    assert panel.process_queues() is False  # no event yet, and no polling
+    watched = str(tmp_path.resolve())
+    first.handler.dispatch(FsEvent("opened", str(tmp_path / "new.txt")))
+    first.handler.dispatch(FsEvent("closed_no_write", str(tmp_path / "new.txt")))
+    first.handler.dispatch(FsEvent("modified", watched))
+    assert panel.process_queues() is False  # reads and the dir itself are ignored
+    first.handler.dispatch(FsEvent("created", str(tmp_path / "new.txt")))
+    assert panel.process_queues() is True
+    assert "new.txt" in [e.name for e in panel.entries if not e.is_parent]
+
+    panel._select_by_name("sub")
+    panel._enter_selected()
+    second = FakeObserver.instances[-1]
+    assert (first.running, first.joined) == (False, True)
+    assert second.path == str((tmp_path / "sub").resolve())
+
+    # A late event from the stopped observer no longer reaches the panel.
+    first.handler.dispatch(FsEvent("created", str(tmp_path / "late.txt")))
+    assert panel.process_queues() is False
+
+    panel.close()
+    assert (second.running, second.joined) == (False, True)
+
+
+def test_reopening_quickly_reuses_the_git_status_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    git_panel = FakeGitPanel()
+    _editor, panel = make_browser(tmp_path, git_panel)
+    clock = iter([100.0, 100.5, 101.2])
+    monkeypatch.setattr("ecli.ui.panels.time.monotonic", lambda: next(clock))
+
+    panel.open()
+    panel.close()
+    panel.open()
+    assert git_panel.async_calls == 1
+
+    panel.close()
+    panel.open()
+    assert git_panel.async_calls == 2
+    assert git_panel.sync_calls == 0
+
+
+def test_rename_moves_the_entry_and_selects_the_new_name(tmp_path: Path) -> None:
+    (tmp_path / "old.txt").write_text("x", encoding="utf-8")
+    _editor, panel = make_browser(tmp_path)
+    panel._select_by_name("old.txt")
+    panel._prompt = lambda message, initial="": "new.txt"  # type: ignore[method-assign]
+
+    panel._rename_entry()
+
+    assert not (tmp_path / "old.txt").exists()
+    assert (tmp_path / "new.txt").read_text(encoding="utf-8") == "x"
+    assert panel.entries[panel.idx].name == "new.txt"
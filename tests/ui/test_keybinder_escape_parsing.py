@@ -0,0 +1,537 @@
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# Project: Ecli
+# File: tests/ui/test_keybinder_escape_parsing.py
+#
+# Licensed under the GNU General Public License version 2 only.
+# See the LICENSE file in the project root for full license text.
+
+"""Tests for KeyBinder ESC/Alt input decoding on the keypress hot path."""
+
+from __future__ import annotations
+
+import curses
+import logging
+import sys
+import threading
+from typing import Any
+
+import pytest
+
+from ecli.ui.KeyBinder import KeyBinder
+
+
+class FakeHistory:
+    def undo(self) -> bool:
+        return True
+
+    def redo(self) -> bool:
+        return True
+
+
+class ScriptedWindow:
+    """Curses window double that replays a fixed getch() byte script."""
+
+    def __init__(self, script: list[int] | None = None) -> None:
+        """Initialize the window with the bytes getch() will return."""
+        self.script = list(script or [])
+        self.pushed_back: list[int] = []
+
+    def getmaxyx(self) -> tuple[int, int]:
+        return (30, 100)
+
+    def getch(self) -> int:
+        if self.script:
+            return self.script.pop(0)
+        return curses.ERR
+
+    def nodelay(self, flag: bool) -> None:
+        return None
+
+    def timeout(self, delay: int) -> None:
+        return None
+
+
+class FakeEditor:
+    """Editor double whose unknown actions resolve to no-op handlers."""
+
+    def __init__(self) -> None:
+        """Initialize a non-interactive editor double for KeyBinder tests."""
+        self.history = FakeHistory()
+        self.config: dict[str, Any] = {}
+        self.stdscr = ScriptedWindow()
+        self.is_lightweight = True
+        self.linter_bridge = None
+        self.async_engine = None
+        self.status_message = "Ready"
+        self._lexer = None
+        self._state_lock = threading.RLock()
+        self.inserted: list[str] = []
+
+    def __getattr__(self, name: str) -> Any:
+        def _handler(*_args: Any) -> bool:
+            return True
+
+        _handler.__name__ = name
+        return _handler
+
+    def _set_status_message(self, message: str) -> None:
+        self.status_message = message
+
+    def insert_text(self, text: str) -> bool:
+        self.inserted.append(text)
+        return True
+
+
+def make_keybinder() -> KeyBinder:
+    binder = KeyBinder(FakeEditor())  # type: ignore[arg-type]
+    binder._startup_guard_active = False
+    return binder
+
+
+def read_key(script: list[int]) -> int | str:
+    return make_keybinder().get_key_input(ScriptedWindow(script))  # type: ignore[arg-type]
+
+
+def test_esc_followed_by_ascii_letter_is_alt_chord() -> None:
+    assert read_key([27, ord("x")]) == "alt-x"
+    assert read_key([27, ord("X")]) == "alt-x"
+    assert read_key([27, ord("[")]) == "alt-["
+
+
+def test_lone_esc_is_returned_as_27() -> None:
+    assert read_key([27]) == 27
+
+
+def test_decode_keystring_modifier_specs() -> None:
+    binder = make_keybinder()
+
+    assert binder._decode_keystring("ctrl+s") == 19
+    assert binder._decode_keystring(" Ctrl + Shift + Z ") == 26
+    assert binder._decode_keystring("shift+a") == ord("A")
+    assert binder._decode_keystring("alt+x") == "alt-x"
+    assert binder._decode_keystring("shift+ctrl+alt+x") == "alt-ctrl+shift+x"
+    assert binder._decode_keystring("shift+left") == curses.KEY_SLEFT
+
+
+def test_decode_keystring_rejects_unknown_modifier() -> None:
+    binder = make_keybinder()
+
+    with pytest.raises(ValueError):
+        binder._decode_keystring("meta+x")
+
+
+def test_escape_read_restores_main_loop_timeout_without_nodelay() -> None:
+    calls: list[tuple[str, Any]] = []
+
+    class RecordingWindow(ScriptedWindow):
+        def nodelay(self, flag: bool) -> None:
+            calls.append(("nodelay", flag))
+
+        def timeout(self, delay: int) -> None:
+            calls.append(("timeout", delay))
+
+    binder = make_keybinder()
+    assert binder.get_key_input(RecordingWindow([27, ord("q")])) == "alt-q"  # type: ignore[arg-type]
+
+    assert calls == [("timeout", 0), ("timeout", 35)]
+
+    calls.clear()
+    binder.get_key_input(RecordingWindow([ord("a"), ord("b")]))  # type: ignore[arg-type]
+
+    assert calls == [("timeout", 0), ("timeout", 35)]
+    assert binder.last_paste == "ab"
+
+
+def test_action_map_is_read_only_and_reassignment_rebinds_dispatch() -> None:
+    binder = make_keybinder()
+
+    with pytest.raises(TypeError):
+        binder.action_map["boom"] = lambda: True  # type: ignore[index]
+
+    calls: list[str] = []
+
+    def boom() -> bool:
+        calls.append("boom")
+        return True
+
+    binder.action_map = {"boom": boom}
+
+    assert binder.handle_input("boom") is True
+    assert calls == ["boom"]
+
+
+def test_int_keys_dispatch_through_table_and_dict_fallback() -> None:
+    binder = make_keybinder()
+    calls: list[int] = []
+
+    def record(code: int) -> Any:
+        def _handler() -> bool:
+            calls.append(code)
+            return True
+
+        _handler.__name__ = f"record_{code}"
+        return _handler
+
+    binder.action_map = {19: record(19), -5: record(-5), 70000: record(70000)}
+
+    assert len(binder._int_table) == 20
+    for code in (19, -5, 70000):
+        assert binder.handle_input(code) is True
+    assert calls == [19, -5, 70000]
+
+
+def test_alt_chords_and_string_bindings_are_interned() -> None:
+    binder = make_keybinder()
+    chord = binder.get_key_input(ScriptedWindow([27, ord("z")]))  # type: ignore[arg-type]
+
+    assert chord is sys.intern("alt-z")
+    assert all(
+        key is sys.intern(key) for key in binder.action_map if isinstance(key, str)
+    )
+    accented = binder.get_key_input(ScriptedWindow([27, 0xE9]))  # type: ignore[arg-type]
+    assert accented is sys.intern("alt-\u00e9")
+
+    action_name = "".join(["save", "_file"])
+    binder.keybindings = {action_name: [19]}
+    assert next(iter(binder._sorted_keys)) is sys.intern("save_file")
+
+
+def test_binding_membership_uses_sorted_bindings() -> None:
+    binder = make_keybinder()
+    binder.keybindings = {"save_file": ["ctrl+s", 19, "alt-s", 403], "quit": [17]}
+
+    assert binder.is_key_for_action(19, "save_file") is True
+    assert binder.is_key_for_action("alt-s", "save_file") is True
+    assert binder.is_key_for_action(17, "save_file") is False
+    assert binder.is_key_for_action(19, "missing") is False
+    assert binder.lookup("ctrl+q") == "quit"
+    assert binder.lookup("alt+s") == "save_file"
+    assert binder.lookup("f5") is None
+
+
+def test_invalid_binding_entries_are_dropped_once_at_assignment(caplog: Any) -> None:
+    binder = make_keybinder()
+
+    with caplog.at_level(logging.ERROR):
+        binder.keybindings = {"save_file": [19, 1.5, None, "alt-s"]}  # type: ignore[list-item]
+
+    assert binder._kb_keys == [19, "alt-s"]
+    assert binder._sorted_keys["save_file"] == ((False, 19), (True, "alt-s"))
+    assert caplog.text.count("Invalid key code") == 2
+
+
+def test_lookup_prefers_first_action_and_follows_rebinding() -> None:
+    binder = make_keybinder()
+    binder.keybindings = {"open_file": [15, 19], "save_file": [19]}
+
+    assert binder.lookup(19) == "open_file"
+    assert binder.lookup(True) is None  # type: ignore[arg-type]
+
+    binder.keybindings = {"save_file": [19]}
+
+    assert binder.lookup("ctrl+s") == "save_file"
+    assert binder.lookup(15) is None
+
+
+def test_keybindings_are_flattened_to_action_slots() -> None:
+    binder = make_keybinder()
+    binder.keybindings = {"save_file": [19, "alt-s"], "not_an_action": [5]}
+
+    slot = KeyBinder._ACTION_INDEX["save_file"]
+    assert binder._kb_keys == [19, "alt-s"]
+    assert binder._kb_slots == [slot]
+    assert binder._kb_bounds == [0, 2]
+    assert binder._kb_unknown_actions == ["not_an_action"]
+    assert KeyBinder._ACTION_NAMES[slot] == "save_file"
+
+
+def test_keybindings_are_read_only_outside_the_setter() -> None:
+    binder = make_keybinder()
+    binder.keybindings = {"save_file": [19, None]}  # type: ignore[list-item]
+
+    assert binder.keybindings == {"save_file": [19]}
+    with pytest.raises(TypeError):
+        binder.keybindings["save_file"] = [1]  # type: ignore[index]
+    assert binder.lookup(19) == "save_file"
+
+
+def test_action_methods_are_bound_once_per_editor_mode() -> None:
+    binder = make_keybinder()
+    lightweight = binder._action_methods()
+
+    assert binder._action_methods() is lightweight
+    assert "lint" not in lightweight
+
+    binder.editor.is_lightweight = False
+    binder.editor.linter_bridge = object()
+    full = binder._action_methods()
+
+    assert full is not lightweight
+    assert full["lint"].__name__ == "toggle_diagnostics_panel"
+    assert "toggle_widget_panel" not in full
+    assert binder._setup_action_map()[curses.KEY_UP].__name__ == "handle_up"
+
+
+def test_action_map_build_warns_on_colliding_bindings(caplog: Any) -> None:
+    binder = make_keybinder()
+    binder.keybindings = {"open_file": [15, 19], "save_file": [19, "alt-s"]}
+
+    with caplog.at_level(logging.WARNING):
+        action_map = binder._setup_action_map()
+
+    assert action_map[15].__name__ == "open_file"
+    assert action_map[19].__name__ == "save_file"
+    assert action_map["alt-s"].__name__ == "save_file"
+    assert "(key: 19) is overwriting" in caplog.text
+
+
+def test_actions_sharing_a_method_do_not_warn_on_shared_keys(caplog: Any) -> None:
+    binder = make_keybinder()
+    binder.editor.is_lightweight = False
+    binder.editor.async_engine = object()
+    binder.keybindings = {
+        "request_ai_explanation": [500],
+        "toggle_widget_panel": [500],
+        "handle_up": [curses.KEY_UP],
+    }
+
+    with caplog.at_level(logging.WARNING):
+        action_map = binder._setup_action_map()
+
+    assert action_map[500].__name__ == "toggle_widget_panel"
+    assert "overwriting" not in caplog.text
+
+
+def test_escape_dfa_resolves_sequences_and_stops_at_leaf() -> None:
+    binder = make_keybinder()
+    window = ScriptedWindow([27, *b"[1;5C", ord("a")])
+
+    assert binder.get_key_input(window) == curses.KEY_RIGHT  # type: ignore[arg-type]
+    assert window.script == [ord("a")]
+    assert read_key([27, *b"OA"]) == curses.KEY_UP
+    assert read_key([27, *b"[24~"]) == curses.KEY_F12
+
+
+def test_escape_dfa_dead_end_falls_back_to_tolerant_paths() -> None:
+    binder = make_keybinder()
+
+    assert read_key([27, ord("O")]) == "alt-o"
+    assert read_key([27, 27, *b"[B"]) == curses.KEY_DOWN
+    assert read_key([27, *b"[99Z"]) == 27
+    assert read_key([27, *b"[ \x7fA"]) == curses.KEY_UP  # noise bytes stripped
+    paste = ScriptedWindow([27, *b"[200~hi", 27, *b"[201~"])
+    assert binder.get_key_input(paste) == binder.PASTE_EVENT  # type: ignore[arg-type]
+    assert binder.last_paste == "hi"
+
+
+def test_bracketed_paste_stops_reading_at_end_marker() -> None:
+    binder = make_keybinder()
+    window = ScriptedWindow([*"a~\u2192".encode(), 27, *b"[201~", ord("x")])
+
+    assert binder._read_bracketed_paste(window, b"[") == "[a~\u2192"
+    assert window.script == [ord("x")]
+
+
+def test_key_batch_collects_queued_keys_and_stops_after_paste(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    binder = make_keybinder()
+    window = ScriptedWindow([curses.KEY_UP, 27, *b"[B", curses.KEY_LEFT])
+
+    assert binder.get_key_batch(window) == [  # type: ignore[arg-type]
+        curses.KEY_UP,
+        curses.KEY_DOWN,
+        curses.KEY_LEFT,
+    ]
+    assert binder.get_key_batch(window) == [curses.ERR]  # type: ignore[arg-type]
+
+    window = ScriptedWindow([curses.KEY_UP, *b"hi", 9, curses.KEY_DOWN])
+    monkeypatch.setattr(
+        "ecli.ui.KeyBinder._ungetch", lambda key: window.script.insert(0, key)
+    )
+    assert binder.get_key_batch(window) == [  # type: ignore[arg-type]
+        curses.KEY_UP,
+        binder.PASTE_EVENT,
+    ]
+    assert binder.last_paste == "hi\t"
+    assert binder.get_key_batch(window, max_batch=1) == [curses.KEY_DOWN]  # type: ignore[arg-type]
+
+
+def test_key_batch_sets_the_drain_timeout_once() -> None:
+    delays: list[int] = []
+
+    class RecordingWindow(ScriptedWindow):
+        def timeout(self, delay: int) -> None:
+            delays.append(delay)
+
+    binder = make_keybinder()
+    window = RecordingWindow([curses.KEY_UP] * 4)
+
+    assert binder.get_key_batch(window) == [curses.KEY_UP] * 4  # type: ignore[arg-type]
+    assert delays == [0, 35]
+
+    delays.clear()
+    window.script = [curses.KEY_UP, 27, *b"[B", curses.KEY_LEFT]
+    assert binder.get_key_batch(window) == [  # type: ignore[arg-type]
+        curses.KEY_UP,
+        curses.KEY_DOWN,
+        curses.KEY_LEFT,
+    ]
+    assert delays == [0, 0, 35, 0, 35]  # ESC decoding restores, batch re-arms
+
+
+def test_unknown_escape_is_logged_once_at_debug(caplog: Any) -> None:
+    binder = make_keybinder()
+
+    with caplog.at_level(logging.DEBUG):
+        for _ in range(3):
+            assert binder.get_key_input(ScriptedWindow([27, *b"[I"])) == 27  # type: ignore[arg-type]
+
+    records = [r for r in caplog.records if "unknown escape" in r.getMessage()]
+    assert [r.levelno for r in records] == [logging.DEBUG]
+
+
+def test_decode_keystring_is_memoized_and_still_validates_types() -> None:
+    from ecli.ui.KeyBinder import _parse_key_string
+
+    _parse_key_string.cache_clear()
+    assert KeyBinder._decode_keystring("ctrl+s") == 19
+    assert KeyBinder._decode_keystring("ctrl+s") == 19
+    assert _parse_key_string.cache_info().hits == 1
+    assert KeyBinder._decode_keystring(42) == 42
+
+    with pytest.raises(ValueError):
+        KeyBinder._decode_keystring(["ctrl+s"])  # type: ignore[arg-type]
+
+
+def test_printable_input_inserts_ascii_and_wide_chars_but_not_controls() -> None:
+    binder = make_keybinder()
+    editor = binder.editor
+
+    assert binder._handle_printable_character(ord("a")) is True
+    assert binder._handle_printable_character("~") is True
+    assert binder._handle_printable_character(0x4E2D) is True
+    assert binder._handle_printable_character("\u200b") is False
+    assert binder._handle_printable_character(0x7F) is False
+    assert editor.inserted == ["a", "~", "中"]  # type: ignore[attr-defined]
+
+
+def test_parsed_keybindings_are_cached_per_user_config() -> None:
+    KeyBinder.clear_keybinding_cache()
+    first = make_keybinder()
+    assert len(KeyBinder._parsed_cache) == 1
+
+    first.keybindings["help"].append(999)
+    second = make_keybinder()
+
+    assert 999 not in second.keybindings["help"]
+    assert second.keybindings == make_keybinder().keybindings
+
+    editor = FakeEditor()
+    editor.config = {"keybindings": {"help": ["f2"]}}
+    custom = KeyBinder(editor)  # type: ignore[arg-type]
+    assert custom.keybindings["help"] == [curses.KEY_F2]
+    assert len(KeyBinder._parsed_cache) == 2
+
+
+def test_configured_specs_accept_lists_alternatives_and_single_values() -> None:
+    editor = FakeEditor()
+    editor.config = {
+        "keybindings": {"help": "f2 | ctrl+h", "find": ["f3", 0], "quit": 17}
+    }
+    binder = KeyBinder(editor)  # type: ignore[arg-type]
+
+    assert binder.keybindings["help"] == [curses.KEY_F2, 8]
+    assert binder.keybindings["find"] == [curses.KEY_F3, 0]
+    assert binder.keybindings["quit"] == [17]
+
+
+def test_escape_map_is_frozen_with_interned_names() -> None:
+    with pytest.raises(TypeError):
+        KeyBinder.ESCAPE_SEQUENCE_MAP[b"[Z"] = "shift+tab"  # type: ignore[index]
+
+    assert KeyBinder.ESCAPE_SEQUENCE_MAP[b"[1;2A"] is sys.intern("shift+up")
+    assert KeyBinder._decode_keystring("Ctrl+Alt+X") is sys.intern("alt-ctrl+x")
+
+
+def test_only_action_dispatch_holds_the_state_lock() -> None:
+    binder = make_keybinder()
+    editor = binder.editor
+    lock_held: list[bool] = []
+
+    def probe() -> bool:
+        lock_held.append(editor._state_lock._is_owned())  # type: ignore[attr-defined]
+        return True
+
+    def insert_text(text: str) -> bool:
+        lock_held.append(editor._state_lock._is_owned())  # type: ignore[attr-defined]
+        return True
+
+    binder.action_map = {"probe": probe}
+    editor.insert_text = insert_text  # type: ignore[method-assign]
+
+    binder.handle_input("probe")
+    binder.handle_input("a")
+
+    assert lock_held == [True, False]
+
+
+def test_escape_dfa_accepts_exactly_the_escape_map() -> None:
+    dfa = KeyBinder._ESC_DFA
+    accepted: dict[bytes, int | str] = {}
+    pending = [(0, b"")]
+    while pending:
+        state, prefix = pending.pop()
+        transitions, terminal = dfa[state]
+        if terminal is not None:
+            accepted[prefix] = terminal
+        pending.extend((nxt, prefix + bytes([byte])) for byte, nxt in transitions.items())
+
+    assert accepted == {
+        seq: KeyBinder._decode_keystring(name)
+        for seq, name in KeyBinder.ESCAPE_SEQUENCE_MAP.items()
+    }
+
+
+def test_debug_tty_input_reports_key_details() -> None:
+    binder = make_keybinder()
+    editor = binder.editor
+    messages: list[str] = []
+    editor._set_status_message = messages.append  # type: ignore[method-assign]
+    keys = [ord("A"), "é", 27]
+
+    class WideCharWindow(ScriptedWindow):
+        def get_wch(self) -> int | str:
+            return keys.pop(0)
+
+    binder.debug_tty_input(WideCharWindow())  # type: ignore[arg-type]
+
+    assert messages[1] == "Key: 65 (type: int) decimal: 65 char: 'A'"
+    assert messages[2] == "Key: 'é' (type: str) ord: 233"
+    assert messages[-1] == "TTY Debug Mode ended"
+
+
+def test_repeated_unhandled_key_does_not_report_a_visual_change() -> None:
+    binder = make_keybinder()
+    binder.action_map = {}
+
+    assert binder.handle_input(0x7F) is True
+    assert binder.editor.status_message == "Ignored unhandled input: 127"
+    assert binder.handle_input(0x7F) is False
+
+
+def test_ctrl_punctuation_specs_map_to_control_codes() -> None:
+    decode = KeyBinder._decode_keystring
+
+    assert [decode(f"ctrl+{c}") for c in "#/\\[]"] == [51, 31, 28, 27, 29]
+    assert decode("ctrl+z") == 26
+    assert decode("ctrl+f5") == curses.KEY_F5
+
+
+def test_keybinder_instances_use_slots() -> None:
+    binder = make_keybinder()
+
+    assert not hasattr(binder, "__dict__")
+    with pytest.raises(AttributeError):
+        binder.unexpected_attribute = True  # type: ignore[attr-defined]
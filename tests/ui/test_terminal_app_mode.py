@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: GPL-2.0-only
+#
+# Project: Ecli
+# File: tests/ui/test_terminal_app_mode.py
+#
+# Licensed under the GNU General Public License version 2 only.
+# See the LICENSE file in the project root for full license text.
+
+"""Tests for terminfo capability handling in TerminalAppMode."""
+
+from __future__ import annotations
+
+import pytest
+
+from ecli.ui import TerminalAppMode as mode_module
+
+
+def test_capabilities_are_looked_up_once_and_emitted_as_bytes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    lookups: list[str] = []
+    emitted: list[bytes] = []
+
+    def fake_tigetstr(capname: str) -> bytes | None:
+        lookups.append(capname)
+        return None if capname == "rmkx" else f"<{capname}>".encode()
+
+    monkeypatch.setattr(mode_module, "tigetstr", fake_tigetstr)
+    monkeypatch.setattr(mode_module, "putp", emitted.append)
+    monkeypatch.setattr(mode_module, "_CAPS", {})
+
+    term_mode = mode_module.TerminalAppMode()
+    for capname in ("smcup", "rmkx", "smcup", "rmkx"):
+        term_mode._tputs(capname)
+
+    assert lookups == ["smcup", "rmkx"]
+    assert emitted == [b"<smcup>", b"<smcup>"]